@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Admission Control
+Bounds how many /parse-resume requests are parsed at once in a server
+process, so an upload burst queues instead of starting pdfplumber work for
+every request and exhausting memory.
+
+Capacity is counted in slots and each request takes slots in proportion to
+its size (one per ADMISSION_SLOT_MB, at least one), so a handful of large
+PDFs fill the process just as many small ones do. Requests that do not fit
+wait in a FIFO queue; a request at the head is never overtaken by smaller
+ones behind it, so large files are not starved. A full queue is refused at
+once (429) and a request that waits longer than the queue timeout gives up
+(503), both with a Retry-After estimated from recent parse times.
+
+Limits are per process: under gunicorn each worker has its own slots.
+"""
+
+import os
+import math
+import time
+import threading
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Deque, Dict, Iterator
+
+from metrics import ADMISSION_REJECTIONS, ADMISSION_WAIT_SECONDS
+
+# Parse time assumed before any request has finished
+INITIAL_HOLD_SECONDS = 1.0
+# Share of the newest parse time in the running average
+HOLD_SMOOTHING = 0.2
+MAX_RETRY_AFTER = 60
+
+
+class AdmissionRejected(Exception):
+    """Raised when a request is not admitted; carries the HTTP status and Retry-After seconds."""
+
+    def __init__(self, message: str, status: int, retry_after: int):
+        super().__init__(message)
+        self.status = status
+        self.retry_after = retry_after
+
+
+class _Waiter:
+    """One queued request."""
+
+    __slots__ = ('weight', 'granted')
+
+    def __init__(self, weight: int):
+        self.weight = weight
+        self.granted = threading.Event()
+
+
+class AdmissionController:
+    """
+    Weighted concurrency limit with a bounded FIFO wait queue.
+    """
+
+    def __init__(self, max_slots: int = 4, max_queue: int = 16, queue_timeout: float = 10.0,
+                 slot_bytes: int = 2 * 1024 * 1024):
+        """
+        Args:
+            max_slots (int): Slots available to requests being parsed
+            max_queue (int): Requests allowed to wait; more are refused with 429
+            queue_timeout (float): Seconds a request may wait before it is refused with 503
+            slot_bytes (int): Upload bytes per slot; a request takes ceil(size / slot_bytes)
+                slots, at least one and at most max_slots
+        """
+        self.max_slots = max(1, max_slots)
+        self.max_queue = max(0, max_queue)
+        self.queue_timeout = queue_timeout
+        self.slot_bytes = max(1, slot_bytes)
+
+        self._lock = threading.Lock()
+        self._waiters: Deque[_Waiter] = deque()
+        self._in_use = 0
+        self._in_flight = 0
+        self._hold_seconds = INITIAL_HOLD_SECONDS
+
+        self.admitted = 0
+        self.queued = 0
+        self.rejected_full = 0
+        self.rejected_timeout = 0
+
+    @classmethod
+    def from_env(cls) -> "AdmissionController":
+        """Build a controller configured from the ADMISSION_* environment variables."""
+        return cls(
+            max_slots=int(os.environ.get('ADMISSION_SLOTS', 4)),
+            max_queue=int(os.environ.get('ADMISSION_QUEUE', 16)),
+            queue_timeout=float(os.environ.get('ADMISSION_TIMEOUT', 10)),
+            slot_bytes=int(float(os.environ.get('ADMISSION_SLOT_MB', 2)) * 1024 * 1024)
+        )
+
+    def weight(self, size: int) -> int:
+        """Slots a request with an upload of `size` bytes takes."""
+        return min(self.max_slots, max(1, math.ceil(size / self.slot_bytes)))
+
+    @contextmanager
+    def admit(self, size: int) -> Iterator[int]:
+        """
+        Hold slots for the duration of a parse: `with admission.admit(len(file_data)): ...`
+
+        Args:
+            size (int): Upload size in bytes
+
+        Yields:
+            int: Slots held
+
+        Raises:
+            AdmissionRejected: If the wait queue is full (429) or the queue timeout passes (503)
+        """
+        weight = self.weight(size)
+        self._acquire(weight)
+        started = time.perf_counter()
+        try:
+            yield weight
+        finally:
+            self._release(weight, time.perf_counter() - started)
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters reported on /health."""
+        with self._lock:
+            return {
+                "max_slots": self.max_slots,
+                "slots_in_use": self._in_use,
+                "in_flight": self._in_flight,
+                "queue_depth": len(self._waiters),
+                "queued_slots": sum(waiter.weight for waiter in self._waiters),
+                "max_queue": self.max_queue,
+                "queue_timeout": self.queue_timeout,
+                "slot_bytes": self.slot_bytes,
+                "admitted": self.admitted,
+                "queued": self.queued,
+                "rejected_queue_full": self.rejected_full,
+                "rejected_timeout": self.rejected_timeout,
+                "retry_after": self._retry_after()
+            }
+
+    def _acquire(self, weight: int) -> None:
+        """Take slots now, or wait in line for them."""
+        with self._lock:
+            if not self._waiters and self._in_use + weight <= self.max_slots:
+                self._take(weight)
+                ADMISSION_WAIT_SECONDS.observe(0.0)
+                return
+            if len(self._waiters) >= self.max_queue:
+                self.rejected_full += 1
+                ADMISSION_REJECTIONS.inc(reason='queue_full')
+                raise AdmissionRejected(f"Too many requests: {len(self._waiters)} already waiting",
+                                        429, self._retry_after())
+            waiter = _Waiter(weight)
+            self._waiters.append(waiter)
+            self.queued += 1
+
+        started = time.perf_counter()
+        granted = waiter.granted.wait(self.queue_timeout)
+        ADMISSION_WAIT_SECONDS.observe(time.perf_counter() - started)
+        if granted:
+            return
+
+        with self._lock:
+            if waiter.granted.is_set():
+                # Granted between the timeout and taking the lock
+                return
+            self._waiters.remove(waiter)
+            # A large request leaving the head may let smaller ones behind it in
+            self._grant()
+            self.rejected_timeout += 1
+            ADMISSION_REJECTIONS.inc(reason='timeout')
+            raise AdmissionRejected(f"Server busy: not admitted within {self.queue_timeout:g}s",
+                                    503, self._retry_after())
+
+    def _release(self, weight: int, held: float) -> None:
+        with self._lock:
+            self._in_use -= weight
+            self._in_flight -= 1
+            self._hold_seconds += HOLD_SMOOTHING * (held - self._hold_seconds)
+            self._grant()
+
+    def _take(self, weight: int) -> None:
+        """Admit a request. Caller holds the lock."""
+        self._in_use += weight
+        self._in_flight += 1
+        self.admitted += 1
+
+    def _grant(self) -> None:
+        """Admit waiters from the head of the queue while they fit. Caller holds the lock."""
+        while self._waiters and self._in_use + self._waiters[0].weight <= self.max_slots:
+            waiter = self._waiters.popleft()
+            self._take(waiter.weight)
+            waiter.granted.set()
+
+    def _retry_after(self) -> int:
+        """Average parse time x slots held or queued / slots, in whole seconds. Caller holds the lock."""
+        ahead = self._in_use + sum(waiter.weight for waiter in self._waiters)
+        seconds = self._hold_seconds * ahead / self.max_slots
+        return max(1, min(MAX_RETRY_AFTER, math.ceil(seconds)))
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Batch Resume Parser
+Fans a list of resumes out across a process pool so bulk imports use every
+core instead of one GIL-bound request thread per file.
+"""
+
+import os
+import logging
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, List, Any, Optional
+
+from uploads import decode_base64, MAX_FILE_BYTES, UploadTooLarge
+
+# Parser instance owned by each pool worker, built once by _init_worker
+_worker_parser = None
+
+
+def available_cpus() -> int:
+    """Number of cores this process may run on."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def _init_worker(log_level: Optional[int] = None) -> None:
+    """Build one ProfessionalResumeParser per worker process, optionally with a quieter logger."""
+    global _worker_parser
+    if log_level is not None:
+        # Configure the logger before the parser does, so its startup lines are quiet too
+        logger = logging.getLogger('ProfessionalResumeParser')
+        logger.addHandler(logging.NullHandler())
+        logger.setLevel(log_level)
+    # The parser module, not the Flask app module, so no app, pools or prewarm are built here
+    from professional_resume_parser import ProfessionalResumeParser
+    from extraction_worker import SupervisedExtractor
+    # A pool worker parses one file at a time, so one extraction process is all it can use
+    _worker_parser = ProfessionalResumeParser(SupervisedExtractor.from_env(worker_limit=1))
+
+
+def _parse_in_worker(file_data: bytes, filename: str, file_type: str) -> Dict[str, Any]:
+    """Pool task: run the unchanged single-file entry point."""
+    return _worker_parser.process_resume(file_data, filename, file_type)
+
+
+def _parse_path_in_worker(path: str, file_type: str, mode: str) -> Dict[str, Any]:
+    """Pool task for local files: read in the worker so only the path crosses the pipe."""
+    with open(path, 'rb') as handle:
+        file_data = handle.read()
+    return _worker_parser.process_resume(file_data, os.path.basename(path), file_type, mode)
+
+
+class BatchResumeParser:
+    """
+    Process-pool front end for ProfessionalResumeParser.process_resume.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        """Initialize the batch parser; the pool itself starts on first use."""
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.max_workers = max_workers or int(os.environ.get('PARSER_BATCH_WORKERS', 0)) or available_cpus()
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def parse_batch(self, files: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Parse a list of files in parallel.
+
+        Args:
+            files (List[Dict[str, Any]]): Items shaped like a /parse-resume request body
+
+        Returns:
+            List[Dict[str, Any]]: One result per input, in input order
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(files)
+        futures = {}
+        pool = self._get_pool()
+
+        for index, item in enumerate(files):
+            filename = item.get('filename', f'file-{index}') if isinstance(item, dict) else f'file-{index}'
+            try:
+                if not isinstance(item, dict) or 'file' not in item:
+                    raise ValueError("No file provided")
+                file_data = decode_base64(item['file'], MAX_FILE_BYTES)
+                futures[index] = pool.submit(_parse_in_worker, file_data, filename, item.get('type', ''))
+            except UploadTooLarge as e:
+                results[index] = self._create_error_entry(filename, str(e))
+            except Exception as e:
+                results[index] = self._create_error_entry(filename, f"Invalid batch item: {e}")
+
+        broken = False
+        for index, future in futures.items():
+            filename = files[index].get('filename', f'file-{index}')
+            try:
+                results[index] = {"filename": filename, **future.result()}
+            except BrokenProcessPool as e:
+                broken = True
+                results[index] = self._create_error_entry(filename, f"Worker crashed: {e}")
+            except Exception as e:
+                results[index] = self._create_error_entry(filename, f"Processing failed: {e}")
+
+        if broken:
+            self.logger.error("Batch worker pool broke, it will be rebuilt on the next batch")
+            self.shutdown()
+
+        return results
+
+    def shutdown(self) -> None:
+        """Stop the worker pool."""
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=False, cancel_futures=True)
+                self._pool = None
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        """Start the worker pool on first use."""
+        with self._lock:
+            if self._pool is None:
+                self.logger.info(f"Starting batch pool with {self.max_workers} workers")
+                self._pool = ProcessPoolExecutor(max_workers=self.max_workers, initializer=_init_worker)
+            return self._pool
+
+    def _create_error_entry(self, filename: str, message: str) -> Dict[str, Any]:
+        """Per-file error entry, shaped like a fallback response."""
+        return {
+            "filename": filename,
+            "name": "",
+            "email": "",
+            "phone": "",
+            "_fallback": True,
+            "_error": message
+        }
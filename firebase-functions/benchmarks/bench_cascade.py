@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+PDF Engine Cascade Benchmark
+Latency and contact-field accuracy of the cheap-first cascade in
+text_extraction.py (PyPDF2, escalating to pdfplumber on a low quality score)
+against the old order in ProfessionalResumeParser._extract_pdf_text
+(pdfplumber always, PyPDF2 only when it finds nothing), reproduced below.
+
+The corpus mixes ordinary single-column resumes, multi-page resumes and
+resumes whose words are positioned one by one (PyPDF2 glues those words
+together, so the cascade has to escalate).
+
+Run with: python benchmarks/bench_cascade.py [--documents 60]
+"""
+
+import io
+import os
+import sys
+import time
+import random
+import argparse
+import statistics
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import PyPDF2  # noqa: E402
+import pdfplumber  # noqa: E402
+
+from samples import make_pdf, lines_to_runs  # noqa: E402
+from field_extraction import extract_fields  # noqa: E402
+from text_extraction import scan_pdf_fields  # noqa: E402
+
+FIRST_NAMES = ['Maria', 'James', 'Aisha', 'Chen', 'Olga', 'David', 'Priya', 'Lucas', 'Fatima', 'Noah']
+LAST_NAMES = ['Garcia', 'Smith', 'Khan', 'Wei', 'Petrova', 'Brown', 'Sharma', 'Silva', 'Haddad', 'Miller']
+BODY = [
+    "Experience",
+    "Senior Software Engineer, Northwind Systems (2019 - 2024)",
+    "Built document processing services in Python and Go running on Kubernetes.",
+    "Reduced parsing latency by caching extracted text and batching database writes.",
+    "Software Engineer, Contoso Analytics (2015 - 2019)",
+    "Maintained reporting pipelines with PostgreSQL, Airflow and AWS Lambda.",
+    "Education",
+    "BSc Computer Science, State University (2011 - 2015)",
+    "Skills",
+    "Python, Go, SQL, Docker, Kubernetes, Terraform, React",
+]
+
+# Approximate Helvetica advance per character, as a fraction of font size
+CHAR_ADVANCE = 0.6
+
+
+def word_runs(lines, size=10.5, x=54, top=740, leading=14):
+    """Place every word separately, with no space characters in the content stream."""
+    runs = []
+    for index, line in enumerate(lines):
+        cursor = x
+        for word in line.split(' '):
+            runs.append((cursor, top - index * leading, size, word))
+            cursor += size * CHAR_ADVANCE * (len(word) + 1)
+    return runs
+
+
+def build_corpus(documents, seed=7):
+    rng = random.Random(seed)
+    corpus = []
+    for index in range(documents):
+        first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+        email = f"{first.lower()}.{last.lower()}{index}@example.com"
+        phone = f"{rng.randint(200, 989)}{rng.randint(200, 989)}{rng.randint(1000, 9999)}"
+        header = [f"{first} {last}", f"{email} | ({phone[:3]}) {phone[3:6]}-{phone[6:]}"]
+        kind = ('single-column', 'multi-page', 'positioned-words')[index % 3]
+
+        if kind == 'single-column':
+            pdf = make_pdf([lines_to_runs(header + BODY)])
+        elif kind == 'multi-page':
+            pdf = make_pdf([lines_to_runs(header + BODY)] + [lines_to_runs(BODY * 3)] * 3)
+        else:
+            pdf = make_pdf([word_runs(header + BODY)])
+
+        corpus.append((kind, pdf, {"name": f"{first} {last}", "email": email, "phone": phone}))
+    return corpus
+
+
+def legacy_extract(file_data):
+    text = ""
+    try:
+        with pdfplumber.open(io.BytesIO(file_data)) as pdf:
+            for page in pdf.pages:
+                page_text = page.extract_text()
+                if page_text:
+                    text += page_text + "\n"
+    except Exception:
+        pass
+    if not text.strip():
+        text = ""
+        for page in PyPDF2.PdfReader(io.BytesIO(file_data)).pages:
+            text += page.extract_text() + "\n"
+    return extract_fields(text), 'pdfplumber'
+
+
+def cascade_extract(file_data):
+    scan = scan_pdf_fields(file_data)
+    return scan.fields, scan.engine
+
+
+def run(method, corpus):
+    latencies, correct, engines = {}, {}, {}
+    for kind, pdf, truth in corpus:
+        start = time.perf_counter()
+        fields, engine = method(pdf)
+        latencies.setdefault(kind, []).append(time.perf_counter() - start)
+        hits = sum(1 for key, value in truth.items() if fields.get(key) == value)
+        correct.setdefault(kind, []).append(hits)
+        engines[engine] = engines.get(engine, 0) + 1
+    return latencies, correct, engines
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--documents', type=int, default=60)
+    args = parser.parse_args()
+
+    corpus = build_corpus(args.documents)
+    print(f"Corpus: {len(corpus)} documents")
+    print(f"{'method':<10}{'kind':<18}{'p50 ms':>9}{'p95 ms':>9}{'total s':>9}{'fields ok':>11}")
+
+    for name, method in (('legacy', legacy_extract), ('cascade', cascade_extract)):
+        method(corpus[0][1])  # warm up imports and caches
+        latencies, correct, engines = run(method, corpus)
+        all_latencies = []
+        total_hits = 0
+        for kind in latencies:
+            values = sorted(latencies[kind])
+            all_latencies.extend(values)
+            hits = sum(correct[kind])
+            total_hits += hits
+            p95 = values[min(len(values) - 1, int(len(values) * 0.95))]
+            print(f"{name:<10}{kind:<18}{statistics.median(values) * 1000:>9.1f}{p95 * 1000:>9.1f}"
+                  f"{sum(values):>9.2f}{hits / (3 * len(values)):>10.0%}")
+        print(f"{name:<10}{'ALL':<18}{statistics.median(all_latencies) * 1000:>9.1f}{'':>9}"
+              f"{sum(all_latencies):>9.2f}{total_hits / (3 * len(corpus)):>10.0%}   engines: {engines}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Result Export Benchmark
+Writes synthetic parse results with result_export.ResultWriter to Parquet,
+Arrow IPC and JSON Lines, then reads them back, reporting throughput, file
+size and peak memory per format.
+
+Each step runs in a fresh process and reports its peak resident memory,
+which should follow the row group size rather than the number of results.
+"json api" is the baseline of serializing every result on its own, as the
+API hands them out one record at a time.
+
+Run with: python benchmarks/bench_export.py [--results 200000] [--row-group-size 10000] [--dir /tmp]
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import resource
+import tempfile
+import multiprocessing
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from result_export import ResultWriter, iter_record_batches, PYARROW_AVAILABLE, FORMATS, FORMAT_JSONL  # noqa: E402
+from bench_search import build_profiles  # noqa: E402
+
+
+def results(count):
+    for doc_id, profile in build_profiles(count):
+        yield {
+            "status": "SUCCESS",
+            "processing_time_seconds": 0.25,
+            "extracted_text_length": len(profile["experience"]) + len(profile["summary"]),
+            "extraction_engine": "pdfplumber",
+            "document_id": doc_id,
+            **profile
+        }
+
+
+def one_at_a_time(count):
+    return sum(len(json.dumps(result)) for result in results(count))
+
+
+def write(path, fmt, count, row_group_size):
+    with ResultWriter(path, fmt, row_group_size) as writer:
+        writer.write_all(results(count))
+    return writer.rows
+
+
+def read(path, fmt, count, row_group_size):
+    return sum(len(batch) for batch in iter_record_batches(path, fmt, row_group_size))
+
+
+def timed(step, *step_args):
+    """Runs in a fresh process: (seconds, peak RSS in bytes, return value)."""
+    start = time.perf_counter()
+    value = step(*step_args)
+    elapsed = time.perf_counter() - start
+    return elapsed, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024, value
+
+
+def measure(step, *step_args):
+    with multiprocessing.get_context('spawn').Pool(1) as pool:
+        return pool.apply(timed, (step, *step_args))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--results', type=int, default=200000)
+    parser.add_argument('--row-group-size', type=int, default=10000)
+    parser.add_argument('--dir', default=tempfile.gettempdir())
+    args = parser.parse_args()
+
+    formats = FORMATS if PYARROW_AVAILABLE else (FORMAT_JSONL,)
+    print(f"{args.results} results, row groups of {args.row_group_size}, pyarrow: {PYARROW_AVAILABLE}")
+    print(f"{'format':<10}{'write/s':>10}{'read/s':>10}{'MB':>8}{'write peak MB':>15}{'read peak MB':>14}")
+
+    elapsed, peak, size = measure(one_at_a_time, args.results)
+    print(f"{'json api':<10}{args.results / elapsed:>10.0f}{'':>10}{size / 1e6:>8.1f}{peak / 1e6:>15.1f}{'':>14}")
+
+    for fmt in formats:
+        path = os.path.join(args.dir, f"bench_export.{fmt}")
+
+        write_time, write_peak, rows = measure(write, path, fmt, args.results, args.row_group_size)
+        read_time, read_peak, read_rows = measure(read, path, fmt, args.results, args.row_group_size)
+        assert rows == read_rows == args.results
+        print(f"{fmt:<10}{rows / write_time:>10.0f}{rows / read_time:>10.0f}{os.path.getsize(path) / 1e6:>8.1f}"
+              f"{write_peak / 1e6:>15.1f}{read_peak / 1e6:>14.1f}")
+        os.remove(path)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Hostile Input Benchmark
+Feeds ProfessionalResumeParser a mix of ordinary resumes and hostile PDFs
+(a page with hundreds of thousands of text operators, and a Flate stream
+that inflates to far more than the worker memory limit) and reports latency
+per document kind. With supervised extraction workers every hostile
+document should end in a _fallback response within the timeout, and the
+ordinary resumes around it should be unaffected.
+
+Run with: python benchmarks/bench_hostile.py [--timeout 5] [--memory-mb 256] [--rounds 3]
+"""
+
+import os
+import sys
+import time
+import zlib
+import random
+import argparse
+import statistics
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from samples import make_pdf, sample_resume_pdf  # noqa: E402
+
+
+def dense_page_pdf(runs=150000):
+    """One page drawing every character as its own text object."""
+    return make_pdf([[(20 + index % 560, 760 - (index // 560) % 740, 4, 'x') for index in range(runs)]])
+
+
+def flate_bomb_pdf(inflated_mb=768):
+    """One page whose content stream inflates to inflated_mb of spaces."""
+    compressor = zlib.compressobj(9)
+    chunk = b' ' * (64 << 20)
+    stream = b''.join(compressor.compress(chunk) for _ in range(inflated_mb // 64)) + compressor.flush()
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Contents 4 0 R >>",
+        b"<< /Length %d /Filter /FlateDecode >>\nstream\n" % len(stream) + stream + b"\nendstream",
+    ]
+    output = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(output))
+        output += f"{number} 0 obj\n".encode() + body + b"\nendobj\n"
+    xref = len(output)
+    output += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    output += b"".join(f"{offset:010d} 00000 n \n".encode() for offset in offsets)
+    output += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode()
+    return bytes(output)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--timeout', type=float, default=5.0)
+    parser.add_argument('--memory-mb', type=int, default=256)
+    parser.add_argument('--rounds', type=int, default=3)
+    parser.add_argument('--normal-per-round', type=int, default=8)
+    args = parser.parse_args()
+
+    os.environ['EXTRACTION_TIMEOUT'] = str(args.timeout)
+    os.environ['EXTRACTION_MEMORY_MB'] = str(args.memory_mb)
+    os.environ['PARSE_CACHE_SIZE'] = '0'
+    import logging
+    logging.disable(logging.CRITICAL)
+    from professional_resume_parser import ProfessionalResumeParser
+
+    print("Building documents...")
+    documents = {
+        'normal': sample_resume_pdf(),
+        'dense-page': dense_page_pdf(),
+        'flate-bomb': flate_bomb_pdf(),
+    }
+    schedule = []
+    for _ in range(args.rounds):
+        batch = ['normal'] * args.normal_per_round + ['dense-page', 'flate-bomb']
+        random.shuffle(batch)
+        schedule.extend(batch)
+
+    resume_parser = ProfessionalResumeParser()
+    resume_parser.process_resume(documents['normal'], 'warmup.pdf', 'application/pdf')
+
+    latencies, outcomes = {}, {}
+    for kind in schedule:
+        start = time.perf_counter()
+        result = resume_parser.process_resume(documents[kind], f"{kind}.pdf", 'application/pdf')
+        latencies.setdefault(kind, []).append(time.perf_counter() - start)
+        outcome = result.get('_error') or 'ok'
+        outcomes.setdefault(kind, {}).setdefault(outcome, 0)
+        outcomes[kind][outcome] += 1
+
+    print(f"timeout {args.timeout:g}s, memory limit {args.memory_mb} MB")
+    print(f"{'kind':<12}{'n':>4}{'p50 s':>9}{'p99 s':>9}{'max s':>9}  outcomes")
+    for kind, values in latencies.items():
+        values.sort()
+        p99 = values[min(len(values) - 1, int(len(values) * 0.99))]
+        print(f"{kind:<12}{len(values):>4}{statistics.median(values):>9.3f}{p99:>9.3f}{values[-1]:>9.3f}  {outcomes[kind]}")
+    print(f"extraction: {resume_parser.extractor.stats()}")
+    resume_parser.extractor.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Layout Contact Block Benchmark
+Latency and contact-field accuracy of layout mode (first page's word
+coordinates, text_extraction.scan_pdf_layout) against text-based scanning on
+multi-column resumes: the old full pdfplumber extract_text, the cascade
+reading every page and the cascade in contact mode.
+
+Corpus layouts (1-4 pages, the sidebar is written to the content stream
+before the main column, as many resume builders do):
+- left-sidebar: location, contact details and skills on the left, the name
+  at the top of the main column, top-aligned with the sidebar's first line
+- right-sidebar: the same with the sidebar on the right
+- split-header: large name over one row holding email, location and phone
+  far apart
+- two-column: name over the main column, contact details in a sidebar
+  starting on the name's line
+
+Run with: python benchmarks/bench_layout.py [--documents 80]
+"""
+
+import io
+import os
+import sys
+import time
+import random
+import logging
+import argparse
+import statistics
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import pdfplumber  # noqa: E402
+
+from samples import make_pdf, lines_to_runs, PAGE_WIDTH  # noqa: E402
+from corpus import contact_fields, phone_text, body_lines, SKILLS, TITLES, CHAR_ADVANCE, LINES_PER_PAGE  # noqa: E402
+from field_extraction import extract_fields  # noqa: E402
+from text_extraction import scan_pdf_fields, scan_pdf_layout  # noqa: E402
+
+LAYOUTS = ('left-sidebar', 'right-sidebar', 'split-header', 'two-column')
+CITIES = ['San Francisco, CA', 'Portland, OR', 'Austin, TX', 'New York, NY', 'Denver, CO', 'Boston, MA']
+
+
+def build_document(index, rng):
+    truth = contact_fields(rng, index)
+    layout = LAYOUTS[index % len(LAYOUTS)]
+    pages = rng.choice((1, 1, 2, 3, 4))
+    body = body_lines(rng, pages * LINES_PER_PAGE)
+    phone = phone_text(truth['phone'], rng)
+    city = rng.choice(CITIES)
+    # Title Case skill lines look like names to text heuristics
+    sidebar = [city, truth['email'], phone, "", "Skills"] + [' '.join(rng.sample(SKILLS, 3)) for _ in range(6)]
+
+    first, rest = body[:LINES_PER_PAGE - 4], body[LINES_PER_PAGE - 4:]
+    if layout in ('left-sidebar', 'right-sidebar'):
+        sidebar_x, main_x = (40, 210) if layout == 'left-sidebar' else (430, 54)
+        # Top-aligned with the 18pt name, so text extraction puts both on one line
+        runs = (lines_to_runs(sidebar, size=9, x=sidebar_x, top=757)
+                + [(main_x, 750, 18, truth['name']), (main_x, 728, 11, rng.choice(TITLES))]
+                + lines_to_runs([line[:55] for line in first], x=main_x, top=700))
+    elif layout == 'split-header':
+        width = len(truth['name']) * 20 * CHAR_ADVANCE
+        runs = ([((PAGE_WIDTH - width) / 2, 750, 20, truth['name'])]
+                + [(54, 724, 9, truth['email']), (260, 724, 9, city), (460, 724, 9, phone)]
+                + lines_to_runs(first, top=700))
+    else:
+        runs = (lines_to_runs(sidebar, size=9, x=430, top=755.5)
+                + [(54, 750, 16, truth['name'])]
+                + lines_to_runs([line[:60] for line in first], top=720))
+
+    later = [lines_to_runs(rest[start:start + LINES_PER_PAGE]) for start in range(0, len(rest), LINES_PER_PAGE)]
+    return layout, make_pdf([runs] + later[:pages - 1]), truth
+
+
+def build_corpus(documents, seed=11):
+    rng = random.Random(seed)
+    return [build_document(index, rng) for index in range(documents)]
+
+
+def pdfplumber_full(file_data):
+    text = ""
+    with pdfplumber.open(io.BytesIO(file_data)) as pdf:
+        for page in pdf.pages:
+            text += (page.extract_text() or "") + "\n"
+    return extract_fields(text)
+
+
+METHODS = {
+    'pdfplumber-full': pdfplumber_full,
+    'cascade-full': lambda data: scan_pdf_fields(data).fields,
+    'cascade-contact': lambda data: scan_pdf_fields(data, stop_when_complete=True).fields,
+    'layout': lambda data: scan_pdf_layout(data).fields,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--documents', type=int, default=80)
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+
+    corpus = build_corpus(args.documents)
+    print(f"Corpus: {len(corpus)} documents, {sum(len(pdf) for _, pdf, _ in corpus) / 1e6:.1f} MB")
+    print(f"{'method':<17}{'layout':<15}{'p50 ms':>9}{'p95 ms':>9}{'total s':>9}{'fields ok':>11}")
+
+    for name, method in METHODS.items():
+        method(corpus[0][1])  # warm up imports and caches
+        latencies, hits = {}, {}
+        for layout, pdf, truth in corpus:
+            start = time.perf_counter()
+            fields = method(pdf)
+            latencies.setdefault(layout, []).append(time.perf_counter() - start)
+            hits[layout] = hits.get(layout, 0) + sum(1 for key, value in truth.items() if fields.get(key) == value)
+
+        for layout in LAYOUTS:
+            values = sorted(latencies[layout])
+            p95 = values[min(len(values) - 1, int(len(values) * 0.95))]
+            print(f"{name:<17}{layout:<15}{statistics.median(values) * 1000:>9.1f}{p95 * 1000:>9.1f}"
+                  f"{sum(values):>9.2f}{hits[layout] / (3 * len(values)):>10.0%}")
+        everything = [value for values in latencies.values() for value in values]
+        print(f"{name:<17}{'ALL':<15}{statistics.median(everything) * 1000:>9.1f}{'':>9}"
+              f"{sum(everything):>9.2f}{sum(hits.values()) / (3 * len(corpus)):>10.0%}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Load Test
+Posts the sample resume to a running parser with concurrent keep-alive
+clients and reports requests/sec and latency percentiles.
+
+Run with: python benchmarks/bench_load.py --url http://localhost:5006 --concurrency 16 --duration 20
+Start the server with PARSE_CACHE_SIZE=0 so every request does a full parse.
+"""
+
+import os
+import sys
+import time
+import argparse
+import threading
+import http.client
+from urllib.parse import urlparse
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from samples import sample_resume_pdf  # noqa: E402
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))] if ordered else 0.0
+
+
+def run_client(url, body, deadline, latencies, errors, lock):
+    target = urlparse(url)
+    connection = http.client.HTTPConnection(target.hostname, target.port or 80, timeout=60)
+    headers = {'Content-Type': 'application/pdf', 'X-Filename': 'load.pdf'}
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        try:
+            connection.request('POST', '/parse-resume', body=body, headers=headers)
+            response = connection.getresponse()
+            response.read()
+            ok = response.status == 200
+        except (OSError, http.client.HTTPException):
+            ok = False
+            connection.close()
+            connection = http.client.HTTPConnection(target.hostname, target.port or 80, timeout=60)
+        elapsed = time.perf_counter() - start
+        with lock:
+            if ok:
+                latencies.append(elapsed)
+            else:
+                errors.append(elapsed)
+    connection.close()
+
+
+def main():
+    arguments = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arguments.add_argument('--url', default='http://localhost:5006')
+    arguments.add_argument('--concurrency', type=int, default=16)
+    arguments.add_argument('--duration', type=float, default=20.0)
+    options = arguments.parse_args()
+
+    body = sample_resume_pdf()
+    latencies, errors, lock = [], [], threading.Lock()
+    start = time.perf_counter()
+    deadline = start + options.duration
+    clients = [
+        threading.Thread(target=run_client, args=(options.url, body, deadline, latencies, errors, lock))
+        for _ in range(options.concurrency)
+    ]
+    for client in clients:
+        client.start()
+    for client in clients:
+        client.join()
+    elapsed = time.perf_counter() - start
+
+    print(f"URL:          {options.url}")
+    print(f"Concurrency:  {options.concurrency}")
+    print(f"Requests:     {len(latencies)} ok, {len(errors)} failed in {elapsed:.1f}s")
+    print(f"Throughput:   {len(latencies) / elapsed:.1f} req/s")
+    print(f"Latency p50:  {percentile(latencies, 0.50) * 1000:.1f} ms")
+    print(f"Latency p95:  {percentile(latencies, 0.95) * 1000:.1f} ms")
+    print(f"Latency p99:  {percentile(latencies, 0.99) * 1000:.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Candidate Matching Benchmark
+Latency of candidate_matching.CandidateMatcher (one sparse matrix-vector
+product over every candidate) against a per-candidate Python loop with the
+same weights, for 10k-100k synthetic candidates. Also times ten jobs scored
+in one batched call.
+
+Requires NumPy.
+
+Run with: python benchmarks/bench_matching.py [--sizes 10000 50000 100000] [--queries 50]
+"""
+
+import os
+import sys
+import math
+import time
+import heapq
+import random
+import argparse
+import statistics
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from candidate_matching import CandidateMatcher, skill_weights, NUMPY_AVAILABLE  # noqa: E402
+from skill_matcher import load_taxonomy, DEFAULT_TAXONOMY_PATH  # noqa: E402
+
+
+def build_candidates(rng, skills, weights, count):
+    return [(f"doc-{index}", list(dict.fromkeys(rng.choices(skills, weights=weights, k=rng.randint(4, 14)))))
+            for index in range(count)]
+
+
+def python_match(candidates, job_skills, limit=10):
+    """Same scoring as CandidateMatcher, one candidate at a time."""
+    frequency = {}
+    for _, skills in candidates:
+        for skill in skills:
+            frequency[skill] = frequency.get(skill, 0) + 1
+    job = {skill: math.log((len(candidates) + 1) / (frequency.get(skill, 0) + 1)) + 1 for skill in job_skills}
+    norm = math.sqrt(sum(weight * weight for weight in job.values()))
+    scores = []
+    for doc_id, skills in candidates:
+        score = sum(weight * job[skill] for skill, weight in skill_weights(skills) if skill in job) / norm
+        if score:
+            scores.append((score, doc_id))
+    return heapq.nlargest(limit, scores)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10000, 50000, 100000])
+    parser.add_argument('--queries', type=int, default=50)
+    args = parser.parse_args()
+
+    if not NUMPY_AVAILABLE:
+        print("❌ NumPy is not installed")
+        sys.exit(1)
+
+    rng = random.Random(3)
+    skills = list(load_taxonomy(DEFAULT_TAXONOMY_PATH))
+    weights = [1.0 / (rank + 1) for rank in range(len(skills))]
+    jobs = [rng.sample(skills[:120], rng.randint(3, 10)) for _ in range(args.queries)]
+
+    print(f"{'candidates':>11}{'load s':>9}{'numpy p50 ms':>14}{'numpy p95 ms':>14}"
+          f"{'10 jobs ms':>12}{'python p50 ms':>15}")
+    for size in args.sizes:
+        candidates = build_candidates(rng, skills, weights, size)
+        matcher = CandidateMatcher()
+        start = time.perf_counter()
+        matcher.load(candidates)
+        matcher.match([jobs[0]])  # build the NumPy snapshot
+        load = time.perf_counter() - start
+
+        timings = []
+        for job in jobs:
+            start = time.perf_counter()
+            matcher.match([job])
+            timings.append((time.perf_counter() - start) * 1000)
+        timings.sort()
+
+        start = time.perf_counter()
+        matcher.match(jobs[:10])
+        batch = (time.perf_counter() - start) * 1000
+
+        python_timings = []
+        for job in jobs[:5]:
+            start = time.perf_counter()
+            python_match(candidates, job)
+            python_timings.append((time.perf_counter() - start) * 1000)
+
+        print(f"{size:>11}{load:>9.2f}{statistics.median(timings):>14.2f}"
+              f"{timings[int(len(timings) * 0.95)]:>14.2f}{batch:>12.2f}{statistics.median(python_timings):>15.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+PDF Extraction Memory Benchmark
+Peak RSS of the old whole-document extraction (`text += page_text` with every
+pdfplumber page cached until the file closes, reproduced below) against the
+page-by-page generator in text_extraction.py, for documents of 10-200 pages.
+Both sides use pdfplumber, the engine with the heavy per-page layout objects.
+
+Each measurement runs in a fresh interpreter so ru_maxrss is not shared.
+
+Run with: python benchmarks/bench_memory.py [--pages 10 50 100 200]
+"""
+
+import io
+import os
+import sys
+import json
+import time
+import argparse
+import resource
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from samples import make_text_pdf  # noqa: E402
+
+LINES_PER_PAGE = 48
+
+
+def legacy_extract_pdf_text(file_data):
+    import pdfplumber
+    with pdfplumber.open(io.BytesIO(file_data)) as pdf:
+        text = ""
+        for page in pdf.pages:
+            page_text = page.extract_text()
+            if page_text:
+                text += page_text + "\n"
+        return text
+
+
+def streaming_extract_pdf_text(file_data):
+    # Pinned to pdfplumber so both sides run the same engine
+    from text_extraction import scan_pdf_fields, ENGINE_PDFPLUMBER
+    return scan_pdf_fields(file_data, keep_text=True, engines=(ENGINE_PDFPLUMBER,)).text
+
+
+def streaming_scan_fields(file_data):
+    from text_extraction import scan_pdf_fields, ENGINE_PDFPLUMBER
+    return scan_pdf_fields(file_data, engines=(ENGINE_PDFPLUMBER,))
+
+
+METHODS = {
+    'legacy': legacy_extract_pdf_text,
+    'streaming-text': streaming_extract_pdf_text,
+    'streaming-fields': streaming_scan_fields,
+}
+
+
+def build_document(pages):
+    body = [
+        f"Senior Engineer, Company {index} (2010-2024) - built Python services, PostgreSQL, Docker, AWS"
+        for index in range(LINES_PER_PAGE - 3)
+    ]
+    first = ["Maria Garcia", "maria.garcia@example.com | +1 (415) 555-0142", "Experience"]
+    return make_text_pdf([(first if page == 0 else ["Experience (continued)", "", ""]) + body
+                          for page in range(pages)])
+
+
+def max_rss_mb():
+    # ru_maxrss is KiB on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def run_child(method, pages):
+    """Measure one method in this process and print a JSON line."""
+    import pdfplumber  # noqa: F401  (import cost is not part of the measurement)
+    import text_extraction  # noqa: F401
+
+    file_data = build_document(pages)
+    baseline = max_rss_mb()
+    start = time.perf_counter()
+    METHODS[method](file_data)
+    elapsed = time.perf_counter() - start
+    print(json.dumps({
+        "method": method,
+        "pages": pages,
+        "baseline_mb": round(baseline, 1),
+        "peak_mb": round(max_rss_mb(), 1),
+        "growth_mb": round(max_rss_mb() - baseline, 1),
+        "seconds": round(elapsed, 2)
+    }))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--pages', type=int, nargs='+', default=[10, 50, 100, 200])
+    parser.add_argument('--child', nargs=2, metavar=('METHOD', 'PAGES'), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(args.child[0], int(args.child[1]))
+        return
+
+    print(f"{'method':<18}{'pages':>7}{'growth MB':>12}{'peak MB':>10}{'seconds':>10}")
+    for pages in args.pages:
+        for method in METHODS:
+            output = subprocess.run(
+                [sys.executable, os.path.abspath(__file__), '--child', method, str(pages)],
+                capture_output=True, text=True, check=True
+            ).stdout.strip().splitlines()[-1]
+            row = json.loads(output)
+            print(f"{method:<18}{pages:>7}{row['growth_mb']:>12.1f}{row['peak_mb']:>10.1f}{row['seconds']:>10.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+OCR Fallback Benchmark
+Latency, pages recognized and contact-field accuracy of the OCR stage
+(ocr_extraction.iter_ocr_pages) on scanned resumes: image-only PDFs made by
+rasterizing text resumes of 1-4 pages and wrapping the images back up as
+PDF pages, so no text layer is left.
+
+Compared: every page on one worker, every page on --workers workers,
+contact mode on --workers workers (stops once name, email and phone are
+found), and a repeat of the full parse served from the OCR cache.
+
+Needs pypdfium2, Pillow and a tesseract binary on PATH (or TESSERACT_CMD).
+
+Run with: python benchmarks/bench_ocr.py [--documents 12] [--workers 4]
+"""
+
+import io
+import os
+import sys
+import time
+import random
+import logging
+import argparse
+import statistics
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from samples import make_pdf, lines_to_runs  # noqa: E402
+from corpus import contact_fields, phone_text, body_lines, TITLES, LINES_PER_PAGE  # noqa: E402
+from field_extraction import FieldScanner  # noqa: E402
+from text_extraction import has_contact_fields  # noqa: E402
+from metrics import OCR_PAGES  # noqa: E402
+import ocr_extraction  # noqa: E402
+
+SCAN_DPI = 200
+
+
+def scan(text_pdf):
+    """Rasterize every page and rebuild the PDF from the images alone."""
+    import pypdfium2
+    document = pypdfium2.PdfDocument(text_pdf)
+    images = [document[index].render(scale=SCAN_DPI / 72, grayscale=True).to_pil()
+              for index in range(len(document))]
+    document.close()
+    buffer = io.BytesIO()
+    images[0].save(buffer, 'PDF', save_all=True, append_images=images[1:], resolution=SCAN_DPI)
+    return buffer.getvalue()
+
+
+def build_corpus(documents, seed=23):
+    rng = random.Random(seed)
+    corpus = []
+    for index in range(documents):
+        truth = contact_fields(rng, index)
+        pages = rng.choice((1, 2, 2, 3, 4))
+        header = [truth['name'], f"{truth['email']} | {phone_text(truth['phone'], rng)}", rng.choice(TITLES), ""]
+        lines = header + body_lines(rng, pages * LINES_PER_PAGE - len(header))
+        text_pdf = make_pdf([lines_to_runs(lines[start:start + LINES_PER_PAGE])
+                             for start in range(0, len(lines), LINES_PER_PAGE)])
+        corpus.append((pages, scan(text_pdf), truth))
+    return corpus
+
+
+def run_ocr(pdf, workers, stop_when_complete):
+    scanner = FieldScanner()
+    for page_text in ocr_extraction.iter_ocr_pages(pdf, workers=workers):
+        scanner.feed(page_text)
+        if stop_when_complete and has_contact_fields(scanner.result()):
+            break
+    return scanner.result()
+
+
+def measure(corpus, workers, stop_when_complete, cached):
+    latencies, hits, pages = [], 0, 0
+    for _, pdf, truth in corpus:
+        if cached:
+            run_ocr(pdf, workers, stop_when_complete)
+        else:
+            ocr_extraction.ocr_cache().clear()
+        pages_before = OCR_PAGES.value()
+        start = time.perf_counter()
+        fields = run_ocr(pdf, workers, stop_when_complete)
+        latencies.append(time.perf_counter() - start)
+        pages += OCR_PAGES.value() - pages_before
+        hits += sum(1 for key, value in truth.items() if fields.get(key) == value)
+    return latencies, hits, pages
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--documents', type=int, default=12)
+    parser.add_argument('--workers', type=int, default=ocr_extraction.ocr_workers())
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+
+    if not ocr_extraction.OCR_AVAILABLE:
+        sys.exit(f"OCR unavailable: needs pypdfium2 and '{ocr_extraction.TESSERACT_CMD}' on PATH")
+
+    corpus = build_corpus(args.documents)
+    total_pages = sum(pages for pages, _, _ in corpus)
+    print(f"Corpus: {len(corpus)} scanned documents, {total_pages} pages, "
+          f"{sum(len(pdf) for _, pdf, _ in corpus) / 1e6:.1f} MB; OCR at {ocr_extraction.OCR_DPI} DPI")
+    print(f"{'method':<22}{'workers':>8}{'p50 s':>8}{'p95 s':>8}{'total s':>9}{'pages':>7}{'fields ok':>11}")
+
+    runs = [
+        ('full, serial', 1, False, False),
+        ('full, parallel', args.workers, False, False),
+        ('contact, parallel', args.workers, True, False),
+        ('full, cached', args.workers, False, True),
+    ]
+    for name, workers, stop_when_complete, cached in runs:
+        latencies, hits, pages = measure(corpus, workers, stop_when_complete, cached)
+        values = sorted(latencies)
+        p95 = values[min(len(values) - 1, int(len(values) * 0.95))]
+        print(f"{name:<22}{workers:>8}{statistics.median(values):>8.2f}{p95:>8.2f}{sum(values):>9.2f}"
+              f"{int(pages):>7}{hits / (3 * len(corpus)):>10.0%}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Resume Search Benchmark
+Indexes synthetic parsed profiles (skills from skills_taxonomy.txt plus
+experience, education and summary text) into search_index.SearchIndex and
+times BM25 queries against a linear scan over the same records, the way the
+Node backend searches today (lowercase substring match on every record).
+
+Query mixes: one common skill, one rare skill, and multi-term searches.
+
+Run with: python benchmarks/bench_search.py [--documents 100000] [--path /tmp/search.db]
+"""
+
+import os
+import sys
+import time
+import random
+import argparse
+import statistics
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from search_index import SearchIndex, NUMPY_AVAILABLE  # noqa: E402
+from skill_matcher import load_taxonomy, DEFAULT_TAXONOMY_PATH  # noqa: E402
+
+FIRST_NAMES = ['Maria', 'James', 'Aisha', 'Chen', 'Olga', 'David', 'Priya', 'Lucas', 'Fatima', 'Noah']
+LAST_NAMES = ['Garcia', 'Smith', 'Khan', 'Wei', 'Petrova', 'Brown', 'Sharma', 'Silva', 'Haddad', 'Miller']
+ROLES = ['Software Engineer', 'Data Engineer', 'Product Manager', 'DevOps Engineer', 'Data Scientist',
+         'Frontend Developer', 'QA Engineer', 'Engineering Manager', 'Nurse', 'Accountant']
+VERBS = ['built', 'designed', 'migrated', 'maintained', 'scaled', 'automated', 'led', 'reduced', 'launched']
+OBJECTS = ['billing services', 'data pipelines', 'reporting dashboards', 'search infrastructure',
+           'mobile apps', 'payment systems', 'internal tooling', 'release processes', 'patient records']
+DEGREES = ['BSc Computer Science', 'MSc Data Science', 'BA Economics', 'MBA', 'BEng Electrical Engineering']
+
+QUERIES = {
+    'common skill': ['python', 'sql', 'docker'],
+    'rare skill': ['elixir', 'fortran', 'haskell'],
+    'multi-term': ['python kubernetes terraform', 'senior data engineer spark airflow',
+                   'react typescript frontend', 'machine learning pytorch'],
+}
+
+
+def build_profiles(count, seed=5):
+    rng = random.Random(seed)
+    skills = list(load_taxonomy(DEFAULT_TAXONOMY_PATH))
+    # A few skills dominate real resumes; weight the head of the taxonomy
+    weights = [1.0 / (rank + 1) for rank in range(len(skills))]
+    for index in range(count):
+        role = rng.choice(ROLES)
+        experience = ' '.join(
+            f"{rng.choice(['Senior', 'Lead', ''])} {role} at Company {rng.randint(1, 5000)} "
+            f"{rng.choice(VERBS)} {rng.choice(OBJECTS)} for {rng.randint(1, 9)} years."
+            for _ in range(rng.randint(2, 5))
+        )
+        yield f"doc-{index}", {
+            "name": f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+            "email": f"candidate{index}@example.com",
+            "phone": "",
+            "skills": sorted(set(rng.choices(skills, weights=weights, k=rng.randint(4, 14)))),
+            "experience": experience,
+            "education": f"{rng.choice(DEGREES)}, State University ({rng.randint(1995, 2020)})",
+            "summary": f"{role} who {rng.choice(VERBS)} {rng.choice(OBJECTS)}.",
+            "filename": f"resume-{index}.pdf"
+        }
+
+
+def linear_scan(records, query, limit=10):
+    terms = query.lower().split()
+    return [doc_id for doc_id, text in records if all(term in text for term in terms)][:limit]
+
+
+def percentile(values, share):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * share))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--documents', type=int, default=100000)
+    parser.add_argument('--path', default=None, help='SQLite file (default: in memory)')
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    if args.path and os.path.exists(args.path):
+        os.remove(args.path)
+
+    index = SearchIndex(args.path, flush_every=5000)
+    records = []
+    start = time.perf_counter()
+    for doc_id, profile in build_profiles(args.documents):
+        index.add(doc_id, profile)
+        records.append((doc_id, ' '.join(str(value) for value in profile.values()).lower()))
+    index.flush()
+    build = time.perf_counter() - start
+
+    size = f", {os.path.getsize(args.path) / 1e6:.1f} MB on disk" if args.path else ""
+    print(f"Indexed {args.documents} profiles in {build:.1f}s ({args.documents / build:.0f} docs/s{size}), "
+          f"numpy: {NUMPY_AVAILABLE}")
+
+    if args.path:
+        start = time.perf_counter()
+        index = SearchIndex(args.path)
+        index.stats()
+        print(f"Reopened in {time.perf_counter() - start:.2f}s")
+
+    print(f"{'queries':<14}{'bm25 p50 ms':>13}{'bm25 p95 ms':>13}{'scan p50 ms':>13}{'hits':>7}")
+    for kind, queries in QUERIES.items():
+        bm25, scan, hits = [], [], 0
+        for _ in range(args.repeat):
+            for query in queries:
+                start = time.perf_counter()
+                results = index.search(query, limit=10)
+                bm25.append((time.perf_counter() - start) * 1000)
+                hits = max(hits, len(results))
+        for query in queries:
+            start = time.perf_counter()
+            linear_scan(records, query)
+            scan.append((time.perf_counter() - start) * 1000)
+        print(f"{kind:<14}{statistics.median(bm25):>13.2f}{percentile(bm25, 0.95):>13.2f}"
+              f"{statistics.median(scan):>13.2f}{hits:>7}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Section Segmentation Benchmark
+Compares the single-pass segmenter in sections.py against the old
+_extract_experience/_extract_education/_extract_summary rescans
+(reproduced below from ResumeParserAgent) on long CVs with many headings.
+
+Run with: python benchmarks/bench_sections.py
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sections import segment_sections  # noqa: E402
+
+
+def legacy_extract_experience(text):
+    experience_keywords = ['experience', 'work history', 'employment', 'career']
+    lines = text.split('\n')
+    experience_lines = []
+    for i, line in enumerate(lines):
+        if any(keyword in line.lower() for keyword in experience_keywords):
+            for j in range(i, min(i + 10, len(lines))):
+                if lines[j].strip():
+                    experience_lines.append(lines[j].strip())
+    return ' '.join(experience_lines[:200])
+
+
+def legacy_extract_education(text):
+    education_keywords = ['education', 'degree', 'university', 'college', 'bachelor', 'master', 'phd']
+    lines = text.split('\n')
+    education_lines = []
+    for i, line in enumerate(lines):
+        if any(keyword in line.lower() for keyword in education_keywords):
+            for j in range(i, min(i + 5, len(lines))):
+                if lines[j].strip():
+                    education_lines.append(lines[j].strip())
+    return ' '.join(education_lines[:100])
+
+
+def legacy_extract_summary(text):
+    summary_keywords = ['summary', 'objective', 'profile', 'about']
+    lines = text.split('\n')
+    for i, line in enumerate(lines):
+        if any(keyword in line.lower() for keyword in summary_keywords):
+            summary_lines = []
+            for j in range(i + 1, min(i + 4, len(lines))):
+                if lines[j].strip():
+                    summary_lines.append(lines[j].strip())
+            return ' '.join(summary_lines[:150])
+    return ""
+
+
+def legacy_sections(text):
+    return legacy_extract_experience(text), legacy_extract_education(text), legacy_extract_summary(text)
+
+
+def new_sections(text):
+    sections = segment_sections(text)
+    return (
+        ' '.join(sections.get('experience', [])[:200]),
+        ' '.join(sections.get('education', [])[:100]),
+        ' '.join(sections.get('summary', [])[:150])
+    )
+
+
+def make_cv(roles: int) -> str:
+    """Academic-style CV: a summary, then many roles and degrees under repeated headings."""
+    lines = ["Dr. Alex Morgan", "alex.morgan@university.edu", "", "Summary",
+             "Researcher with a career in distributed systems and employment in industry."]
+    for role in range(roles):
+        lines += [
+            "Professional Experience",
+            f"Research Engineer, Lab {role} (20{role % 20:02d}-20{(role + 2) % 20:02d})",
+            "Led career development workshops for employment of graduate students.",
+            "Designed experiments; experience with large clusters.",
+            "",
+            "Education",
+            f"PhD in Computer Science, University {role}",
+            f"Master of Science, College {role}",
+            "Thesis on degree-bounded graph algorithms.",
+        ]
+    return "\n".join(lines)
+
+
+def main():
+    print(f"{'roles':<8}{'lines':>7}{'legacy (ms)':>14}{'segmenter (ms)':>16}"
+          f"{'legacy chars':>14}{'new chars':>11}")
+    for roles in (10, 50, 200, 1000):
+        text = make_cv(roles)
+        runs = 20
+        legacy = timeit.timeit(lambda: legacy_sections(text), number=runs) / runs * 1000
+        engine = timeit.timeit(lambda: new_sections(text), number=runs) / runs * 1000
+        legacy_chars = sum(len(part) for part in legacy_sections(text))
+        new_chars = sum(len(part) for part in new_sections(text))
+        print(f"{roles:<8}{text.count(chr(10)) + 1:>7}{legacy:>14.2f}{engine:>16.2f}"
+              f"{legacy_chars:>14}{new_chars:>11}")
+
+
+if __name__ == '__main__':
+    main()
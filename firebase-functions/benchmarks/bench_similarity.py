@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Near-Duplicate Index Benchmark
+Query latency and recall of the MinHash/LSH index in similarity_index.py
+against a brute-force scan that compares the query signature with every
+indexed one, as the corpus grows.
+
+The corpus is synthetic resumes. Each query is an edited copy of one of
+them (a few words replaced, as when a candidate re-submits an updated
+resume) and counts as found when its original is among the matches.
+
+Run with: python benchmarks/bench_similarity.py [--sizes 1000 4000 12000] [--queries 200]
+"""
+
+import os
+import sys
+import time
+import random
+import argparse
+import statistics
+from array import array
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from similarity_index import SimilarityIndex, minhash_signature, estimate_similarity, DEFAULT_THRESHOLD  # noqa: E402
+
+VOCABULARY = (
+    "python java go rust sql postgres mysql redis kafka spark airflow docker kubernetes terraform aws gcp "
+    "azure react vue node django flask api services pipelines billing payments search analytics reporting "
+    "engineer senior lead manager team built designed migrated reduced improved latency cost reliability "
+    "customers platform data mobile web backend frontend infrastructure security testing release"
+).split()
+WORDS_PER_RESUME = 150
+EDITED_WORDS = 3
+
+
+def make_resume(rng):
+    return [rng.choice(VOCABULARY) + str(rng.randint(0, 9)) for _ in range(WORDS_PER_RESUME)]
+
+
+def edit_resume(rng, words):
+    edited = list(words)
+    for position in rng.sample(range(len(edited)), EDITED_WORDS):
+        edited[position] = 'updated'
+    return edited
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 4000, 12000])
+    parser.add_argument('--queries', type=int, default=200)
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD)
+    args = parser.parse_args()
+
+    rng = random.Random(11)
+    resumes, signatures = [], []
+    queries = []
+    index = SimilarityIndex(threshold=args.threshold)
+
+    print(f"{'documents':>10}{'lsh p50 ms':>12}{'lsh p95 ms':>12}{'scan p50 ms':>13}"
+          f"{'candidates':>12}{'lsh recall':>12}{'scan recall':>13}")
+    for size in sorted(args.sizes):
+        start = time.perf_counter()
+        while len(resumes) < size:
+            words = make_resume(rng)
+            signature = minhash_signature(' '.join(words))
+            doc_id = f"doc-{len(resumes)}"
+            resumes.append(words)
+            signatures.append((doc_id, array('Q', signature)))
+            index.add(doc_id, signature, f"{doc_id}.pdf")
+        build = time.perf_counter() - start
+
+        while len(queries) < args.queries:
+            original = rng.randrange(min(args.sizes))
+            queries.append((f"doc-{original}", minhash_signature(' '.join(edit_resume(rng, resumes[original])))))
+
+        lookups_before, candidates_before = index.lookups, index.candidates
+        lsh_times, scan_times, lsh_hits, scan_hits = [], [], 0, 0
+        for original, signature in queries:
+            start = time.perf_counter()
+            matches = index.query(signature, limit=10)
+            lsh_times.append((time.perf_counter() - start) * 1000)
+            lsh_hits += any(match["document_id"] == original for match in matches)
+
+            start = time.perf_counter()
+            found = [doc_id for doc_id, stored in signatures
+                     if estimate_similarity(signature, stored) >= args.threshold]
+            scan_times.append((time.perf_counter() - start) * 1000)
+            scan_hits += original in found
+
+        candidates = (index.candidates - candidates_before) / (index.lookups - lookups_before)
+        lsh_times.sort()
+        print(f"{size:>10}{statistics.median(lsh_times):>12.2f}{lsh_times[int(len(lsh_times) * 0.95)]:>12.2f}"
+              f"{statistics.median(scan_times):>13.2f}{candidates:>12.1f}"
+              f"{lsh_hits / len(queries):>11.0%}{scan_hits / len(queries):>13.0%}"
+              f"   (indexed in {build:.1f}s)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Skill Matcher Benchmark
+Builds a synthetic 10k-skill taxonomy (three names per skill) and compares:
+
+    - automaton build time vs loading the pickled automaton
+    - one-pass matching vs the old per-keyword substring loop
+
+Run with: python benchmarks/bench_skill_matcher.py
+"""
+
+import os
+import sys
+import time
+import random
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from skill_matcher import SkillMatcher, load_taxonomy, DEFAULT_TAXONOMY_PATH  # noqa: E402
+
+SYLLABLES = ['ka', 'lo', 'mi', 'zen', 'tor', 'vex', 'qua', 'ri', 'sol', 'dun', 'pha', 'gri', 'nox', 'ul']
+
+
+def synthetic_word(rng: random.Random) -> str:
+    return ''.join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4)))
+
+
+def write_taxonomy(path: str, size: int) -> None:
+    """Bundled taxonomy plus generated skills up to the requested size."""
+    rng = random.Random(42)
+    with open(DEFAULT_TAXONOMY_PATH, encoding='utf-8') as handle:
+        lines = [line.rstrip('\n') for line in handle if line.strip() and not line.startswith('#')]
+    seen = {line.split('|')[0].strip() for line in lines}
+    while len(lines) < size:
+        canonical = f"{synthetic_word(rng).title()} {synthetic_word(rng).title()}"
+        if canonical in seen:
+            continue
+        seen.add(canonical)
+        lines.append(f"{canonical} | {synthetic_word(rng)} | {canonical.lower()} framework")
+    with open(path, 'w', encoding='utf-8') as handle:
+        handle.write('\n'.join(lines))
+
+
+def legacy_extract_skills(skill_names, text):
+    text_lower = text.lower()
+    return [skill for skill in skill_names if skill.lower() in text_lower]
+
+
+def make_resume(rng: random.Random, words: int) -> str:
+    vocabulary = ['maintained', 'designed', 'Python', 'React', 'AWS', 'Kubernetes', 'teams',
+                  'Machine Learning', 'services', 'latency', 'PostgreSQL', 'Docker', 'customers']
+    return ' '.join(rng.choice(vocabulary) for _ in range(words))
+
+
+def main():
+    with tempfile.TemporaryDirectory() as workdir:
+        taxonomy_path = os.path.join(workdir, 'taxonomy.txt')
+        write_taxonomy(taxonomy_path, 10000)
+        taxonomy = load_taxonomy(taxonomy_path)
+        names = sum(len(set(v)) for v in taxonomy.values())
+        print(f"Taxonomy: {len(taxonomy)} skills, {names} names")
+
+        start = time.perf_counter()
+        SkillMatcher.load(taxonomy_path, cache_dir=workdir)
+        build = time.perf_counter() - start
+
+        start = time.perf_counter()
+        matcher = SkillMatcher.load(taxonomy_path, cache_dir=workdir)
+        cached = time.perf_counter() - start
+        print(f"Build automaton: {build * 1000:8.1f} ms")
+        print(f"Load pickled:    {cached * 1000:8.1f} ms")
+
+        rng = random.Random(7)
+        all_names = [name for values in taxonomy.values() for name in values]
+        print(f"\n{'resume words':<14}{'legacy (ms)':>14}{'automaton (ms)':>16}")
+        for words in (300, 1500, 6000):
+            text = make_resume(rng, words)
+            runs = 5
+            start = time.perf_counter()
+            for _ in range(runs):
+                legacy_extract_skills(all_names, text)
+            legacy = (time.perf_counter() - start) / runs
+            start = time.perf_counter()
+            for _ in range(runs):
+                matcher.match(text)
+            engine = (time.perf_counter() - start) / runs
+            print(f"{words:<14}{legacy * 1000:>14.2f}{engine * 1000:>16.2f}")
+
+        sample = "Maintained the team's Java services and shared tools."
+        print(f"\nFalse positives on {sample!r}:")
+        print(f"  legacy:    {sorted(set(legacy_extract_skills(['AI', 'Java', 'JavaScript', 'SQL', 'Git'], sample)))}")
+        print(f"  automaton: {matcher.match(sample)}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+"""
+Parser Benchmark Suite
+Parses the synthetic corpus from benchmarks/corpus.py in-process with
+ResumeParserAgent, ProfessionalResumeParser and main.py's helpers, and
+reports throughput, latency percentiles per document and per stage, field
+accuracy and peak memory. Results are written as JSON so runs on two commits
+can be compared.
+
+Each parser runs in a fresh interpreter, so imports and ru_maxrss are not
+shared. The parse cache is disabled and extraction runs in-process by default
+(EXTRACTION_WORKERS=0); stage timings are read from metrics.py's journal, so
+they are the same stages /metrics reports.
+
+Run with: python benchmarks/bench_suite.py [--documents 120] [--repeat 2] [--output results.json]
+          [--compare benchmarks/results/<commit>.json]
+Without --output the results go to benchmarks/results/<commit>.json.
+"""
+
+import os
+import sys
+import json
+import time
+import logging
+import argparse
+import platform
+import resource
+import subprocess
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+BENCHMARKS = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(BENCHMARKS)
+sys.path.insert(0, ROOT)
+sys.path.insert(0, BENCHMARKS)
+
+from corpus import build_corpus, describe, PDF_MIME  # noqa: E402
+
+PARSERS = ('agent', 'professional', 'main')
+
+# Per-run settings; locations left unset keep every index and cache in memory
+CHILD_ENVIRONMENT = {
+    'PARSE_CACHE_SIZE': '0',
+    'PARSER_PREWARM': '0',
+}
+CLEARED_ENVIRONMENT = ('PARSE_CACHE_PATH', 'SIMILARITY_INDEX_PATH', 'SEARCH_INDEX_PATH', 'PARSE_JOB_SPOOL_DIR')
+
+# Relative change past which --compare reports a regression; runs on one machine vary by ~10-20%
+DEFAULT_TOLERANCE = 0.25
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))] if ordered else 0.0
+
+
+def summarize(seconds: List[float]) -> Dict[str, float]:
+    """Latency percentiles in milliseconds."""
+    return {
+        "count": len(seconds),
+        "mean_ms": round(sum(seconds) / len(seconds) * 1000, 3) if seconds else 0.0,
+        "p50_ms": round(percentile(seconds, 0.50) * 1000, 3),
+        "p95_ms": round(percentile(seconds, 0.95) * 1000, 3),
+        "p99_ms": round(percentile(seconds, 0.99) * 1000, 3),
+        "max_ms": round(max(seconds, default=0.0) * 1000, 3)
+    }
+
+
+def max_rss_mb():
+    # ru_maxrss is KiB on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def load_parser(name: str) -> Callable[[Any], Tuple[Dict[str, Any], Dict[str, float]]]:
+    """
+    Build one parser and return a function that parses a corpus document.
+
+    The function returns the result and any stage times it measured itself;
+    stages timed inside the parser are collected from the metrics journal.
+    """
+    if name == 'agent':
+        from resume_parser_agent import ResumeParserAgent
+        agent = ResumeParserAgent()
+        return lambda document: (agent.process_resume(document.data, document.filename, document.file_type), {})
+
+    if name == 'professional':
+        from professional_resume_parser import ProfessionalResumeParser
+        parser = ProfessionalResumeParser()
+        return lambda document: (parser.process_resume(document.data, document.filename, document.file_type), {})
+
+    if name == 'main':
+        import main
+
+        def parse(document):
+            start = time.perf_counter()
+            if document.file_type == PDF_MIME:
+                text = main.extract_text_from_pdf(document.data)
+            else:
+                text = main.extract_text_from_docx(document.data)
+            extracted = time.perf_counter()
+            result = main.extract_profile_info(text)
+            return result, {"extract_text": extracted - start,
+                            "extract_profile_info": time.perf_counter() - extracted}
+        return parse
+
+    raise ValueError(f"Unknown parser: {name}")
+
+
+def run_child(name: str, documents: int, seed: int, repeat: int, warmup: int) -> Dict[str, Any]:
+    """Benchmark one parser in this process."""
+    logging.disable(logging.CRITICAL)
+    import metrics
+
+    corpus = build_corpus(documents, seed)
+
+    start = time.perf_counter()
+    parse = load_parser(name)
+    for document in corpus[:warmup]:
+        parse(document)
+    setup_seconds = time.perf_counter() - start
+    baseline_mb = max_rss_mb()
+
+    latencies: List[float] = []
+    by_type: Dict[str, List[float]] = {}
+    stages: Dict[str, List[float]] = {}
+    fields_correct = fields_total = fallbacks = 0
+
+    metrics.start_journal()
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for document in corpus:
+            metrics.drain_journal()
+            begin = time.perf_counter()
+            result, timed = parse(document)
+            elapsed = time.perf_counter() - begin
+
+            latencies.append(elapsed)
+            by_type.setdefault('pdf' if document.file_type == PDF_MIME else 'docx', []).append(elapsed)
+            for metric, method, value, labels in metrics.drain_journal():
+                if metric == metrics.STAGE_SECONDS.name:
+                    stages.setdefault(labels['stage'], []).append(value)
+            for stage, value in timed.items():
+                stages.setdefault(stage, []).append(value)
+
+            fallbacks += bool(result.get('_fallback'))
+            for field, expected in document.truth.items():
+                fields_total += 1
+                fields_correct += result.get(field) == expected
+    total_seconds = time.perf_counter() - started
+
+    corpus_bytes = sum(len(document.data) for document in corpus) * repeat
+    corpus_pages = sum(document.pages for document in corpus) * repeat
+    return {
+        "parser": name,
+        "documents": len(latencies),
+        "seconds": round(total_seconds, 3),
+        "documents_per_second": round(len(latencies) / total_seconds, 2),
+        "pages_per_second": round(corpus_pages / total_seconds, 2),
+        "mb_per_second": round(corpus_bytes / total_seconds / 1e6, 3),
+        "latency": summarize(latencies),
+        "latency_by_type": {kind: summarize(values) for kind, values in sorted(by_type.items())},
+        "stages": {stage: summarize(values) for stage, values in sorted(stages.items())},
+        "field_accuracy": round(fields_correct / fields_total, 4) if fields_total else 0.0,
+        "fallbacks": fallbacks,
+        "setup_seconds": round(setup_seconds, 3),
+        "memory": {
+            "baseline_mb": round(baseline_mb, 1),
+            "peak_mb": round(max_rss_mb(), 1),
+            "growth_mb": round(max_rss_mb() - baseline_mb, 1)
+        }
+    }
+
+
+def git_revision() -> Tuple[Optional[str], bool]:
+    """Short commit hash of the tree and whether it has uncommitted changes."""
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT,
+                                capture_output=True, text=True, check=True).stdout.strip()
+        status = subprocess.run(['git', 'status', '--porcelain', '--untracked-files=no'], cwd=ROOT,
+                                capture_output=True, text=True, check=True).stdout.strip()
+        return commit, bool(status)
+    except (OSError, subprocess.CalledProcessError):
+        return None, False
+
+
+def run_parser(name: str, args) -> Dict[str, Any]:
+    """Run one parser's benchmark in a fresh interpreter."""
+    environment = {key: value for key, value in os.environ.items() if key not in CLEARED_ENVIRONMENT}
+    environment.update(CHILD_ENVIRONMENT, EXTRACTION_WORKERS=str(args.extraction_workers))
+    output = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), '--child', name, '--documents', str(args.documents),
+         '--seed', str(args.seed), '--repeat', str(args.repeat), '--warmup', str(args.warmup)],
+        capture_output=True, text=True, check=True, cwd=ROOT, env=environment
+    ).stdout.strip().splitlines()[-1]
+    return json.loads(output)
+
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any], tolerance: float) -> List[str]:
+    """
+    Print current results against a baseline run.
+
+    Returns:
+        List[str]: Descriptions of the metrics that got worse by more than tolerance
+    """
+    if baseline.get('corpus', {}).get('sha256') != current['corpus']['sha256']:
+        print("⚠️  The baseline used a different corpus; numbers are not comparable")
+
+    regressions = []
+    print(f"\nAgainst {baseline.get('commit') or 'baseline'} ({baseline.get('created', '?')}):")
+    print(f"{'parser':<14}{'metric':<32}{'baseline':>12}{'current':>12}{'change':>9}")
+    for name, result in current['parsers'].items():
+        before = baseline.get('parsers', {}).get(name)
+        if before is None:
+            continue
+        # (metric, value getter, True when higher is better)
+        checks = [
+            ('documents_per_second', lambda r: r['documents_per_second'], True),
+            ('latency p50_ms', lambda r: r['latency']['p50_ms'], False),
+            ('latency p95_ms', lambda r: r['latency']['p95_ms'], False),
+            ('latency p99_ms', lambda r: r['latency']['p99_ms'], False),
+            ('peak_mb', lambda r: r['memory']['peak_mb'], False),
+            ('field_accuracy', lambda r: r['field_accuracy'], True),
+        ]
+        for stage in result['stages']:
+            if stage in before.get('stages', {}):
+                checks.append((f"stage {stage} p95_ms", lambda r, s=stage: r['stages'][s]['p95_ms'], False))
+
+        for metric, value, higher_is_better in checks:
+            old, new = value(before), value(result)
+            change = (new - old) / old if old else 0.0
+            worse = -change if higher_is_better else change
+            flag = ''
+            if worse > tolerance:
+                flag = '  ❌ regression'
+                regressions.append(f"{name} {metric}: {old:g} -> {new:g}")
+            elif worse < -tolerance:
+                flag = '  ✅ improved'
+            print(f"{name:<14}{metric:<32}{old:>12g}{new:>12g}{change:>+9.0%}{flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--parsers', nargs='+', choices=PARSERS, default=list(PARSERS))
+    parser.add_argument('--documents', type=int, default=120, help='Corpus size')
+    parser.add_argument('--seed', type=int, default=2024, help='Corpus seed')
+    parser.add_argument('--repeat', type=int, default=2, help='Measured passes over the corpus')
+    parser.add_argument('--warmup', type=int, default=5, help='Documents parsed before measuring')
+    parser.add_argument('--extraction-workers', type=int, default=0,
+                        help='EXTRACTION_WORKERS for the parsers (worker memory is not included in peak_mb)')
+    parser.add_argument('--output', help='Results file (default: benchmarks/results/<commit>.json)')
+    parser.add_argument('--compare', help='Earlier results file to compare against')
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help='Relative change reported as a regression (default 0.25)')
+    parser.add_argument('--child', choices=PARSERS, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(run_child(args.child, args.documents, args.seed, args.repeat, args.warmup)))
+        return
+
+    commit, dirty = git_revision()
+    from batch_parser import available_cpus
+    results = {
+        "created": datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        "commit": commit,
+        "dirty": dirty,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": available_cpus(),
+        "settings": {"seed": args.seed, "repeat": args.repeat, "warmup": args.warmup,
+                     "extraction_workers": args.extraction_workers},
+        "corpus": describe(build_corpus(args.documents, args.seed)),
+        "parsers": {}
+    }
+    corpus = results['corpus']
+    print(f"Corpus: {corpus['documents']} documents, {corpus['pages']} pages, "
+          f"{corpus['bytes'] / 1e6:.1f} MB, sha256 {corpus['sha256'][:12]}")
+    print(f"{'parser':<14}{'docs/s':>9}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}"
+          f"{'peak MB':>9}{'fields ok':>11}")
+    for name in args.parsers:
+        result = results['parsers'][name] = run_parser(name, args)
+        latency = result['latency']
+        print(f"{name:<14}{result['documents_per_second']:>9.1f}{latency['p50_ms']:>9.1f}"
+              f"{latency['p95_ms']:>9.1f}{latency['p99_ms']:>9.1f}{result['memory']['peak_mb']:>9.1f}"
+              f"{result['field_accuracy']:>10.0%}")
+        for stage, timing in result['stages'].items():
+            print(f"  {stage:<24}{timing['p50_ms']:>9.2f}{timing['p95_ms']:>9.2f}{timing['p99_ms']:>9.2f}"
+                  f"  ({timing['count']} samples)")
+
+    output = args.output or os.path.join(BENCHMARKS, 'results', f"{commit or 'unversioned'}{'-dirty' if dirty else ''}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as handle:
+        json.dump(results, handle, indent=2)
+    print(f"\n📁 Results written to {output}")
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as handle:
+            regressions = compare(json.load(handle), results, args.tolerance)
+        if regressions:
+            print(f"\n❌ {len(regressions)} regression(s) beyond {args.tolerance:.0%}")
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
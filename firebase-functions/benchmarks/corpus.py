@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Synthetic Resume Corpus
+Deterministic mix of PDF and DOCX resumes for the benchmark suite: the same
+seed and size always give byte-identical files. Documents vary in length
+(1-12 pages), layout and size, and each carries the name, email and phone a
+parser should find.
+
+PDF layouts:
+- single-column: contact lines at the top, body below
+- two-column: body on the left, contact details and skills in a sidebar
+- banner: large centred name over a small contact line
+- positioned-words: every word placed separately (PyPDF2 glues them, so the
+  cascade escalates to pdfplumber)
+- contact-footer: contact line at the bottom of the first page
+
+DOCX layouts: docx (one page) and docx-long (page breaks between sections).
+
+Run with: python benchmarks/corpus.py out/ [--documents 120] [--seed 2024]
+to write the files and a manifest.json, e.g. for parse_dir.py.
+"""
+
+import os
+import sys
+import json
+import random
+import hashlib
+import argparse
+from typing import Dict, List, NamedTuple, Sequence
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from samples import make_pdf, make_docx, lines_to_runs, TextRun, PAGE_WIDTH  # noqa: E402
+
+PDF_MIME = 'application/pdf'
+DOCX_MIME = 'application/vnd.openxmlformats-officedocument.wordprocessingml.document'
+
+PDF_LAYOUTS = ('single-column', 'two-column', 'banner', 'positioned-words', 'contact-footer')
+DOCX_LAYOUTS = ('docx', 'docx-long')
+
+# Page counts drawn for each document; most resumes are short, a few are long
+PAGE_CHOICES = (1, 1, 1, 2, 2, 3, 5, 12)
+
+LINES_PER_PAGE = 46
+# Approximate Helvetica advance per character, as a fraction of font size
+CHAR_ADVANCE = 0.6
+
+FIRST_NAMES = ['Maria', 'James', 'Aisha', 'Chen', 'Olga', 'David', 'Priya', 'Lucas', 'Fatima', 'Noah',
+               'Elena', 'Kwame', 'Sofia', 'Hiroshi', 'Amara', 'Mateo']
+LAST_NAMES = ['Garcia', 'Smith', 'Khan', 'Wei', 'Petrova', 'Brown', 'Sharma', 'Silva', 'Haddad', 'Miller',
+              'Okafor', 'Novak', 'Tanaka', 'Rossi', 'Jensen', 'Moreau']
+TITLES = ['Software Engineer', 'Senior Software Engineer', 'Data Engineer', 'Backend Developer',
+          'Platform Engineer', 'Machine Learning Engineer', 'Engineering Manager', 'Frontend Developer']
+COMPANIES = ['Northwind Systems', 'Contoso Analytics', 'Fabrikam Labs', 'Globex Corporation',
+             'Initech', 'Umbrella Health', 'Stark Logistics', 'Wayne Financial']
+ACTIVITIES = [
+    'Built document processing services in {0} and {1} running on Kubernetes.',
+    'Reduced API latency by caching results in {0} and batching writes to {1}.',
+    'Maintained reporting pipelines with {0}, Airflow and {1}.',
+    'Led the migration of a monolith to {0} microservices deployed with {1}.',
+    'Designed event-driven ingestion on {0} with {1} for downstream analytics.',
+    'Mentored four engineers and introduced code review standards for {0} and {1}.',
+]
+SKILLS = ['Python', 'Go', 'Java', 'TypeScript', 'React', 'PostgreSQL', 'Redis', 'Kafka', 'Docker',
+          'Kubernetes', 'Terraform', 'AWS', 'GCP', 'Spark', 'Django', 'Flask', 'GraphQL', 'Rust']
+DEGREES = ['BSc Computer Science', 'MSc Software Engineering', 'BEng Electrical Engineering',
+           'MSc Data Science', 'BA Mathematics']
+
+
+class CorpusDocument(NamedTuple):
+    """One generated resume and the contact fields it contains."""
+    filename: str
+    file_type: str
+    layout: str
+    pages: int
+    data: bytes
+    truth: Dict[str, str]
+
+
+def contact_fields(rng: random.Random, index: int) -> Dict[str, str]:
+    """Name, email and phone (digits only, as the parsers return it) for one resume."""
+    first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+    phone = f"{rng.randint(201, 989)}{rng.randint(200, 989)}{rng.randint(1000, 9999)}"
+    return {
+        "name": f"{first} {last}",
+        "email": f"{first.lower()}.{last.lower()}{index}@example.com",
+        "phone": phone
+    }
+
+
+def phone_text(phone: str, rng: random.Random) -> str:
+    """The phone number as printed, in one of the common US formats."""
+    return rng.choice((f"({phone[:3]}) {phone[3:6]}-{phone[6:]}",
+                       f"{phone[:3]}-{phone[3:6]}-{phone[6:]}",
+                       f"{phone[:3]}.{phone[3:6]}.{phone[6:]}"))
+
+
+def body_lines(rng: random.Random, lines: int) -> List[str]:
+    """Experience, education and skills sections filling about `lines` lines."""
+    body = ["Summary", f"{rng.choice(TITLES)} with {rng.randint(2, 18)} years of experience in "
+                       f"{rng.choice(SKILLS)} and {rng.choice(SKILLS)}.", "Experience"]
+    year = 2024
+    while len(body) < lines - 6:
+        start = year - rng.randint(1, 4)
+        body.append(f"{rng.choice(TITLES)}, {rng.choice(COMPANIES)} ({start} - {year})")
+        for _ in range(rng.randint(2, 4)):
+            body.append(rng.choice(ACTIVITIES).format(*rng.sample(SKILLS, 2)))
+        year = start
+    body += ["Education", f"{rng.choice(DEGREES)}, State University ({year - 4} - {year})",
+             "Skills", ', '.join(rng.sample(SKILLS, 8))]
+    return body
+
+
+def _word_runs(lines: Sequence[str], size: float = 10.5, x: float = 54, top: float = 740,
+               leading: float = 14) -> List[TextRun]:
+    """Place every word separately, with no space characters in the content stream."""
+    runs = []
+    for index, line in enumerate(lines):
+        cursor = x
+        for word in line.split(' '):
+            runs.append((cursor, top - index * leading, size, word))
+            cursor += size * CHAR_ADVANCE * (len(word) + 1)
+    return runs
+
+
+def _pdf_pages(layout: str, header: List[str], pages: List[List[str]], skills: List[str]) -> List[List[TextRun]]:
+    """Text runs per page for one PDF layout; `header` is [name, contact line]."""
+    if layout == 'single-column':
+        return [lines_to_runs((header if number == 0 else []) + lines) for number, lines in enumerate(pages)]
+    if layout == 'positioned-words':
+        return [_word_runs((header if number == 0 else []) + lines) for number, lines in enumerate(pages)]
+    if layout == 'banner':
+        name, contact = header
+        width = len(name) * 20 * CHAR_ADVANCE
+        first = [((PAGE_WIDTH - width) / 2, 740, 20, name), (54, 716, 8.5, contact)]
+        return [first + lines_to_runs(pages[0], top=690)] + [lines_to_runs(lines) for lines in pages[1:]]
+    if layout == 'contact-footer':
+        first = [(54, 740, 16, header[0])] + lines_to_runs(pages[0], top=716) + [(54, 40, 8.5, header[1])]
+        return [first] + [lines_to_runs(lines) for lines in pages[1:]]
+    if layout == 'two-column':
+        email, phone = header[1].split(' | ')
+        sidebar = ["Contact", email, phone, "", "Skills"] + skills
+        first = ([(54, 750, 16, header[0])] + lines_to_runs([line[:60] for line in pages[0]], top=720)
+                 + lines_to_runs(sidebar, size=9, x=430, top=720))
+        return [first] + [lines_to_runs(lines) for lines in pages[1:]]
+    raise ValueError(f"Unknown layout: {layout}")
+
+
+def build_document(index: int, rng: random.Random) -> CorpusDocument:
+    """Generate document number `index` from the corpus random stream."""
+    truth = contact_fields(rng, index)
+    pages = rng.choice(PAGE_CHOICES)
+    contact_line = f"{truth['email']} | {phone_text(truth['phone'], rng)}"
+    body = body_lines(rng, pages * LINES_PER_PAGE - 2)
+    skills = rng.sample(SKILLS, 6)
+
+    if rng.random() < 0.25:
+        layout = rng.choice(DOCX_LAYOUTS)
+        paragraphs = [truth['name'], contact_line] + body
+        breaks = range(LINES_PER_PAGE, len(paragraphs), LINES_PER_PAGE) if layout == 'docx-long' else ()
+        data = make_docx(paragraphs, breaks)
+        return CorpusDocument(f"resume_{index:05d}.docx", DOCX_MIME, layout, pages, data, truth)
+
+    layout = rng.choice(PDF_LAYOUTS)
+    per_page = [body[start:start + LINES_PER_PAGE] for start in range(0, len(body), LINES_PER_PAGE)]
+    data = make_pdf(_pdf_pages(layout, [truth['name'], contact_line], per_page, skills))
+    return CorpusDocument(f"resume_{index:05d}.pdf", PDF_MIME, layout, len(per_page), data, truth)
+
+
+def build_corpus(documents: int = 120, seed: int = 2024) -> List[CorpusDocument]:
+    """The first `documents` resumes of the corpus for `seed`."""
+    rng = random.Random(seed)
+    return [build_document(index, rng) for index in range(documents)]
+
+
+def corpus_digest(corpus: Sequence[CorpusDocument]) -> str:
+    """SHA-256 over every document's bytes, to check two runs used the same corpus."""
+    digest = hashlib.sha256()
+    for document in corpus:
+        digest.update(document.data)
+    return digest.hexdigest()
+
+
+def describe(corpus: Sequence[CorpusDocument]) -> Dict[str, object]:
+    """Corpus size and mix, stored alongside benchmark results."""
+    layouts: Dict[str, int] = {}
+    for document in corpus:
+        layouts[document.layout] = layouts.get(document.layout, 0) + 1
+    return {
+        "documents": len(corpus),
+        "bytes": sum(len(document.data) for document in corpus),
+        "pages": sum(document.pages for document in corpus),
+        "layouts": dict(sorted(layouts.items())),
+        "sha256": corpus_digest(corpus)
+    }
+
+
+def write_corpus(corpus: Sequence[CorpusDocument], directory: str) -> None:
+    """Write every document and a manifest.json with layouts and expected fields."""
+    os.makedirs(directory, exist_ok=True)
+    manifest = []
+    for document in corpus:
+        with open(os.path.join(directory, document.filename), 'wb') as handle:
+            handle.write(document.data)
+        manifest.append({
+            "filename": document.filename,
+            "file_type": document.file_type,
+            "layout": document.layout,
+            "pages": document.pages,
+            "bytes": len(document.data),
+            **document.truth
+        })
+    with open(os.path.join(directory, 'manifest.json'), 'w', encoding='utf-8') as handle:
+        json.dump(manifest, handle, indent=2)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('directory')
+    parser.add_argument('--documents', type=int, default=120)
+    parser.add_argument('--seed', type=int, default=2024)
+    args = parser.parse_args()
+
+    corpus = build_corpus(args.documents, args.seed)
+    write_corpus(corpus, args.directory)
+    print(json.dumps(describe(corpus), indent=2))
+
+
+if __name__ == '__main__':
+    main()
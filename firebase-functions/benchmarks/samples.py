@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Sample Documents
+Dependency-free writers for small text PDFs and DOCX files used by the benchmarks.
+"""
+
+import io
+import zipfile
+from typing import List, Sequence, Tuple
+from xml.sax.saxutils import escape
+
+PAGE_WIDTH = 612
+PAGE_HEIGHT = 792
+
+# (x, y, font size, text) in PDF points, y measured from the bottom of the page
+TextRun = Tuple[float, float, float, str]
+
+
+def _escape(text: str) -> str:
+    return text.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+
+
+def make_pdf(pages: Sequence[Sequence[TextRun]]) -> bytes:
+    """Build a PDF whose pages contain the given Helvetica text runs."""
+    objects: List[bytes] = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"",  # page tree, filled in below
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>",
+    ]
+    kids = []
+    for runs in pages:
+        content = ' '.join(
+            f"BT /F1 {size:g} Tf {x:g} {y:g} Td ({_escape(text)}) Tj ET" for x, y, size, text in runs
+        ).encode('latin-1', 'replace')
+        page_number = len(objects) + 1
+        kids.append(f"{page_number} 0 R")
+        objects.append(
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 {PAGE_WIDTH} {PAGE_HEIGHT}] "
+            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {page_number + 1} 0 R >>".encode()
+        )
+        objects.append(b"<< /Length %d >>\nstream\n" % len(content) + content + b"\nendstream")
+    objects[1] = f"<< /Type /Pages /Kids [{' '.join(kids)}] /Count {len(pages)} >>".encode()
+
+    output = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(output))
+        output += f"{number} 0 obj\n".encode() + body + b"\nendobj\n"
+    xref = len(output)
+    output += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    output += b"".join(f"{offset:010d} 00000 n \n".encode() for offset in offsets)
+    output += (f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\n"
+               f"startxref\n{xref}\n%%EOF\n").encode()
+    return bytes(output)
+
+
+def lines_to_runs(lines: Sequence[str], size: float = 10.5, x: float = 54, top: float = 740,
+                  leading: float = 14) -> List[TextRun]:
+    """Lay out plain lines top to bottom in a single column."""
+    return [(x, top - index * leading, size, line) for index, line in enumerate(lines)]
+
+
+def make_text_pdf(pages: Sequence[Sequence[str]]) -> bytes:
+    """Single-column PDF with one list of lines per page."""
+    return make_pdf([lines_to_runs(lines) for lines in pages])
+
+
+def sample_resume_pdf() -> bytes:
+    """One-page resume with all contact fields."""
+    return make_text_pdf([[
+        "Maria Garcia",
+        "maria.garcia@example.com | +1 (415) 555-0142",
+        "Summary",
+        "Backend engineer working with Python, PostgreSQL and AWS.",
+        "Experience",
+        "Senior Engineer, Acme Corp (2019-2024)",
+        "Built document processing services in Python and Docker.",
+        "Education",
+        "BSc Computer Science, State University",
+    ]])
+
+
+DOCX_CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/word/document.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+    '</Types>'
+)
+DOCX_RELATIONSHIPS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Target="word/document.xml" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument"/>'
+    '</Relationships>'
+)
+
+
+def make_docx(paragraphs: Sequence[str], page_breaks: Sequence[int] = ()) -> bytes:
+    """DOCX with one paragraph per line and a page break before the given paragraph indexes."""
+    body = []
+    breaks = set(page_breaks)
+    for index, text in enumerate(paragraphs):
+        page_break = '<w:r><w:br w:type="page"/></w:r>' if index in breaks else ''
+        body.append(f'<w:p>{page_break}<w:r><w:t xml:space="preserve">{escape(text)}</w:t></w:r></w:p>')
+    document = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+        f'<w:body>{"".join(body)}</w:body></w:document>'
+    )
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as package:
+        # Fixed timestamps keep the bytes identical between runs
+        for name, xml in (('[Content_Types].xml', DOCX_CONTENT_TYPES), ('_rels/.rels', DOCX_RELATIONSHIPS),
+                          ('word/document.xml', document)):
+            package.writestr(zipfile.ZipInfo(name, date_time=(2024, 1, 1, 0, 0, 0)), xml,
+                              compress_type=zipfile.ZIP_DEFLATED)
+    return buffer.getvalue()
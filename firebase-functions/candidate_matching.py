@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+"""
+Candidate Matching
+Scores job descriptions against every stored candidate with one sparse
+matrix-vector product.
+
+Each candidate is a row of skill weights built from the ranked skill list
+that ResumeParserAgent._extract_skills returns (most-mentioned first, weight
+1 / log2(rank + 2)), normalized to unit length. The rows are kept in
+compressed sparse row (CSR) form: `data` holds the weights, `indices` the
+skill columns and `indptr` where each candidate's row starts.
+
+A job description goes through the same SkillMatcher, and each of its skills
+is weighted by inverse document frequency over the stored candidates, so
+rare skills count for more than ones every candidate lists. Scoring selects
+the non-zeros in the job's skill columns, multiplies them by the job weights
+and sums them per row with np.bincount, then np.argpartition picks the top
+candidates. Several jobs are scored in the same pass.
+
+The NumPy copies of the CSR arrays are kept between queries and only the
+rows added since the last query are copied in (the buffers grow by
+doubling), so a /match after an add costs the new rows, not the whole
+matrix. A replaced candidate's old row stays behind as a tombstone; once
+tombstones pass COMPACT_DELETED_RATIO of the rows the matrix is rebuilt
+without them.
+
+Requires NumPy; without it the matcher reports itself unavailable.
+"""
+
+import math
+import logging
+import threading
+from array import array
+from typing import Dict, Any, Iterable, List, Sequence, Tuple
+
+from lazy_imports import module_available, load_module
+
+NUMPY_AVAILABLE = module_available('numpy')
+
+# Rebuild the matrix without replaced rows once they are this share of all
+# rows, and at least COMPACT_MIN_DELETED of them
+COMPACT_DELETED_RATIO = 0.25
+COMPACT_MIN_DELETED = 1024
+
+
+def skill_weights(skills: Sequence[str]) -> List[Tuple[str, float]]:
+    """Rank-discounted weights for a most-mentioned-first skill list, normalized to unit length."""
+    unique = list(dict.fromkeys(skills))
+    weights = [1.0 / math.log2(rank + 2) for rank in range(len(unique))]
+    norm = math.sqrt(sum(weight * weight for weight in weights)) or 1.0
+    return [(skill, weight / norm) for skill, weight in zip(unique, weights)]
+
+
+def _append(np, buffer, values, used: int):
+    """Write `values` after the first `used` items of a buffer, doubling its capacity when full."""
+    needed = used + len(values)
+    if needed > len(buffer):
+        grown = np.empty(max(needed, 2 * len(buffer)), dtype=buffer.dtype)
+        grown[:used] = buffer[:used]
+        buffer = grown
+    buffer[used:needed] = values
+    return buffer
+
+
+class CandidateMatcher:
+    """
+    Candidate skill vectors in CSR form, scored against jobs with NumPy.
+    """
+
+    def __init__(self):
+        """Initialize an empty matrix; columns are added as new skills appear."""
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self._lock = threading.Lock()
+
+        # CSR rows, grown in place as candidates are added
+        self._data = array('f')
+        self._indices = array('I')
+        self._indptr = array('Q', [0])
+
+        self._columns: Dict[str, int] = {}
+        self._skill_names: List[str] = []
+        self._doc_ids: List[str] = []
+        self._rows: Dict[str, int] = {}
+        self._deleted: set = set()
+
+        # NumPy copies of the CSR arrays (data, indices, row_ids, indptr) with
+        # spare capacity, and the rows they cover; new rows are appended in place
+        self._buffers = None
+        self._synced_rows = 0
+        self._live = None
+        self._document_frequency = None
+        # Rows replaced since the buffers were last brought up to date
+        self._stale: List[int] = []
+        self._snapshot = None
+        self.queries = 0
+        self.compactions = 0
+
+    @property
+    def available(self) -> bool:
+        return NUMPY_AVAILABLE
+
+    def add(self, doc_id: str, skills: Sequence[str]) -> None:
+        """
+        Add or replace a candidate.
+
+        Args:
+            doc_id (str): Content address of the resume, see similarity_index.document_id()
+            skills (Sequence[str]): Skills, most mentioned first
+        """
+        with self._lock:
+            previous = self._rows.get(doc_id)
+            if previous is not None:
+                self._deleted.add(previous)
+                self._stale.append(previous)
+
+            for skill, weight in skill_weights(skills):
+                column = self._columns.get(skill)
+                if column is None:
+                    column = self._columns[skill] = len(self._skill_names)
+                    self._skill_names.append(skill)
+                self._indices.append(column)
+                self._data.append(weight)
+            self._indptr.append(len(self._data))
+
+            self._rows[doc_id] = len(self._doc_ids)
+            self._doc_ids.append(doc_id)
+            self._snapshot = None
+
+            if (len(self._deleted) >= COMPACT_MIN_DELETED
+                    and len(self._deleted) > COMPACT_DELETED_RATIO * len(self._doc_ids)):
+                self._compact()
+
+    def load(self, candidates: Iterable[Tuple[str, Sequence[str]]]) -> int:
+        """Add (doc_id, skills) pairs, e.g. from SearchIndex.profiles(); returns how many."""
+        count = 0
+        for doc_id, skills in candidates:
+            self.add(doc_id, skills)
+            count += 1
+        return count
+
+    def match(self, jobs: List[Sequence[str]], limit: int = 10) -> List[List[Dict[str, Any]]]:
+        """
+        Rank every candidate against one or more jobs.
+
+        Args:
+            jobs (List[Sequence[str]]): Each job's skills, e.g. SkillMatcher.match(job_description)
+            limit (int): Candidates returned per job
+
+        Returns:
+            List[List[Dict[str, Any]]]: Per job, the top candidates with document_id,
+            score (cosine of the idf-weighted job and candidate vectors) and matched_skills
+
+        Raises:
+            RuntimeError: If NumPy is not installed
+        """
+        if not NUMPY_AVAILABLE:
+            raise RuntimeError("NumPy is not installed; candidate matching is unavailable")
+        np = load_module('numpy')
+
+        with self._lock:
+            self.queries += 1
+            data, indices, row_ids, indptr, live, document_frequency = self._arrays(np)
+            columns = dict(self._columns)
+            doc_ids = self._doc_ids
+        candidates = len(live)
+        if not candidates or not jobs:
+            return [[] for _ in jobs]
+
+        # Job matrix (skills x jobs) with idf weights, unit length per job
+        idf = np.log((live.sum() + 1) / (document_frequency + 1)) + 1
+        job_matrix = np.zeros((len(columns), len(jobs)), dtype=np.float32)
+        for job, skills in enumerate(jobs):
+            for skill in dict.fromkeys(skills):
+                column = columns.get(skill)
+                if column is not None:
+                    job_matrix[column, job] = idf[column]
+        norms = np.linalg.norm(job_matrix, axis=0)
+        job_matrix /= np.where(norms > 0, norms, 1)
+
+        # Only non-zeros in columns some job asks for can contribute
+        selected = np.flatnonzero(job_matrix.any(axis=1)[indices])
+        contributions = data[selected, None] * job_matrix[indices[selected]]
+        selected_rows = row_ids[selected]
+
+        results = []
+        for job in range(len(jobs)):
+            scores = np.bincount(selected_rows, weights=contributions[:, job], minlength=candidates)
+            scores[~live] = 0.0
+            matched = int(np.count_nonzero(scores))
+            top_count = min(limit, matched)
+            if not top_count:
+                results.append([])
+                continue
+            top = np.argpartition(-scores, top_count - 1)[:top_count]
+            top = top[np.lexsort((top, -scores[top]))]
+            results.append([
+                {
+                    "document_id": doc_ids[row],
+                    "score": round(float(scores[row]), 4),
+                    "matched_skills": self._matched_skills(np, data, indices, indptr, row,
+                                                          job_matrix[:, job])
+                }
+                for row in top
+            ])
+        return results
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters reported on /health."""
+        with self._lock:
+            return {
+                "available": NUMPY_AVAILABLE,
+                "candidates": len(self._rows),
+                "skills": len(self._skill_names),
+                "nonzeros": len(self._data),
+                "replaced_rows": len(self._deleted),
+                "compactions": self.compactions,
+                "queries": self.queries
+            }
+
+    def _matched_skills(self, np, data, indices, indptr, row: int, job_vector) -> List[str]:
+        """Skills a candidate shares with the job, largest contribution first."""
+        start, end = indptr[row], indptr[row + 1]
+        columns = indices[start:end]
+        shared = job_vector[columns] > 0
+        contribution = data[start:end][shared] * job_vector[columns[shared]]
+        return [self._skill_names[column] for column in columns[shared][np.argsort(-contribution, kind='stable')]]
+
+    def _arrays(self, np):
+        """
+        NumPy views of the CSR arrays plus per-row liveness and column frequencies. Caller holds the lock.
+
+        Only rows added since the last call are copied. Earlier views stay
+        valid: buffers are written past their end or replaced, never rewritten.
+        """
+        if self._snapshot is not None:
+            return self._snapshot
+        if self._buffers is None:
+            self._buffers = (np.empty(0, dtype=np.float32), np.empty(0, dtype=np.int64),
+                             np.empty(0, dtype=np.int64), np.zeros(1, dtype=np.int64))
+            self._synced_rows = 0
+            self._live = np.empty(0, dtype=bool)
+            self._document_frequency = np.zeros(0, dtype=np.int64)
+
+        data, indices, row_ids, indptr = self._buffers
+        first_row, rows = self._synced_rows, len(self._doc_ids)
+        start, end = self._indptr[first_row], len(self._data)
+
+        new_indptr = np.array(self._indptr[first_row + 1:], dtype=np.int64)
+        data = _append(np, data, np.array(self._data[start:], dtype=np.float32), start)
+        indices = _append(np, indices, np.array(self._indices[start:], dtype=np.int64), start)
+        row_ids = _append(np, row_ids, np.repeat(np.arange(first_row, rows), np.diff(new_indptr, prepend=start)),
+                          start)
+        indptr = _append(np, indptr, new_indptr, first_row + 1)
+        self._buffers = (data, indices, row_ids, indptr)
+
+        # One flag per row and one count per skill: small enough to copy, so
+        # queries still running keep the versions they started with
+        live = np.concatenate((self._live, np.ones(rows - first_row, dtype=bool)))
+        document_frequency = np.bincount(indices[start:end], minlength=len(self._skill_names))
+        document_frequency[:len(self._document_frequency)] += self._document_frequency
+        for row in self._stale:
+            live[row] = False
+            np.subtract.at(document_frequency, indices[indptr[row]:indptr[row + 1]], 1)
+        self._stale = []
+        self._live, self._document_frequency, self._synced_rows = live, document_frequency, rows
+
+        self._snapshot = (data[:end], indices[:end], row_ids[:end], indptr[:rows + 1], live, document_frequency)
+        return self._snapshot
+
+    def _compact(self) -> None:
+        """Rebuild the CSR arrays without replaced rows. Caller holds the lock."""
+        data, indices, indptr = array('f'), array('I'), array('Q', [0])
+        doc_ids: List[str] = []
+        for row, doc_id in enumerate(self._doc_ids):
+            if row in self._deleted:
+                continue
+            start, end = self._indptr[row], self._indptr[row + 1]
+            data.extend(self._data[start:end])
+            indices.extend(self._indices[start:end])
+            indptr.append(len(data))
+            doc_ids.append(doc_id)
+
+        self.logger.info(f"Compacted candidate matrix: dropped {len(self._deleted)} replaced rows")
+        self._data, self._indices, self._indptr = data, indices, indptr
+        # New objects rather than in-place edits, so queries in flight keep their rows
+        self._doc_ids = doc_ids
+        self._rows = {doc_id: row for row, doc_id in enumerate(doc_ids)}
+        self._deleted = set()
+        self._stale = []
+        self._buffers = None
+        self._snapshot = None
+        self.compactions += 1
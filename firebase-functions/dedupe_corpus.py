@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Corpus Deduplication
+Batch mode for the near-duplicate index: extracts every PDF/DOCX under the
+given paths across a process pool, adds them to the similarity index and
+prints the groups of duplicate and near-duplicate resumes.
+
+Pointing --index at the file the service uses (SIMILARITY_INDEX_PATH) also
+compares the corpus with everything already parsed, and leaves the imported
+resumes in the index for later /similar lookups.
+
+Run with: python dedupe_corpus.py resumes/ [--index similarity.db] [--threshold 0.8] [--json]
+"""
+
+import os
+import sys
+import glob
+import json
+import time
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator, List, Optional, Tuple
+
+from batch_parser import available_cpus
+from uploads import guess_file_type, PDF_MIME, DOCX_MIME
+from text_extraction import extract_pdf_text, extract_docx_text
+from similarity_index import SimilarityIndex, document_id, minhash_signature, DEFAULT_THRESHOLD
+
+SUPPORTED_TYPES = (PDF_MIME, DOCX_MIME)
+
+
+def find_documents(paths: List[str]) -> List[str]:
+    """
+    Resume files named directly, matched by a glob or found under directories,
+    in a stable order. Globs and directories only contribute PDF/DOCX files.
+    """
+    found = []
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _, files in os.walk(path):
+                found.extend(os.path.join(root, name) for name in files
+                             if guess_file_type(name) in SUPPORTED_TYPES)
+        elif glob.has_magic(path):
+            for match in glob.glob(path, recursive=True):
+                if os.path.isdir(match):
+                    found.extend(find_documents([match]))
+                elif guess_file_type(match) in SUPPORTED_TYPES:
+                    found.append(match)
+        else:
+            found.append(path)
+    return sorted(set(found))
+
+
+def signature_for_file(path: str) -> Tuple[str, str, Optional[List[int]], str]:
+    """Pool task: (path, document_id, signature or None, error)."""
+    try:
+        with open(path, 'rb') as handle:
+            file_data = handle.read()
+        if guess_file_type(path) == PDF_MIME:
+            text = extract_pdf_text(file_data)
+        elif guess_file_type(path) == DOCX_MIME:
+            text = extract_docx_text(file_data)
+        else:
+            return path, '', None, "Unsupported file type"
+        if not text.strip():
+            return path, document_id(file_data), None, "Could not extract text from file"
+        return path, document_id(file_data), minhash_signature(text), ''
+    except Exception as e:
+        return path, '', None, str(e)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('paths', nargs='+', help='Resume files or directories')
+    parser.add_argument('--index', default=os.environ.get('SIMILARITY_INDEX_PATH'),
+                        help='SQLite index file (default: SIMILARITY_INDEX_PATH, else in memory)')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument('--workers', type=int, default=0, help='Extraction processes (default: available cores)')
+    parser.add_argument('--json', action='store_true', help='Print the groups as JSON')
+    args = parser.parse_args()
+
+    files = find_documents(args.paths)
+    if not files:
+        print("❌ No PDF or DOCX files found", file=sys.stderr)
+        sys.exit(1)
+
+    index = SimilarityIndex(args.index, args.threshold)
+    errors = []
+    start = time.perf_counter()
+
+    def signatures() -> Iterator[Tuple[str, List[int], str]]:
+        with ProcessPoolExecutor(max_workers=args.workers or available_cpus()) as pool:
+            for path, doc_id, signature, error in pool.map(signature_for_file, files, chunksize=4):
+                if signature is None:
+                    errors.append({"filename": path, "error": error})
+                    continue
+                yield doc_id, signature, path
+
+    groups = index.dedupe(signatures())
+    elapsed = time.perf_counter() - start
+
+    if args.json:
+        print(json.dumps({"groups": groups, "errors": errors}, indent=2))
+        return
+
+    duplicates = sum(len(group) - 1 for group in groups)
+    print(f"📄 {len(files)} files in {elapsed:.1f}s, {len(errors)} unreadable")
+    print(f"👯 {len(groups)} duplicate groups, {duplicates} redundant files (threshold {args.threshold:g})")
+    for number, group in enumerate(groups, start=1):
+        print(f"\nGroup {number}:")
+        for entry in group:
+            print(f"  {entry['document_id'][:12]}  {entry['filename']}")
+    for entry in errors:
+        print(f"⚠️  {entry['filename']}: {entry['error']}")
+
+
+if __name__ == '__main__':
+    main()
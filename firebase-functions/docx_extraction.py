@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Streaming DOCX Text Extraction
+Reads paragraph text straight from the XML parts of a DOCX package with
+ElementTree.iterparse, without building python-docx's object graph.
+
+Headers come first, then the document body, then footers. Table cells and
+text boxes are included: every w:p is emitted wherever it sits, and the
+legacy copy of a text box inside mc:Fallback is skipped so it is not read
+twice. Finished paragraphs and tables are dropped from the tree as soon as
+their text is out, and parts are decompressed as they are parsed, so memory
+does not grow with the document.
+"""
+
+import io
+import posixpath
+import zipfile
+import xml.etree.ElementTree as ET
+from typing import IO, Iterator, List
+
+# Transitional and Strict OOXML namespaces
+W_NAMESPACES = (
+    'http://schemas.openxmlformats.org/wordprocessingml/2006/main',
+    'http://purl.oclc.org/ooxml/wordprocessingml/main'
+)
+RELATIONSHIP_TYPES = (
+    'http://schemas.openxmlformats.org/officeDocument/2006/relationships/',
+    'http://purl.oclc.org/ooxml/officeDocument/relationships/'
+)
+PACKAGE_RELATIONSHIPS = '{http://schemas.openxmlformats.org/package/2006/relationships}Relationship'
+FALLBACK = '{http://schemas.openxmlformats.org/markup-compatibility/2006}Fallback'
+
+DEFAULT_DOCUMENT_PART = 'word/document.xml'
+
+
+def _tags(*names: str) -> frozenset:
+    return frozenset(f'{{{namespace}}}{name}' for namespace in W_NAMESPACES for name in names)
+
+
+PARAGRAPH = _tags('p')
+TEXT = _tags('t')
+TAB = _tags('tab')
+BREAK = _tags('br', 'cr')
+RUN = _tags('r')
+# Finished blocks removed from the tree once read
+RELEASED = _tags('p', 'tbl')
+
+
+def iter_docx_paragraphs(file_data: bytes) -> Iterator[str]:
+    """
+    Yield the text of every paragraph: headers, body (tables and text boxes
+    included), then footers.
+
+    Args:
+        file_data (bytes): Raw DOCX content
+
+    Raises:
+        Exception: If the data is not a DOCX package
+    """
+    try:
+        package = zipfile.ZipFile(io.BytesIO(file_data))
+    except zipfile.BadZipFile as e:
+        raise Exception(f"Not a DOCX file: {e}") from e
+
+    with package:
+        for name in docx_text_parts(package):
+            with package.open(name) as stream:
+                yield from iter_part_paragraphs(stream)
+
+
+def docx_text_parts(package: zipfile.ZipFile) -> List[str]:
+    """Names of the header, main document and footer parts, in reading order."""
+    names = set(package.namelist())
+    document = _relationship_targets(package, '_rels/.rels', '', 'officeDocument', names)
+    document_part = document[0] if document else DEFAULT_DOCUMENT_PART
+    if document_part not in names:
+        raise Exception("Not a DOCX file: no main document part")
+
+    folder = posixpath.dirname(document_part)
+    rels = posixpath.join(folder, '_rels', posixpath.basename(document_part) + '.rels')
+    headers = _relationship_targets(package, rels, folder, 'header', names)
+    footers = _relationship_targets(package, rels, folder, 'footer', names)
+    return headers + [document_part] + footers
+
+
+def _relationship_targets(package: zipfile.ZipFile, rels: str, folder: str, kind: str,
+                          names: set) -> List[str]:
+    """Parts a relationships file links with the given type, in file order."""
+    if rels not in names:
+        return []
+    types = {prefix + kind for prefix in RELATIONSHIP_TYPES}
+    with package.open(rels) as stream:
+        relationships = ET.parse(stream).getroot().iter(PACKAGE_RELATIONSHIPS)
+        targets = [relationship.get('Target', '') for relationship in relationships
+                   if relationship.get('Type') in types and relationship.get('TargetMode') != 'External']
+    parts = [posixpath.normpath(target.lstrip('/') if target.startswith('/') else posixpath.join(folder, target))
+             for target in targets]
+    return [part for part in parts if part in names]
+
+
+def iter_part_paragraphs(stream: IO[bytes]) -> Iterator[str]:
+    """
+    Yield the text of each w:p in one WordprocessingML part, in a single pass.
+
+    Runs contribute their w:t text, w:tab a tab and w:br/w:cr a line break.
+    A paragraph nested in a text box is yielded before the paragraph that
+    anchors it.
+    """
+    open_paragraphs: List[List[str]] = []
+    ancestors = []
+    skipping = 0
+
+    for event, element in ET.iterparse(stream, events=('start', 'end')):
+        tag = element.tag
+        if event == 'start':
+            if tag == FALLBACK:
+                skipping += 1
+            elif tag in PARAGRAPH and not skipping:
+                open_paragraphs.append([])
+            ancestors.append(element)
+            continue
+
+        ancestors.pop()
+        parent = ancestors[-1] if ancestors else None
+        if tag == FALLBACK:
+            skipping -= 1
+        elif skipping or not open_paragraphs:
+            pass
+        elif tag in TEXT:
+            if element.text:
+                open_paragraphs[-1].append(element.text)
+        elif tag in TAB or tag in BREAK:
+            # Tab stops in paragraph properties are also w:tab; only runs hold text
+            if parent is not None and parent.tag in RUN:
+                open_paragraphs[-1].append('\t' if tag in TAB else '\n')
+        elif tag in PARAGRAPH:
+            yield ''.join(open_paragraphs.pop())
+
+        if tag in RELEASED and parent is not None:
+            element.clear()
+            parent.remove(element)
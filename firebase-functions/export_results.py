@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Bulk Result Export / Import
+Moves parse results in and out of columnar files without going through the
+JSON API one record at a time.
+
+export: writes the results in the parse cache's disk tier (PARSE_CACHE_PATH),
+or a saved batch response / JSON Lines file, to Parquet, Arrow IPC or JSON
+Lines in bounded row groups.
+
+import: reads such a file back batch by batch for offline re-scoring, either
+into a search index file (so /search and /match serve the imported
+candidates) or straight into candidate matching against job descriptions.
+
+Run with:
+    python export_results.py export results.parquet [--cache parse_cache.db] [--parser ResumeParserAgent]
+    python export_results.py export results.arrow --from-batch batch_response.json
+    python export_results.py import results.parquet [--search-index search.db] [--match "python aws ..."]
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+from typing import Any, Dict, List
+
+from parse_cache import iter_entries
+from result_export import (ResultWriter, iter_record_batches, iter_batch_output, cached_results,
+                           FORMATS, DEFAULT_ROW_GROUP_SIZE)
+
+
+def export_command(args) -> Dict[str, Any]:
+    """Write cached or batch results to args.output."""
+    with ResultWriter(args.output, args.format, args.row_group_size) as writer:
+        if args.from_batch:
+            for path in args.from_batch:
+                writer.write_all(iter_batch_output(path), args.parser or '')
+        else:
+            if not args.cache:
+                raise ValueError("No source: pass --cache (or set PARSE_CACHE_PATH) or --from-batch")
+            for parser, version, result in cached_results(iter_entries(args.cache, args.parser)):
+                writer.write(result, parser, version)
+    return {"path": args.output, "format": writer.format, "rows": writer.rows, "row_groups": writer.row_groups}
+
+
+def import_command(args) -> Dict[str, Any]:
+    """Load an export into a search index and/or score it against jobs."""
+    search_index = matcher = None
+    if args.search_index:
+        from search_index import SearchIndex
+        search_index = SearchIndex(args.search_index, flush_every=args.batch_size)
+    if args.match:
+        from candidate_matching import CandidateMatcher
+        matcher = CandidateMatcher()
+        if not matcher.available:
+            raise RuntimeError("NumPy is not installed; --match is unavailable")
+
+    rows = skipped = 0
+    profiles: Dict[str, Dict[str, Any]] = {}
+    for batch in iter_record_batches(args.input, args.format, args.batch_size):
+        for result in batch:
+            rows += 1
+            doc_id = result.get('document_id')
+            if not doc_id or result.get('_fallback'):
+                skipped += 1
+                continue
+            if search_index is not None:
+                search_index.add(doc_id, result)
+            if matcher is not None:
+                matcher.add(doc_id, result.get('skills') or [])
+                profiles[doc_id] = {field: result.get(field, '') for field in ('name', 'email', 'filename')}
+    if search_index is not None:
+        search_index.flush()
+
+    summary: Dict[str, Any] = {"path": args.input, "rows": rows, "skipped": skipped}
+    if search_index is not None:
+        summary["search_index"] = search_index.stats()
+    if matcher is not None:
+        from skill_matcher import get_skill_matcher
+        skill_matcher = get_skill_matcher()
+        jobs: List[List[str]] = [skill_matcher.match(description) for description in args.match]
+        summary["jobs"] = [
+            {"description": description, "skills": skills,
+             "results": [{**match, **profiles[match["document_id"]]} for match in matches]}
+            for description, skills, matches in zip(args.match, jobs, matcher.match(jobs, args.limit))
+        ]
+    return summary
+
+
+def print_summary(summary: Dict[str, Any]) -> None:
+    """Human-readable output for either command."""
+    if "row_groups" in summary:
+        print(f"📦 Wrote {summary['rows']} results to {summary['path']} "
+              f"({summary['format']}, {summary['row_groups']} row groups) in {summary['seconds']:.1f}s")
+        return
+    print(f"📥 Read {summary['rows']} results from {summary['path']} in {summary['seconds']:.1f}s "
+          f"({summary['skipped']} without a profile skipped)")
+    if "search_index" in summary:
+        print(f"🔎 Search index now holds {summary['search_index']['documents']} documents")
+    for job in summary.get("jobs", []):
+        print(f"\n🎯 {job['description'][:60]}  [{', '.join(job['skills'])}]")
+        for match in job["results"]:
+            print(f"  {match['score']:.3f}  {match['name'] or '-':<24} {match['filename']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    export = commands.add_parser('export', help='Write parse results to a columnar file')
+    export.add_argument('output', help='.parquet, .arrow or .jsonl file')
+    export.add_argument('--cache', default=os.environ.get('PARSE_CACHE_PATH'),
+                        help='Parse cache SQLite file (default: PARSE_CACHE_PATH)')
+    export.add_argument('--from-batch', nargs='+', metavar='FILE',
+                        help='Saved /parse-resumes responses or JSON Lines files instead of the cache')
+    export.add_argument('--parser', default=None,
+                        help='Only this parser\'s cache rows, e.g. ResumeParserAgent; recorded with batch rows')
+    export.add_argument('--row-group-size', type=int, default=DEFAULT_ROW_GROUP_SIZE)
+
+    load = commands.add_parser('import', help='Read an export back for re-scoring')
+    load.add_argument('input', help='.parquet, .arrow or .jsonl file')
+    load.add_argument('--search-index', default=None, help='Add the profiles to this search index file')
+    load.add_argument('--match', nargs='+', metavar='JOB', help='Job descriptions to rank the profiles against')
+    load.add_argument('--limit', type=int, default=10, help='Candidates shown per job')
+    load.add_argument('--batch-size', type=int, default=DEFAULT_ROW_GROUP_SIZE)
+
+    for command in (export, load):
+        command.add_argument('--format', choices=FORMATS, default=None, help='Default: from the file extension')
+        command.add_argument('--json', action='store_true', help='Print the summary as JSON')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    try:
+        summary = export_command(args) if args.command == 'export' else import_command(args)
+    except (ValueError, RuntimeError, OSError) as e:
+        print(f"❌ {e}", file=sys.stderr)
+        sys.exit(1)
+    summary["seconds"] = round(time.perf_counter() - start, 3)
+
+    if args.json:
+        print(json.dumps(summary, indent=2))
+    else:
+        print_summary(summary)
+
+
+if __name__ == '__main__':
+    main()
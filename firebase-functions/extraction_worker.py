@@ -0,0 +1,324 @@
+#!/usr/bin/env python3
+"""
+Supervised Extraction Workers
+Runs PDF/DOCX text extraction in child processes with a wall-clock timeout
+and an address-space limit, so a malformed or hostile document can only
+cost one worker instead of a request thread or the whole server. Workers
+that time out, crash or run out of memory are killed and replaced on the
+next call, and the caller gets an exception it can turn into a _fallback
+response.
+
+Configuration (environment variables):
+    EXTRACTION_WORKERS       Worker processes per server process (default 4, 0 runs in-process)
+    EXTRACTION_TIMEOUT       Seconds allowed per document (default 30)
+    EXTRACTION_MEMORY_MB     Address space a worker may add on top of its
+                             starting size (default 1024, 0 for no limit)
+
+A stage known to be slow can ask for more time from inside the worker with
+extend_deadline(); OCR does so with its own OCR_TIMEOUT budget.
+"""
+
+import os
+import time
+import logging
+import threading
+import multiprocessing
+from typing import Any, Callable, Dict, List, Optional
+
+try:
+    import resource
+    RESOURCE_AVAILABLE = True
+except ImportError:
+    RESOURCE_AVAILABLE = False
+
+import metrics
+from metrics import EXTRACTION_WORKER_RESTARTS
+
+# Fork so workers start with the parent's already-imported PDF libraries
+_CONTEXT = multiprocessing.get_context('fork' if 'fork' in multiprocessing.get_all_start_methods() else None)
+
+REPLY_OK = 'ok'
+REPLY_ERROR = 'error'
+REPLY_OUT_OF_MEMORY = 'oom'
+REPLY_EXTEND = 'extend'
+
+# The worker's end of its pipe, set in worker processes only
+_worker_conn = None
+
+
+class ExtractionError(Exception):
+    """Raised when a document could not be extracted in a worker."""
+
+
+class ExtractionTimeout(ExtractionError):
+    """The worker exceeded the per-document time limit and was killed."""
+
+
+class WorkerCrashed(ExtractionError):
+    """The worker died (signal, hard memory limit) before replying."""
+
+
+def _address_space_bytes() -> int:
+    """Current virtual memory size of this process."""
+    try:
+        with open('/proc/self/status') as handle:
+            for line in handle:
+                if line.startswith('VmSize:'):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return 0
+
+
+def _apply_memory_limit(memory_limit_mb: int) -> None:
+    """Cap this process's address space at its current size plus the budget."""
+    if not RESOURCE_AVAILABLE or memory_limit_mb <= 0:
+        return
+    limit = _address_space_bytes() + memory_limit_mb * 1024 * 1024
+    resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+
+def extend_deadline(seconds: float) -> None:
+    """
+    Ask the supervisor for at least `seconds` more before this call is timed out.
+
+    Called from inside an extraction function before a stage with its own,
+    longer budget (OCR). Does nothing when the call runs in-process.
+    """
+    if _worker_conn is not None:
+        _worker_conn.send((REPLY_EXTEND, seconds, []))
+
+
+def _worker_main(conn, memory_limit_mb: int) -> None:
+    """Child loop: run (func, args) requests until the pipe closes."""
+    global _worker_conn
+    _worker_conn = conn
+    _apply_memory_limit(memory_limit_mb)
+    metrics.start_journal()
+
+    while True:
+        try:
+            message = conn.recv()
+        except (EOFError, OSError):
+            return
+        if message is None:
+            return
+
+        func, args = message
+        try:
+            reply = (REPLY_OK, func(*args))
+        except MemoryError:
+            reply = (REPLY_OUT_OF_MEMORY, f"Document exceeded the {memory_limit_mb} MB memory limit")
+        except Exception as e:
+            reply = (REPLY_ERROR, str(e))
+
+        try:
+            conn.send(reply + (metrics.drain_journal(),))
+        except Exception as e:
+            # Result could not be pickled; report that instead
+            conn.send((REPLY_ERROR, f"Could not return extraction result: {e}", metrics.drain_journal()))
+
+        if reply[0] == REPLY_OUT_OF_MEMORY:
+            return
+
+
+class _Worker:
+    """One child process and the parent's end of its pipe."""
+
+    def __init__(self, memory_limit_mb: int):
+        self.conn, child_conn = _CONTEXT.Pipe()
+        self.process = _CONTEXT.Process(
+            target=_worker_main, args=(child_conn, memory_limit_mb), name='extraction-worker', daemon=True
+        )
+        self.process.start()
+        child_conn.close()
+
+    def kill(self) -> None:
+        self.conn.close()
+        if self.process.is_alive():
+            self.process.kill()
+        self.process.join(timeout=5)
+
+    def stop(self) -> None:
+        try:
+            self.conn.send(None)
+        except OSError:
+            pass
+        self.conn.close()
+        self.process.join(timeout=1)
+        if self.process.is_alive():
+            self.process.kill()
+
+
+class SupervisedExtractor:
+    """
+    Pool of extraction worker processes with per-call timeouts.
+    """
+
+    def __init__(self, max_workers: int = 4, timeout: float = 30.0, memory_limit_mb: int = 1024):
+        """
+        Args:
+            max_workers (int): Concurrent worker processes; 0 runs calls in-process
+            timeout (float): Seconds a single call may take before its worker is killed
+            memory_limit_mb (int): Address-space budget per worker (RLIMIT_AS), 0 for none
+        """
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.memory_limit_mb = memory_limit_mb
+
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(max(max_workers, 1))
+        self._idle: List[_Worker] = []
+        self._busy = 0
+        self._restarts = 0
+        self._pid = os.getpid()
+
+    @classmethod
+    def from_env(cls, worker_limit: Optional[int] = None) -> "SupervisedExtractor":
+        """
+        Build an extractor configured from the EXTRACTION_* environment variables.
+
+        Args:
+            worker_limit (int): Cap on EXTRACTION_WORKERS, e.g. 1 in a process
+                that only ever extracts one document at a time
+        """
+        max_workers = int(os.environ.get('EXTRACTION_WORKERS', 4))
+        if worker_limit is not None:
+            max_workers = min(max_workers, worker_limit)
+        return cls(
+            max_workers=max_workers,
+            timeout=float(os.environ.get('EXTRACTION_TIMEOUT', 30)),
+            memory_limit_mb=int(os.environ.get('EXTRACTION_MEMORY_MB', 1024))
+        )
+
+    def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        """
+        Call a module-level function in a worker process.
+
+        Args:
+            func (Callable): Picklable function, e.g. text_extraction.scan_pdf_fields
+            *args: Picklable arguments
+
+        Returns:
+            Any: The function's return value
+
+        Raises:
+            ExtractionTimeout: If the call took longer than the timeout
+            WorkerCrashed: If the worker died before replying
+            ExtractionError: If the function raised or ran out of memory
+        """
+        if self.max_workers <= 0:
+            return func(*args)
+
+        self._check_fork()
+        with self._slots:
+            worker = self._checkout()
+            try:
+                started = time.monotonic()
+                worker.conn.send((func, args))
+                reply = self._wait_for_reply(worker, started + self.timeout)
+            except (EOFError, OSError) as e:
+                self._discard(worker, 'crash')
+                raise WorkerCrashed(f"Extraction worker crashed (exit code {worker.process.exitcode})") from e
+            except BaseException:
+                self._discard(worker, 'interrupted')
+                raise
+
+            if reply is None:
+                self._discard(worker, 'timeout')
+                raise ExtractionTimeout(f"Extraction timed out after {time.monotonic() - started:.0f}s")
+
+            status, payload, journal = reply
+            metrics.replay(journal)
+            if status == REPLY_OUT_OF_MEMORY:
+                self._discard(worker, 'memory')
+                raise ExtractionError(payload)
+
+            self._checkin(worker)
+            if status == REPLY_ERROR:
+                raise ExtractionError(payload)
+            return payload
+
+    @staticmethod
+    def _wait_for_reply(worker: _Worker, deadline: float) -> Optional[tuple]:
+        """The worker's reply, or None once the deadline passes; extend_deadline() moves it later."""
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not worker.conn.poll(remaining):
+                return None
+            reply = worker.conn.recv()
+            if reply[0] != REPLY_EXTEND:
+                return reply
+            deadline = max(deadline, time.monotonic() + reply[1])
+
+    def stats(self) -> Dict[str, Any]:
+        """Pool counters reported on /health."""
+        with self._lock:
+            return {
+                "isolated": self.max_workers > 0,
+                "workers": self.max_workers,
+                "busy": self._busy,
+                "idle": len(self._idle),
+                "restarts": self._restarts,
+                "timeout_seconds": self.timeout,
+                "memory_limit_mb": self.memory_limit_mb
+            }
+
+    def shutdown(self) -> None:
+        """Stop idle workers; busy ones are killed when their call returns."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for worker in idle:
+            worker.stop()
+
+    def _check_fork(self) -> None:
+        """After a fork (e.g. into a batch worker) the inherited workers belong to the parent."""
+        with self._lock:
+            if self._pid != os.getpid():
+                self._pid = os.getpid()
+                self._slots = threading.BoundedSemaphore(max(self.max_workers, 1))
+                self._idle = []
+                self._busy = 0
+
+    def _checkout(self) -> _Worker:
+        """Take an idle worker or start a new one. Caller holds a slot."""
+        with self._lock:
+            self._busy += 1
+            while self._idle:
+                worker = self._idle.pop()
+                if worker.process.is_alive():
+                    return worker
+        try:
+            return _Worker(self.memory_limit_mb)
+        except Exception:
+            with self._lock:
+                self._busy -= 1
+            raise
+
+    def _checkin(self, worker: _Worker) -> None:
+        with self._lock:
+            self._busy -= 1
+            self._idle.append(worker)
+
+    def _discard(self, worker: _Worker, reason: str) -> None:
+        """Kill a worker that can no longer be trusted; the next call starts a fresh one."""
+        self.logger.warning(f"Replacing extraction worker {worker.process.pid} ({reason})")
+        worker.kill()
+        EXTRACTION_WORKER_RESTARTS.inc(reason=reason)
+        with self._lock:
+            self._busy -= 1
+            self._restarts += 1
+
+
+_default_extractor: Optional[SupervisedExtractor] = None
+_default_lock = threading.Lock()
+
+
+def get_extractor() -> SupervisedExtractor:
+    """Process-wide extractor configured from the environment, created on first use."""
+    global _default_extractor
+    with _default_lock:
+        if _default_extractor is None:
+            _default_extractor = SupervisedExtractor.from_env()
+        return _default_extractor
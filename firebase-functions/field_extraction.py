@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Field Extraction Engine
+Shared name/email/phone extraction used by every parser app.
+
+All patterns are compiled once at import. Text is consumed in a single
+forward pass: email and phone are each located by one compiled search, and
+the name heuristics only ever look at the first few non-empty lines, so the
+rest of the document is never split into lines. The scanner can be fed one
+page at a time.
+"""
+
+import re
+from typing import Dict, Optional
+
+# Email address
+EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+
+# Phone number: optional +1, then grouped 3-3-4 digits. This is the first of the
+# legacy patterns, and the only one that ever decided the result: the other two
+# (any 1-3 digit country code, a bare 10-15 digit run) can only match where it
+# matches too, and it is searched over the whole text first. Folding them into
+# one alternation changed output ("919876543210" became 12 digits, not 10).
+# The leading lookahead lets the scanner skip positions that cannot start a number.
+PHONE_RE = re.compile(r'(?=[+(0-9])(?:\+?1[-.\s]?)?\(?[0-9]{3}\)?[-.\s]?[0-9]{3}[-.\s]?[0-9]{4}')
+NON_DIGIT_RE = re.compile(r'\D')
+
+# First Last, First M. Last, First Middle Last, First Middle Middle Last
+NAME_RE = re.compile(r'[A-Z][a-z]+(?: [A-Z]\. [A-Z][a-z]+| [A-Z][a-z]+(?: [A-Z][a-z]+){0,2})')
+
+# Lines containing contact details or common resume headers are never names
+NAME_EXCLUDE_RE = re.compile('|'.join(re.escape(keyword) for keyword in [
+    '@', 'phone', 'email', 'tel', 'fax', 'linkedin', 'github', 'portfolio',
+    'resume', 'cv', 'curriculum', 'vitae', 'objective', 'summary',
+    'experience', 'education', 'skills', 'projects', 'contact'
+]), re.IGNORECASE)
+
+# Looser fallback check: anything that is plainly contact information
+NAME_FALLBACK_EXCLUDE_RE = re.compile(r'@|phone|email|tel', re.IGNORECASE)
+
+LINE_RE = re.compile(r'[^\n]+')
+
+# Strict name patterns are tried on this many non-empty lines, the fallback on fewer
+NAME_LINES = 15
+NAME_FALLBACK_LINES = 10
+
+
+class FieldScanner:
+    """
+    Incremental name/email/phone extractor.
+
+    Feed text in document order (whole documents or one page at a time)
+    and read the fields back with result().
+    """
+
+    def __init__(self):
+        """Start with no fields found."""
+        self.email: Optional[str] = None
+        self.phone: Optional[str] = None
+        self._name: Optional[str] = None
+        self._fallback_name: Optional[str] = None
+        self._name_lines_seen = 0
+
+    @property
+    def name(self) -> Optional[str]:
+        """Best name so far: a strict pattern match, else the looser fallback."""
+        return self._name or self._fallback_name
+
+    @property
+    def _name_done(self) -> bool:
+        return self._name is not None or self._name_lines_seen >= NAME_LINES
+
+    def feed(self, text: str) -> None:
+        """Scan the next chunk of text."""
+        if not self._name_done:
+            self._scan_name_lines(text)
+
+        if self.email is None:
+            match = EMAIL_RE.search(text)
+            if match:
+                self.email = match.group(0)
+
+        if self.phone is None:
+            match = PHONE_RE.search(text)
+            if match:
+                self.phone = NON_DIGIT_RE.sub('', match.group(0))
+
+    def result(self) -> Dict[str, Optional[str]]:
+        """Extracted fields, None where nothing was found."""
+        return {
+            "name": self.name,
+            "email": self.email,
+            "phone": self.phone
+        }
+
+    def _scan_name_lines(self, text: str) -> None:
+        """Apply the name heuristics to the leading non-empty lines only."""
+        for match in LINE_RE.finditer(text):
+            line = match.group(0).strip()
+            if not line:
+                continue
+
+            self._name_lines_seen += 1
+
+            if not NAME_EXCLUDE_RE.search(line) and NAME_RE.fullmatch(line):
+                self._name = line
+                return
+
+            if self._fallback_name is None and self._name_lines_seen <= NAME_FALLBACK_LINES:
+                words = line.split()
+                if 2 <= len(words) <= 4 and not NAME_FALLBACK_EXCLUDE_RE.search(line):
+                    if all(word[0].isupper() for word in words):
+                        self._fallback_name = line
+
+            if self._name_lines_seen >= NAME_LINES:
+                return
+
+
+def extract_fields(text: str) -> Dict[str, Optional[str]]:
+    """Extract name, email and phone from a complete text in one pass."""
+    scanner = FieldScanner()
+    scanner.feed(text)
+    return scanner.result()
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Layout-aware Contact Block Extraction
+Finds the name, email and phone on a resume's first page from word
+coordinates instead of extracted text, so two-column layouts do not mix a
+sidebar into the name line.
+
+Characters with their boxes and font sizes (pdfminer's LTChar, as behind
+pdfplumber's page.chars) are joined into words, words are grouped into
+rows, and each row is split wherever the horizontal gap is wider than a
+column gutter. Each resulting segment is one line of one column. The name is
+the largest-font segment in the top of the page that the usual name
+heuristics accept. The header block is the band from the name down to the
+first section heading. Email and phone are taken from the header block
+first, then from the rest of the page.
+"""
+
+from collections import Counter
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence
+
+from field_extraction import FieldScanner
+from sections import detect_header
+
+# Characters further apart than this many points start a new word (pdfplumber's default tolerances)
+X_TOLERANCE = 3.0
+Y_TOLERANCE = 3.0
+# Words whose tops differ by less than this share of the font size are on the same row
+ROW_TOLERANCE = 0.3
+# A horizontal gap wider than this many font sizes separates two columns
+COLUMN_GAP = 2.0
+# The name is looked for in this top share of the page
+NAME_REGION = 0.4
+# The header block ends at the first section heading, or this many body lines below the name
+HEADER_MAX_LINES = 6
+LINE_SPACING = 1.3
+
+
+class Segment(NamedTuple):
+    """One line of text within one column, in PDF points from the page's top left."""
+    text: str
+    x0: float
+    x1: float
+    top: float
+    bottom: float
+    size: float
+
+
+class ContactBlock(NamedTuple):
+    """Contact fields read from a page layout."""
+    fields: Dict[str, Optional[str]]
+    header: List[Segment]
+    text: str
+
+
+def chars_to_words(chars: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Join characters into words, in content-stream order.
+
+    A word ends at whitespace, at a horizontal gap or backward step, or
+    where the baseline moves.
+
+    Args:
+        chars: Dicts with text, x0, x1, top, bottom and size
+
+    Returns:
+        List[Dict[str, Any]]: Words with the same keys, size being the largest in the word
+    """
+    words = []
+    current: List[Dict[str, Any]] = []
+    for char in chars:
+        if char['text'].isspace():
+            if current:
+                words.append(_word(current))
+                current = []
+            continue
+        if current:
+            previous = current[-1]
+            if (char['x0'] - previous['x1'] > X_TOLERANCE or char['x0'] < previous['x0']
+                    or abs(char['bottom'] - previous['bottom']) > Y_TOLERANCE):
+                words.append(_word(current))
+                current = []
+        current.append(char)
+    if current:
+        words.append(_word(current))
+    return words
+
+
+def _word(chars: List[Dict[str, Any]]) -> Dict[str, Any]:
+    return {
+        "text": ''.join(char['text'] for char in chars),
+        "x0": chars[0]['x0'],
+        "x1": chars[-1]['x1'],
+        "top": min(char['top'] for char in chars),
+        "bottom": max(char['bottom'] for char in chars),
+        "size": max(char['size'] for char in chars)
+    }
+
+
+def group_segments(words: Sequence[Dict[str, Any]]) -> List[Segment]:
+    """
+    Group words into single-column line segments, top to bottom and left to right.
+
+    Args:
+        words: Dicts with text, x0, x1, top, bottom and size, as from
+            chars_to_words or pdfplumber's page.extract_words(extra_attrs=['size'])
+
+    Returns:
+        List[Segment]: Line segments in reading order within each row
+    """
+    rows: List[List[Dict[str, Any]]] = []
+    for word in sorted(words, key=lambda word: (word['top'], word['x0'])):
+        row = rows[-1] if rows else None
+        if row and word['top'] - row[0]['top'] <= ROW_TOLERANCE * max(word['size'], row[0]['size']):
+            row.append(word)
+        else:
+            rows.append([word])
+
+    segments = []
+    for row in rows:
+        row.sort(key=lambda word: word['x0'])
+        current = [row[0]]
+        for word in row[1:]:
+            previous = current[-1]
+            if word['x0'] - previous['x1'] > COLUMN_GAP * max(word['size'], previous['size']):
+                segments.append(_segment(current))
+                current = [word]
+            else:
+                current.append(word)
+        segments.append(_segment(current))
+    return segments
+
+
+def _segment(words: List[Dict[str, Any]]) -> Segment:
+    return Segment(
+        text=' '.join(word['text'] for word in words),
+        x0=words[0]['x0'],
+        x1=words[-1]['x1'],
+        top=min(word['top'] for word in words),
+        bottom=max(word['bottom'] for word in words),
+        size=max(word['size'] for word in words)
+    )
+
+
+def body_size(segments: Sequence[Segment]) -> float:
+    """Most common font size, weighted by characters."""
+    sizes = Counter()
+    for segment in segments:
+        sizes[round(segment.size, 1)] += len(segment.text)
+    return sizes.most_common(1)[0][0] if sizes else 0.0
+
+
+def find_contact_block(words: Sequence[Dict[str, Any]], page_height: float) -> ContactBlock:
+    """
+    Read name, email and phone from one page's words.
+
+    Args:
+        words: Words with coordinates and font size (see group_segments)
+        page_height (float): Page height in points
+
+    Returns:
+        ContactBlock: Fields (None where not found), the header block's
+        segments, and the page text with the header block first
+    """
+    segments = group_segments(words)
+    if not segments:
+        return ContactBlock({"name": None, "email": None, "phone": None}, [], '')
+
+    # Name: largest type first, then topmost, among segments near the top of the page
+    candidates = sorted((segment for segment in segments if segment.top < page_height * NAME_REGION),
+                        key=lambda segment: (-round(segment.size, 1), segment.top, segment.x0))
+    names = FieldScanner()
+    names.feed('\n'.join(segment.text for segment in candidates))
+    name = next((segment for segment in candidates if segment.text == names.name), None)
+
+    header = _header_block(segments, name, body_size(segments))
+    in_header = set(header)
+    rest = [segment for segment in segments if segment not in in_header]
+    text = '\n'.join(segment.text for segment in header + rest)
+
+    # Email and phone: header block first, so a referee's number further down never wins
+    contacts = FieldScanner()
+    contacts.feed(text)
+    return ContactBlock({"name": names.name, "email": contacts.email, "phone": contacts.phone}, header, text)
+
+
+def _header_block(segments: List[Segment], name: Optional[Segment], size: float) -> List[Segment]:
+    """Segments from the name down to the first section heading, in any column."""
+    start = name.top - name.size if name else segments[0].top
+    limit = (name.bottom if name else start) + HEADER_MAX_LINES * LINE_SPACING * size
+    for segment in segments:
+        if segment.top > start and segment is not name and detect_header(segment.text):
+            limit = min(limit, segment.top)
+            break
+    return [segment for segment in segments if start <= segment.top < limit]
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Lazy Library Imports
+PDF and DOCX libraries are imported the first time a document of that
+format arrives instead of when the app starts, so a cold start only pays for
+the formats it actually sees. Every import is timed and the timings are
+reported on /health.
+
+Availability is checked with importlib.util.find_spec, which locates a
+package without importing it.
+"""
+
+import time
+import logging
+import importlib
+import importlib.util
+import threading
+from types import ModuleType
+from typing import Dict, Any, Optional
+
+logger = logging.getLogger(__name__)
+
+_lock = threading.Lock()
+_modules: Dict[str, Optional[ModuleType]] = {}
+_timings: Dict[str, float] = {}
+
+
+def module_available(name: str) -> bool:
+    """True if the module can be imported, without importing it."""
+    if name in _modules:
+        return _modules[name] is not None
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+def load_module(name: str) -> ModuleType:
+    """
+    Import a module on first use and remember how long it took.
+
+    Raises:
+        ImportError: If the module is not installed
+    """
+    module = _modules.get(name)
+    if module is not None:
+        return module
+
+    with _lock:
+        if name not in _modules:
+            start = time.perf_counter()
+            try:
+                _modules[name] = importlib.import_module(name)
+            except ImportError:
+                _modules[name] = None
+            _timings[name] = time.perf_counter() - start
+            logger.info(f"Imported {name} in {_timings[name] * 1000:.1f} ms")
+        module = _modules[name]
+
+    if module is None:
+        raise ImportError(f"{name} is not installed")
+    return module
+
+
+def import_timings() -> Dict[str, Any]:
+    """Per-module import cost in milliseconds, for /health."""
+    with _lock:
+        return {
+            "loaded": {name: round(seconds * 1000, 1) for name, seconds in _timings.items()
+                       if _modules.get(name) is not None},
+            "missing": sorted(name for name, module in _modules.items() if module is None),
+            "total_ms": round(sum(_timings.values()) * 1000, 1)
+        }
@@ -1,120 +1,72 @@
+import os
 import json
-import re
 import io
 from flask import Flask, request, jsonify
 from flask_cors import CORS
-import PyPDF2
-import pdfplumber
-from docx import Document
-import base64
+from uploads import read_upload, check_content_length, UploadError
+from text_extraction import (extract_pdf_text, extract_docx_text, scan_pdf_fields, scan_pdf_layout,
+                             MODE_CONTACT, MODE_LAYOUT, PARSE_MODES, DocumentTooLarge)
+from field_extraction import extract_fields
+from lazy_imports import import_timings
+from prewarm import prewarm_from_env
 
 app = Flask(__name__)
 CORS(app)
 
+PREWARM_TIMINGS = prewarm_from_env()
+
 def extract_text_from_pdf(file_content):
     """Extract text from PDF using multiple methods for better accuracy"""
     try:
-        # Method 1: Using pdfplumber (better for complex layouts)
-        with pdfplumber.open(io.BytesIO(file_content)) as pdf:
-            text = ""
-            for page in pdf.pages:
-                page_text = page.extract_text()
-                if page_text:
-                    text += page_text + "\n"
-            if text.strip():
-                return text
-    except Exception as e:
-        print(f"pdfplumber failed: {e}")
-    
-    try:
-        # Method 2: Using PyPDF2 (fallback)
-        pdf_reader = PyPDF2.PdfReader(io.BytesIO(file_content))
-        text = ""
-        for page in pdf_reader.pages:
-            text += page.extract_text() + "\n"
-        return text
+        # PyPDF2 first, escalating to pdfplumber when its output scores low
+        return extract_pdf_text(file_content)
+    except DocumentTooLarge:
+        raise
     except Exception as e:
-        print(f"PyPDF2 failed: {e}")
+        print(f"PDF extraction failed: {e}")
         return ""
 
 def extract_text_from_docx(file_content):
     """Extract text from DOCX file"""
     try:
-        doc = Document(io.BytesIO(file_content))
-        text = ""
-        for paragraph in doc.paragraphs:
-            text += paragraph.text + "\n"
-        return text
+        return extract_docx_text(file_content)
     except Exception as e:
         print(f"DOCX extraction failed: {e}")
         return ""
 
 def extract_profile_info(text):
     """Extract name, email, and phone from text"""
-    profile = {
-        "name": None,
-        "email": None,
-        "phone": None
-    }
-    
-    # Extract email
-    email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-    email_match = re.search(email_pattern, text)
-    if email_match:
-        profile["email"] = email_match.group(0)
-    
-    # Extract phone (various formats)
-    phone_patterns = [
-        r'(\+?1[-.\s]?)?\(?([0-9]{3})\)?[-.\s]?([0-9]{3})[-.\s]?([0-9]{4})',
-        r'(\+?[0-9]{1,3}[-.\s]?)?\(?([0-9]{3})\)?[-.\s]?([0-9]{3})[-.\s]?([0-9]{4})',
-        r'\+?[0-9]{10,15}'
-    ]
-    
-    for pattern in phone_patterns:
-        phone_match = re.search(pattern, text)
-        if phone_match:
-            phone = re.sub(r'\D', '', phone_match.group(0))
-            if len(phone) >= 10:
-                profile["phone"] = phone
-                break
-    
-    # Extract name (look for common patterns)
-    lines = [line.strip() for line in text.split('\n') if line.strip()]
-    
-    # Common name patterns
-    name_patterns = [
-        r'^[A-Z][a-z]+ [A-Z][a-z]+$',  # First Last
-        r'^[A-Z][a-z]+ [A-Z]\. [A-Z][a-z]+$',  # First M. Last
-        r'^[A-Z][a-z]+ [A-Z][a-z]+ [A-Z][a-z]+$'  # First Middle Last
-    ]
-    
-    for line in lines[:10]:  # Check first 10 lines
-        if not any(char in line for char in ['@', 'phone', 'email', 'tel', 'fax']):
-            for pattern in name_patterns:
-                if re.match(pattern, line):
-                    profile["name"] = line
-                    break
-            if profile["name"]:
-                break
-    
-    return profile
+    return extract_fields(text)
 
 @app.route('/parse-resume', methods=['POST'])
 def parse_resume():
     """Parse resume and extract profile information"""
     try:
-        data = request.get_json()
-        
-        if not data or 'file' not in data:
-            return jsonify({"error": "No file provided"}), 400
-        
-        # Decode base64 file content
-        file_content = base64.b64decode(data['file'])
-        file_type = data.get('type', '')
+        # Decode the upload (base64 JSON, multipart or raw body)
+        try:
+            upload = read_upload(request)
+        except UploadError as e:
+            return jsonify({"error": str(e)}), e.status
         
+        file_content = upload.file_data
+        file_type = upload.file_type
+        mode = upload.options.get('mode', MODE_CONTACT)
+        if mode not in PARSE_MODES:
+            return jsonify({"error": f"Unsupported mode: {mode}"}), 400
         # Extract text based on file type
+        fields = None
         if file_type == 'application/pdf':
-            text = extract_text_from_pdf(file_content)
+            if mode == MODE_LAYOUT:
+                # Name, email and phone come from the first page's layout
+                scan = scan_pdf_layout(file_content, keep_text=True)
+                text, fields = scan.text, scan.fields
+            elif mode == MODE_CONTACT:
+                # Stop reading pages once name, email and phone are found; the
+                # fields come from that scan, so the text is not scanned again
+                scan = scan_pdf_fields(file_content, stop_when_complete=True, keep_text=True)
+                text, fields = scan.text, scan.fields
+            else:
+                text = extract_text_from_pdf(file_content)
         elif file_type == 'application/vnd.openxmlformats-officedocument.wordprocessingml.document':
             text = extract_text_from_docx(file_content)
         else:
@@ -130,10 +82,12 @@ def parse_resume():
             })
         
         # Extract profile information
-        profile = extract_profile_info(text)
+        profile = fields if fields is not None else extract_profile_info(text)
         
         return jsonify(profile)
         
+    except DocumentTooLarge as e:
+        return jsonify({"error": str(e)}), 413
     except Exception as e:
         print(f"Error parsing resume: {e}")
         return jsonify({
@@ -147,7 +101,27 @@ def parse_resume():
 @app.route('/health', methods=['GET'])
 def health():
     """Health check endpoint"""
-    return jsonify({"status": "healthy", "service": "resume-parser"})
+    return jsonify({
+        "status": "healthy",
+        "service": "resume-parser",
+        "imports": import_timings(),
+        "prewarm": PREWARM_TIMINGS
+    })
+
+def resume_parser(request):
+    """Cloud Functions entry point: route the request through the Flask app."""
+    # Refuse an oversized body before it is copied and handed to the app
+    try:
+        check_content_length(request.content_length)
+    except UploadError as e:
+        return {"error": str(e)}, e.status
+    # The framework has already consumed the input stream, so hand the body over again
+    body = request.get_data()
+    environ = dict(request.environ, CONTENT_LENGTH=str(len(body)))
+    environ['wsgi.input'] = io.BytesIO(body)
+    with app.request_context(environ):
+        return app.full_dispatch_request()
 
 if __name__ == '__main__':
-    app.run(debug=True, host='0.0.0.0', port=8080)
+    # Development server only; use serve.py (gunicorn) in production
+    app.run(debug=os.environ.get('FLASK_DEBUG') == '1', host='0.0.0.0', port=int(os.environ.get('PORT', 8080)))
@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+Parser Metrics
+In-memory counters and latency histograms rendered in the Prometheus text
+format for a /metrics endpoint. Stage timings use time.perf_counter(), so
+they are unaffected by wall-clock adjustments.
+
+Metrics are per process: under gunicorn each worker keeps its own registry,
+and parses run inside batch worker processes are not included. Updates made
+inside extraction workers are journaled and replayed into the parent.
+"""
+
+import time
+import threading
+from bisect import bisect_left
+from typing import Dict, Any, List, Tuple, Sequence, Optional
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+# Seconds; covers a cached contact-mode hit up to a slow 100-page PDF
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# Stage labels
+STAGE_DECODE = 'decode'
+STAGE_PDFPLUMBER = 'pdfplumber'
+STAGE_PYPDF2 = 'pypdf2'
+STAGE_DOCX = 'docx'
+STAGE_LAYOUT = 'layout'
+STAGE_OCR = 'ocr'
+STAGE_FIELDS = 'field_extraction'
+STAGE_SECTIONS = 'sections'
+STAGE_SKILLS = 'skills'
+STAGE_SIMILARITY = 'similarity'
+STAGE_SEARCH_INDEX = 'search_index'
+
+
+# Updates made while a journal is open, so a worker process can ship them to its parent
+_journal: Optional[List[Tuple[str, str, float, Dict[str, Any]]]] = None
+
+
+def _journal_append(name: str, method: str, value: float, labels: Dict[str, Any]) -> None:
+    if _journal is not None:
+        _journal.append((name, method, value, labels))
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ''
+    pairs = []
+    for name, value in zip(names, values):
+        escaped = str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+        pairs.append(f'{name}="{escaped}"')
+    return '{' + ','.join(pairs) + '}'
+
+
+def _format_value(value: float) -> str:
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class _Metric:
+    """Base class: a named family of label combinations."""
+
+    kind = ''
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, Any]) -> Tuple[str, ...]:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def render(self) -> List[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+
+
+class Counter(_Metric):
+    """Monotonically increasing total."""
+
+    kind = 'counter'
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+        _journal_append(self.name, 'inc', amount, labels)
+
+    def value(self, **labels) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0)
+
+    def render(self) -> List[str]:
+        lines = super().render()
+        with self._lock:
+            values = self._values or ({(): 0} if not self.labelnames else {})
+            for key, value in sorted(values.items()):
+                lines.append(f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}")
+        return lines
+
+
+class Histogram(_Metric):
+    """Bucketed observations with a running sum and count."""
+
+    kind = 'histogram'
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # key -> [per-bucket counts (+Inf last), sum]
+        self._series: Dict[Tuple[str, ...], List[Any]] = {}
+
+    def observe(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [[0] * (len(self.buckets) + 1), 0.0]
+            series[0][index] += 1
+            series[1] += value
+        _journal_append(self.name, 'observe', value, labels)
+
+    def render(self) -> List[str]:
+        lines = super().render()
+        bounds = self.buckets + (float('inf'),)
+        with self._lock:
+            for key, (counts, total) in sorted(self._series.items()):
+                cumulative = 0
+                for bound, count in zip(bounds, counts):
+                    cumulative += count
+                    labels = _format_labels(self.labelnames + ('le',), key + (_format_value(bound),))
+                    lines.append(f"{self.name}_bucket{labels} {cumulative}")
+                labels = _format_labels(self.labelnames, key)
+                lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+                lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    """Ordered collection of metrics rendered together."""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        metric = self._metrics[name] = Counter(name, documentation, labelnames)
+        return metric
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        metric = self._metrics[name] = Histogram(name, documentation, labelnames, buckets)
+        return metric
+
+    def get(self, name: str) -> Optional[_Metric]:
+        return self._metrics.get(name)
+
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return '\n'.join(lines) + '\n'
+
+
+REGISTRY = MetricsRegistry()
+
+STAGE_SECONDS = REGISTRY.histogram(
+    'resume_parser_stage_seconds', 'Time spent in each parsing stage.', ('stage',))
+PROCESSING_SECONDS = REGISTRY.histogram(
+    'resume_parser_processing_seconds', 'End-to-end process_resume latency.', ('parser',))
+DOCUMENTS = REGISTRY.counter(
+    'resume_parser_documents_total', 'Documents processed, by outcome.', ('parser', 'outcome'))
+FALLBACK_RESPONSES = REGISTRY.counter(
+    'resume_parser_fallback_responses_total', 'Responses returned with _fallback set.', ('parser', 'reason'))
+PDF_FALLBACKS = REGISTRY.counter(
+    'resume_parser_pdf_fallbacks_total', 'PDFs escalated to the next extraction engine after a failure or low score.')
+PDF_ENGINE_DOCUMENTS = REGISTRY.counter(
+    'resume_parser_pdf_engine_total', 'PDFs whose text came from each extraction engine.', ('engine',))
+BYTES_PROCESSED = REGISTRY.counter(
+    'resume_parser_bytes_processed_total', 'Bytes of uploaded documents processed.', ('parser',))
+EXTRACTION_WORKER_RESTARTS = REGISTRY.counter(
+    'resume_parser_extraction_worker_restarts_total', 'Extraction workers replaced, by reason.', ('reason',))
+ADMISSION_REJECTIONS = REGISTRY.counter(
+    'resume_parser_admission_rejections_total', 'Parse requests refused by admission control, by reason.',
+    ('reason',))
+ADMISSION_WAIT_SECONDS = REGISTRY.histogram(
+    'resume_parser_admission_wait_seconds', 'Time parse requests waited for admission.')
+OCR_PAGES = REGISTRY.counter(
+    'resume_parser_ocr_pages_total', 'PDF pages recognized with OCR (cache hits excluded).')
+
+
+class Stopwatch:
+    """
+    Monotonic timer for one stage that can be resumed several times (e.g.
+    around each page of a generator) and is recorded once.
+    """
+
+    def __init__(self, stage: str):
+        self.stage = stage
+        self.elapsed = 0.0
+        self._started = 0.0
+
+    def __enter__(self) -> "Stopwatch":
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.elapsed += time.perf_counter() - self._started
+
+    def record(self) -> None:
+        STAGE_SECONDS.observe(self.elapsed, stage=self.stage)
+
+
+class stage_timer(Stopwatch):
+    """Time a single block and record it on exit: `with stage_timer(STAGE_DOCX): ...`"""
+
+    def __exit__(self, *exc_info) -> None:
+        super().__exit__(*exc_info)
+        self.record()
+
+
+def record_parse(parser: str, result: Dict[str, Any], size: int, seconds: float) -> None:
+    """Count one process_resume call and its outcome."""
+    PROCESSING_SECONDS.observe(seconds, parser=parser)
+    BYTES_PROCESSED.inc(size, parser=parser)
+    if result.get('_fallback'):
+        DOCUMENTS.inc(parser=parser, outcome='fallback')
+        FALLBACK_RESPONSES.inc(parser=parser, reason='error' if result.get('_error') else 'missing_fields')
+    else:
+        DOCUMENTS.inc(parser=parser, outcome='success')
+
+
+def start_journal() -> None:
+    """Record every metric update in this process from now on (see drain_journal)."""
+    global _journal
+    _journal = []
+
+
+def drain_journal() -> List[Tuple[str, str, float, Dict[str, Any]]]:
+    """Return and clear the updates recorded since the last drain."""
+    global _journal
+    entries, _journal = _journal or [], ([] if _journal is not None else None)
+    return entries
+
+
+def replay(entries: List[Tuple[str, str, float, Dict[str, Any]]]) -> None:
+    """Apply updates recorded in another process to this process's registry."""
+    for name, method, value, labels in entries:
+        metric = REGISTRY.get(name)
+        if metric is not None:
+            getattr(metric, method)(value, **labels)
+
+
+def render_metrics() -> str:
+    """All metrics in the Prometheus text exposition format."""
+    return REGISTRY.render()
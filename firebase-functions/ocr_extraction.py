@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""
+Local OCR for Image-only PDFs
+Rasterizes PDF pages with pdfium (pypdfium2) and recognizes them with the
+Tesseract command-line engine, on this machine and with no network calls.
+Only used when no text engine finds a text layer (see
+text_extraction.scan_pdf_fields).
+
+Pages are recognized in parallel: up to OCR_WORKERS tesseract processes run
+at once, each limited to one thread, while pages are handed back in order so
+the caller can stop as soon as the contact fields are complete. Stopping
+cancels the pages not yet started and kills the ones still running.
+
+OCR output is cached by file hash (a ParseCache in its own namespace), page
+by page, so a contact-mode scan that stopped after page one is continued
+rather than redone by a later full parse. Each page is written as soon as
+it is recognized, and the cache is a SQLite file by default (in a private
+per-user temp directory unless OCR_CACHE_PATH or PARSE_CACHE_PATH is set),
+so pages survive an extraction worker that is killed mid-document and the
+retry picks up where it stopped.
+
+OCR is much slower than text extraction, so it does not run under the
+EXTRACTION_TIMEOUT meant for text layers: before recognizing any page it
+asks the extraction supervisor for OCR_TIMEOUT seconds (default 180).
+"""
+
+import os
+import shutil
+import logging
+import threading
+import subprocess
+from collections import deque
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor
+from typing import Any, Deque, Iterator, List, Optional, Set, Tuple
+
+from lazy_imports import module_available, load_module
+from parse_cache import ParseCache, private_cache_dir, user_temp_dir
+from extraction_worker import extend_deadline
+from metrics import Stopwatch, STAGE_OCR, OCR_PAGES
+
+logger = logging.getLogger(__name__)
+
+TESSERACT_CMD = os.environ.get('TESSERACT_CMD', 'tesseract')
+OCR_LANGUAGE = os.environ.get('OCR_LANGUAGE', 'eng')
+# 300 DPI puts 10pt body text at the x-height Tesseract is tuned for
+OCR_DPI = int(os.environ.get('OCR_DPI', 300))
+OCR_MAX_PAGES = int(os.environ.get('OCR_MAX_PAGES', 10))
+OCR_PAGE_TIMEOUT = float(os.environ.get('OCR_PAGE_TIMEOUT', 60))
+# Whole-document budget, granted on top of EXTRACTION_TIMEOUT when OCR starts
+OCR_TIMEOUT = float(os.environ.get('OCR_TIMEOUT', 180))
+OCR_CACHE_SIZE = int(os.environ.get('OCR_CACHE_SIZE', 64))
+OCR_DISK_CACHE_SIZE = int(os.environ.get('OCR_DISK_CACHE_SIZE', 1000))
+OCR_CACHE_PATH = os.environ.get('OCR_CACHE_PATH') or os.environ.get('PARSE_CACHE_PATH') or None
+
+# Bump when rasterizing or recognition changes, so cached pages are not reused
+OCR_VERSION = '1'
+
+OCR_AVAILABLE = (os.environ.get('OCR_ENABLED', '1') != '0'
+                 and module_available('pypdfium2')
+                 and shutil.which(TESSERACT_CMD) is not None)
+
+# pdfium is not thread-safe; rendering is serialized, recognition is not
+_pdfium_lock = threading.Lock()
+_cache: Optional[ParseCache] = None
+
+
+def ocr_workers() -> int:
+    """Pages recognized at once: OCR_WORKERS, default one per core this process may use."""
+    configured = int(os.environ.get('OCR_WORKERS', 0))
+    if configured > 0:
+        return configured
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def ocr_cache() -> ParseCache:
+    """The OCR cache, built on first use; on disk, so it outlives a killed worker."""
+    global _cache
+    if _cache is None:
+        path = OCR_CACHE_PATH
+        if path is None:
+            directory = private_cache_dir(user_temp_dir('resume-ocr'))
+            path = os.path.join(directory, 'ocr-cache.db') if directory else None
+        _cache = ParseCache('ocr', OCR_VERSION, max_entries=OCR_CACHE_SIZE, path=path,
+                            max_disk_entries=OCR_DISK_CACHE_SIZE)
+    return _cache
+
+
+def render_page(document: Any, index: int, dpi: int = OCR_DPI) -> bytes:
+    """
+    Rasterize one page to an 8-bit grayscale PGM image.
+
+    Args:
+        document: An open pypdfium2 PdfDocument
+        index (int): Zero-based page number
+        dpi (int): Rendering resolution
+
+    Returns:
+        bytes: Binary PGM (P5) image, which tesseract reads from stdin
+    """
+    with _pdfium_lock:
+        page = document[index]
+        try:
+            bitmap = page.render(scale=dpi / 72, grayscale=True)
+            width, height, stride = bitmap.width, bitmap.height, bitmap.stride
+            buffer = memoryview(bitmap.buffer).cast('B')
+            if stride == width:
+                pixels = bytes(buffer[:width * height])
+            else:
+                pixels = b''.join(buffer[row * stride:row * stride + width] for row in range(height))
+            bitmap.close()
+        finally:
+            page.close()
+    return b'P5\n%d %d\n255\n' % (width, height) + pixels
+
+
+def recognize_image(image: bytes, language: str = OCR_LANGUAGE, dpi: int = OCR_DPI,
+                    running: Optional[Set[subprocess.Popen]] = None) -> str:
+    """
+    Run tesseract on one image and return its text.
+
+    Each process is limited to one thread (OMP_THREAD_LIMIT=1); parallelism
+    comes from running several at once.
+
+    Args:
+        image (bytes): Image in any format tesseract reads (PGM from render_page)
+        language (str): Tesseract language code(s), e.g. 'eng' or 'eng+deu'
+        dpi (int): Resolution the image was rendered at
+        running (Set[subprocess.Popen]): Registry of live processes, so a
+            caller that stops early can kill them
+
+    Raises:
+        Exception: If tesseract fails or runs longer than OCR_PAGE_TIMEOUT
+    """
+    env = dict(os.environ, OMP_THREAD_LIMIT='1')
+    process = subprocess.Popen([TESSERACT_CMD, 'stdin', 'stdout', '-l', language, '--dpi', str(dpi)],
+                               stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE, env=env)
+    if running is not None:
+        running.add(process)
+    try:
+        stdout, stderr = process.communicate(image, timeout=OCR_PAGE_TIMEOUT)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.communicate()
+        raise Exception(f"tesseract timed out after {OCR_PAGE_TIMEOUT:g}s")
+    finally:
+        if running is not None:
+            running.discard(process)
+    if process.returncode:
+        raise Exception(f"tesseract exited with {process.returncode}: {stderr.decode(errors='replace').strip()}")
+    return stdout.decode('utf-8', errors='replace')
+
+
+def iter_ocr_pages(file_data: bytes, max_pages: int = OCR_MAX_PAGES,
+                   workers: Optional[int] = None) -> Iterator[str]:
+    """
+    Yield the OCR text of each page in order, recognizing pages in parallel.
+
+    Cached pages are yielded first without touching pdfium or tesseract.
+    The rest are submitted a window of `workers` pages ahead of the reader,
+    so a caller that stops after page one pays for at most `workers` pages.
+    Each page is written to the cache as it is read, and when the caller
+    stops, pages that finished ahead of it are written too.
+
+    Args:
+        file_data (bytes): Raw PDF content
+        max_pages (int): Pages recognized at most
+        workers (int): Pages recognized at once (default ocr_workers())
+    """
+    cache = ocr_cache()
+    key = cache.make_key(file_data, OCR_LANGUAGE, OCR_DPI)
+    entry = cache.get(key) or {"pages": [], "page_count": None}
+    pages: List[str] = entry["pages"]
+    page_count: Optional[int] = entry["page_count"]
+    saved = len(pages)
+
+    yield from list(pages)
+    if page_count is not None and len(pages) >= min(page_count, max_pages):
+        return
+
+    extend_deadline(OCR_TIMEOUT)
+    workers = workers or ocr_workers()
+    clock = Stopwatch(STAGE_OCR)
+    running: Set[subprocess.Popen] = set()
+    stopped = threading.Event()
+    pending: Deque[Tuple[int, Future]] = deque()
+    document = None
+    pool = None
+
+    def recognize(index: int) -> str:
+        if stopped.is_set():
+            raise CancelledError()
+        image = render_page(document, index)
+        if stopped.is_set():
+            raise CancelledError()
+        return recognize_image(image, running=running)
+
+    try:
+        with clock:
+            document = load_module('pypdfium2').PdfDocument(file_data)
+            page_count = len(document)
+        limit = min(page_count, max_pages)
+        if page_count > max_pages:
+            logger.warning(f"OCR limited to the first {max_pages} of {page_count} pages")
+
+        pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='ocr')
+        next_page = len(pages)
+        while len(pages) < limit:
+            while next_page < limit and len(pending) < workers:
+                pending.append((next_page, pool.submit(recognize, next_page)))
+                next_page += 1
+            with clock:
+                page_text = pending.popleft()[1].result()
+            pages.append(page_text)
+            OCR_PAGES.inc()
+            cache.put(key, {"pages": pages, "page_count": page_count})
+            saved = len(pages)
+            yield page_text
+    finally:
+        # Keep pages that finished ahead of the reader, in order, then drop the rest
+        while pending and pending[0][0] == len(pages) and _succeeded(pending[0][1]):
+            pages.append(pending.popleft()[1].result())
+            OCR_PAGES.inc()
+        stopped.set()
+        for _, future in pending:
+            future.cancel()
+        for process in list(running):
+            process.kill()
+        if pool is not None:
+            pool.shutdown(wait=True)
+        if document is not None:
+            document.close()
+        clock.record()
+        if len(pages) > saved:
+            cache.put(key, {"pages": pages, "page_count": page_count})
+
+
+def _succeeded(future: Future) -> bool:
+    return future.done() and not future.cancelled() and future.exception() is None
@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+"""
+Parse Result Cache
+Content-addressed cache for resume parse results, keyed by a hash of the
+decoded file bytes plus the parser version.
+
+Two tiers:
+    1. A bounded in-memory LRU (always on).
+    2. An optional SQLite file shared between processes (PARSE_CACHE_PATH).
+
+Bumping the parser version changes every key. When the disk tier is opened,
+rows the same namespace wrote under an older version are purged; rows from
+newer versions are left alone, so during a rolling deploy old and new
+workers sharing the file do not wipe each other's entries.
+"""
+
+import os
+import re
+import copy
+import json
+import stat
+import pathlib
+import sqlite3
+import hashlib
+import logging
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Tuple
+
+DEFAULT_MAX_ENTRIES = 256
+
+
+def version_key(version: str) -> Tuple[int, ...]:
+    """Numeric parts of a version string, for ordering: '2.10.0' -> (2, 10, 0)."""
+    return tuple(int(part) for part in re.findall(r'\d+', version))
+
+
+def older_versions(versions: Iterable[str], current: str) -> List[str]:
+    """
+    The versions that sort before `current`.
+
+    Versions without a number cannot be ordered and are never returned.
+    """
+    current_key = version_key(current)
+    if not current_key:
+        return []
+    return [version for version in versions
+            if version_key(version) and version_key(version) < current_key]
+
+
+def user_temp_dir(name: str) -> str:
+    """<temp dir>/<name>-<uid>, so users of one machine never share cached files."""
+    uid = os.getuid() if hasattr(os, 'getuid') else os.getpid()
+    return os.path.join(tempfile.gettempdir(), f"{name}-{uid}")
+
+
+def private_cache_dir(path: str) -> Optional[str]:
+    """
+    Create `path` (mode 0700) if needed and return it when only this user can write to it.
+
+    Returns:
+        Optional[str]: The directory, or None when it is owned by another user or
+            writable by group or others, in which case nothing should be cached there
+    """
+    logger = logging.getLogger(__name__)
+    try:
+        os.makedirs(path, mode=0o700, exist_ok=True)
+        info = os.stat(path)
+    except OSError as e:
+        logger.warning(f"Cache directory {path} not used: {e}")
+        return None
+    if hasattr(os, 'getuid') and (info.st_uid != os.getuid() or info.st_mode & (stat.S_IWGRP | stat.S_IWOTH)):
+        logger.warning(f"Cache directory {path} not used: it must be owned by this user "
+                       f"and not writable by group or others")
+        return None
+    return path
+
+
+def iter_entries(path: str, namespace: Optional[str] = None,
+                 batch_size: int = 1000) -> Iterator[Tuple[str, str, str, Dict[str, Any]]]:
+    """
+    Stream the rows of a disk tier without opening it as a cache.
+
+    The file is opened read-only, so unlike ParseCache it never purges rows
+    written by older parser versions.
+
+    Args:
+        path (str): SQLite file (PARSE_CACHE_PATH)
+        namespace (str): Only rows for this parser, default every parser
+        batch_size (int): Rows fetched from SQLite at a time
+
+    Yields:
+        Tuple[str, str, str, Dict[str, Any]]: (key, namespace, version, result)
+    """
+    conn = sqlite3.connect(pathlib.Path(path).resolve().as_uri() + "?mode=ro", uri=True)
+    try:
+        query = "SELECT key, namespace, version, result FROM parse_cache"
+        cursor = (conn.execute(query + " WHERE namespace = ? ORDER BY rowid", (namespace,)) if namespace
+                  else conn.execute(query + " ORDER BY rowid"))
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            for key, row_namespace, version, result in rows:
+                yield key, row_namespace, version, json.loads(result)
+    finally:
+        conn.close()
+
+
+class ParseCache:
+    """
+    Two-tier (memory LRU + optional SQLite) cache for parse results.
+    """
+
+    def __init__(self, namespace: str, version: str, max_entries: int = DEFAULT_MAX_ENTRIES,
+                 path: Optional[str] = None, max_disk_entries: int = 0):
+        """
+        Args:
+            namespace (str): Parser identity, keeps different response shapes apart
+            version (str): Parser version, part of every key
+            max_entries (int): Capacity of the in-memory LRU (0 disables it)
+            path (str): Optional SQLite file for the on-disk tier
+            max_disk_entries (int): Rows kept on disk for this namespace, oldest
+                written dropped first (0 for no limit)
+        """
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.namespace = namespace
+        self.version = version
+        self.max_entries = max(0, max_entries)
+        self.path = path
+        self.max_disk_entries = max(0, max_disk_entries)
+
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._conn_pid: Optional[int] = None
+
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    @classmethod
+    def from_env(cls, namespace: str, version: str) -> "ParseCache":
+        """Build a cache configured from PARSE_CACHE_SIZE / PARSE_CACHE_PATH."""
+        max_entries = int(os.environ.get('PARSE_CACHE_SIZE', DEFAULT_MAX_ENTRIES))
+        path = os.environ.get('PARSE_CACHE_PATH') or None
+        return cls(namespace, version, max_entries=max_entries, path=path)
+
+    def make_key(self, file_data: bytes, *parts: str) -> str:
+        """Content address for a file plus any request options that change the result."""
+        digest = hashlib.blake2b(file_data, digest_size=20).hexdigest()
+        return ':'.join([self.namespace, self.version, *[str(p) for p in parts], digest])
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return a copy of the cached result, or None on a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return copy.deepcopy(entry)
+
+        entry = self._disk_get(key)
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.disk_hits += 1
+            self._remember(key, entry)
+        return copy.deepcopy(entry)
+
+    def put(self, key: str, result: Dict[str, Any]) -> None:
+        """Store a parse result in both tiers."""
+        entry = copy.deepcopy(result)
+        with self._lock:
+            self._remember(key, entry)
+        self._disk_put(key, entry)
+
+    def clear(self) -> None:
+        """Drop every entry for this namespace and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.disk_hits = self.misses = 0
+            conn = self._connection()
+            if conn is not None:
+                with conn:
+                    conn.execute("DELETE FROM parse_cache WHERE namespace = ?", (self.namespace,))
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters reported on /health."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "version": self.version,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "disk_enabled": self.path is not None
+            }
+
+    def _remember(self, key: str, entry: Dict[str, Any]) -> None:
+        """Insert into the LRU, evicting the oldest entries. Caller holds the lock."""
+        if not self.max_entries:
+            return
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _connection(self) -> Optional[sqlite3.Connection]:
+        """Open the disk tier lazily, and again after a fork."""
+        if self.path is None:
+            return None
+        if self._conn is not None and self._conn_pid == os.getpid():
+            return self._conn
+
+        try:
+            conn = sqlite3.connect(self.path, timeout=5.0, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS parse_cache ("
+                "key TEXT PRIMARY KEY, namespace TEXT NOT NULL, version TEXT NOT NULL, "
+                "result TEXT NOT NULL)"
+            )
+            with conn:
+                versions = [row[0] for row in conn.execute(
+                    "SELECT DISTINCT version FROM parse_cache WHERE namespace = ?", (self.namespace,))]
+                purged = 0
+                for version in older_versions(versions, self.version):
+                    purged += conn.execute(
+                        "DELETE FROM parse_cache WHERE namespace = ? AND version = ?",
+                        (self.namespace, version)
+                    ).rowcount
+            if purged:
+                self.logger.info(f"Purged {purged} cache entries from older {self.namespace} versions")
+        except sqlite3.Error as e:
+            self.logger.warning(f"Disk cache unavailable ({self.path}): {e}")
+            self.path = None
+            return None
+
+        self._conn = conn
+        self._conn_pid = os.getpid()
+        return conn
+
+    def _disk_get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Look a key up in the SQLite tier."""
+        with self._lock:
+            conn = self._connection()
+            if conn is None:
+                return None
+            try:
+                row = conn.execute("SELECT result FROM parse_cache WHERE key = ?", (key,)).fetchone()
+            except sqlite3.Error as e:
+                self.logger.warning(f"Disk cache read failed: {e}")
+                return None
+        return json.loads(row[0]) if row else None
+
+    def _disk_put(self, key: str, entry: Dict[str, Any]) -> None:
+        """Write a key to the SQLite tier."""
+        payload = json.dumps(entry)
+        with self._lock:
+            conn = self._connection()
+            if conn is None:
+                return
+            try:
+                with conn:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO parse_cache (key, namespace, version, result) "
+                        "VALUES (?, ?, ?, ?)",
+                        (key, self.namespace, self.version, payload)
+                    )
+                    if self.max_disk_entries:
+                        # REPLACE gives the row a new rowid, so rowid order is write order
+                        conn.execute(
+                            "DELETE FROM parse_cache WHERE namespace = ? AND rowid <= ("
+                            "SELECT rowid FROM parse_cache WHERE namespace = ? "
+                            "ORDER BY rowid DESC LIMIT 1 OFFSET ?)",
+                            (self.namespace, self.namespace, self.max_disk_entries)
+                        )
+            except sqlite3.Error as e:
+                self.logger.warning(f"Disk cache write failed: {e}")
@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+Directory Parser
+Offline backfill: parses every PDF/DOCX under the given directories or globs
+with ProfessionalResumeParser across a process pool (one parser per core, as
+BatchResumeParser does) and appends one JSON line per file to the output.
+
+The output doubles as the checkpoint. On start, every path already in it is
+skipped, so an interrupted run picks up where it stopped; a line cut short by
+a crash is dropped and its file parsed again. Throughput is reported on
+stderr while the run goes.
+
+Run with: python parse_dir.py resumes/ "inbox/**/*.pdf" -o parsed.jsonl [--workers 8] [--mode contact]
+"""
+
+import os
+import sys
+import json
+import time
+import logging
+import argparse
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from batch_parser import available_cpus, _init_worker, _parse_path_in_worker
+from dedupe_corpus import find_documents
+from text_extraction import MODE_FULL, PARSE_MODES
+from uploads import guess_file_type
+
+# Futures kept in flight per worker, enough to keep every core busy
+QUEUED_PER_WORKER = 4
+
+
+def load_checkpoint(output: str, retry_errors: bool = False) -> Set[str]:
+    """
+    Paths already recorded in the output file.
+
+    A trailing partial line (the process died mid-write) is cut off so the
+    next append starts on a fresh line.
+
+    Args:
+        output (str): JSONL file written by an earlier run
+        retry_errors (bool): Leave out files whose recorded result is a fallback
+
+    Returns:
+        Set[str]: Absolute paths to skip
+    """
+    done: Set[str] = set()
+    if not os.path.exists(output):
+        return done
+
+    valid_bytes = 0
+    with open(output, 'rb') as handle:
+        for line in handle:
+            if not line.endswith(b'\n'):
+                break
+            try:
+                record = json.loads(line)
+            except ValueError:
+                break
+            valid_bytes += len(line)
+            if retry_errors and record.get('_fallback'):
+                done.discard(record.get('path'))
+            else:
+                done.add(record.get('path'))
+
+    if valid_bytes < os.path.getsize(output):
+        print(f"⚠️  Dropping an incomplete last line from {output}", file=sys.stderr)
+        with open(output, 'r+b') as handle:
+            handle.truncate(valid_bytes)
+    return done
+
+
+class Progress:
+    """Files, bytes and errors so far, printed at most every `interval` seconds."""
+
+    def __init__(self, total: int, interval: float):
+        self.total = total
+        self.interval = interval
+        self.files = 0
+        self.bytes = 0
+        self.errors = 0
+        self.start = time.perf_counter()
+        self._last_report = self.start
+
+    def add(self, size: int, failed: bool) -> None:
+        self.files += 1
+        self.bytes += size
+        self.errors += failed
+        now = time.perf_counter()
+        if now - self._last_report >= self.interval:
+            self._last_report = now
+            print(f"📄 {self.line()}", file=sys.stderr)
+
+    def line(self) -> str:
+        elapsed = max(time.perf_counter() - self.start, 1e-9)
+        rate = self.files / elapsed
+        remaining = (self.total - self.files) / rate if rate else 0.0
+        return (f"{self.files}/{self.total} files, {rate:.1f} files/s, "
+                f"{self.bytes / elapsed / 1e6:.2f} MB/s, {self.errors} failed, "
+                f"elapsed {elapsed:.0f}s, eta {remaining:.0f}s")
+
+    def summary(self) -> Dict[str, Any]:
+        elapsed = time.perf_counter() - self.start
+        return {
+            "files": self.files,
+            "failed": self.errors,
+            "bytes": self.bytes,
+            "seconds": round(elapsed, 3),
+            "files_per_second": round(self.files / elapsed, 2) if elapsed else 0.0
+        }
+
+
+def parse_files(files: List[str], output: str, workers: int, mode: str, progress: Progress,
+                log_level: Optional[int] = logging.CRITICAL) -> None:
+    """
+    Parse files across a process pool, appending each result to output as it finishes.
+
+    Args:
+        files (List[str]): Absolute paths still to parse
+        output (str): JSONL file to append to
+        workers (int): Parser processes
+        mode (str): 'full' or 'contact', see ProfessionalResumeParser.process_resume
+        progress (Progress): Counters updated per file
+        log_level (int): Parser log level inside the workers (None keeps its own); failures
+            are recorded in the output either way
+    """
+    pending = iter(files)
+    with open(output, 'a', encoding='utf-8') as sink:
+        while True:
+            pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(log_level,))
+            in_flight: Dict[Any, Tuple[str, int]] = {}
+            try:
+                while True:
+                    while len(in_flight) < workers * QUEUED_PER_WORKER:
+                        path = next(pending, None)
+                        if path is None:
+                            break
+                        try:
+                            size = os.path.getsize(path)
+                        except OSError as e:
+                            _write(sink, path, _error_entry(f"Unreadable file: {e}"))
+                            progress.add(0, True)
+                            continue
+                        future = pool.submit(_parse_path_in_worker, path, guess_file_type(path), mode)
+                        in_flight[future] = (path, size)
+                    if not in_flight:
+                        return
+
+                    finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        path, size = in_flight[future]
+                        try:
+                            result = future.result()
+                        except BrokenProcessPool:
+                            raise
+                        except Exception as e:
+                            result = _error_entry(f"Processing failed: {e}")
+                        del in_flight[future]
+                        _write(sink, path, result)
+                        progress.add(size, bool(result.get('_fallback')))
+            except BrokenProcessPool as e:
+                # The crash is charged to every file in flight; rerun with --retry-errors to try them again
+                print(f"❌ Worker pool broke ({e}), restarting it", file=sys.stderr)
+                for path, size in in_flight.values():
+                    _write(sink, path, _error_entry(f"Worker crashed: {e}"))
+                    progress.add(size, True)
+            finally:
+                pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _write(sink, path: str, result: Dict[str, Any]) -> None:
+    """Append one record and flush it, so a crash loses at most the files in flight."""
+    sink.write(json.dumps({"path": path, "filename": os.path.basename(path), **result}) + '\n')
+    sink.flush()
+
+
+def _error_entry(message: str) -> Dict[str, Any]:
+    """Per-file error record, shaped like a fallback response."""
+    return {
+        "name": "",
+        "email": "",
+        "phone": "",
+        "_fallback": True,
+        "_error": message
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('paths', nargs='+', help='Resume files, directories or globs (quote globs)')
+    parser.add_argument('-o', '--output', required=True, help='JSONL file to append to')
+    parser.add_argument('--workers', type=int, default=0, help='Parser processes (default: available cores)')
+    parser.add_argument('--mode', choices=PARSE_MODES, default=MODE_FULL)
+    parser.add_argument('--retry-errors', action='store_true',
+                        help='Parse files again whose recorded result is a fallback')
+    parser.add_argument('--progress-every', type=float, default=5.0, help='Seconds between progress lines')
+    parser.add_argument('--verbose', action='store_true', help='Show the parser\'s per-file log lines')
+    args = parser.parse_args()
+
+    files = [os.path.abspath(path) for path in find_documents(args.paths)]
+    if not files:
+        print("❌ No PDF or DOCX files found", file=sys.stderr)
+        sys.exit(1)
+
+    done = load_checkpoint(args.output, args.retry_errors)
+    todo = [path for path in files if path not in done]
+    workers = args.workers or available_cpus()
+    print(f"🚀 {len(files)} files, {len(files) - len(todo)} already in {args.output}, "
+          f"parsing {len(todo)} with {workers} workers ({args.mode} mode)", file=sys.stderr)
+
+    progress = Progress(len(todo), args.progress_every)
+    try:
+        parse_files(todo, args.output, workers, args.mode, progress,
+                    None if args.verbose else logging.CRITICAL)
+    except KeyboardInterrupt:
+        print(f"\n⏸️  Interrupted after {progress.files} files; run again to resume", file=sys.stderr)
+        sys.exit(130)
+
+    summary = progress.summary()
+    print(f"✅ {progress.line()}", file=sys.stderr)
+    print(json.dumps(summary))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,361 @@
+#!/usr/bin/env python3
+"""
+Asynchronous Parse Jobs
+Runs resume parsing on a bounded in-process worker pool so large documents
+never hold a request thread. Submitting a job only enqueues it; callers poll
+for the result, and finished jobs expire after a TTL.
+
+With a spool directory configured, the spool holds the job state, so every
+process sharing it (e.g. gunicorn workers) answers polls for every job:
+<job_id>.json carries the job record and <job_id>.bin the file until the
+job finishes. Whichever process holds an exclusive flock on the .bin runs
+the job; the lock dies with its process, so jobs of a crashed or restarted
+process are re-queued by the next one to start, and a job still running
+elsewhere is never started twice.
+"""
+
+import os
+import re
+import json
+import time
+import uuid
+import fcntl
+import queue
+import logging
+import threading
+from collections import deque
+from datetime import datetime
+from typing import Dict, Any, BinaryIO, Callable, Optional
+
+STATUS_QUEUED = 'queued'
+STATUS_RUNNING = 'running'
+STATUS_DONE = 'done'
+STATUS_FAILED = 'failed'
+FINISHED_STATUSES = (STATUS_DONE, STATUS_FAILED)
+
+# uuid4().hex; anything else is never looked up in the spool directory
+JOB_ID_RE = re.compile(r'[0-9a-f]{32}')
+# Seconds between scans of the spool directory for expired jobs
+SPOOL_SWEEP_INTERVAL = 60.0
+
+
+class JobQueueFull(Exception):
+    """Raised when the pending-job limit is reached."""
+
+
+class ParseJobManager:
+    """
+    Bounded worker pool with pollable job records.
+    """
+
+    def __init__(self, handler: Callable[..., Dict[str, Any]], max_workers: int = 2,
+                 max_pending: int = 100, ttl_seconds: float = 900.0, spool_dir: Optional[str] = None):
+        """
+        Args:
+            handler (Callable): Called as handler(file_data, filename, file_type, mode)
+            max_workers (int): Worker threads
+            max_pending (int): Queued jobs accepted before submit() refuses
+            ttl_seconds (float): How long finished jobs stay pollable
+            spool_dir (str): Optional directory holding job state, shared by every
+                process that uses it and kept across restarts
+        """
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.handler = handler
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.ttl_seconds = ttl_seconds
+        self.spool_dir = spool_dir
+
+        self._jobs: Dict[str, Dict[str, Any]] = {}
+        self._finished: deque = deque()
+        self._queue: "queue.Queue" = queue.Queue()
+        self._pending = 0
+        self._lock = threading.Lock()
+        self._workers = []
+        self._started = False
+        self._last_sweep = 0.0
+
+    @classmethod
+    def from_env(cls, handler: Callable[..., Dict[str, Any]]) -> "ParseJobManager":
+        """Build a manager configured from the PARSE_JOB_* environment variables."""
+        return cls(
+            handler,
+            max_workers=int(os.environ.get('PARSE_JOB_WORKERS', 2)),
+            max_pending=int(os.environ.get('PARSE_JOB_MAX_PENDING', 100)),
+            ttl_seconds=float(os.environ.get('PARSE_JOB_TTL', 900)),
+            spool_dir=os.environ.get('PARSE_JOB_SPOOL_DIR') or None
+        )
+
+    def submit(self, file_data: bytes, filename: str, file_type: str, mode: str) -> Dict[str, Any]:
+        """
+        Enqueue a parse without waiting for it.
+
+        Returns:
+            Dict[str, Any]: The public job record
+
+        Raises:
+            JobQueueFull: If max_pending jobs are already waiting
+        """
+        self._ensure_started()
+        job_id = uuid.uuid4().hex
+        options = {"filename": filename, "file_type": file_type, "mode": mode}
+
+        with self._lock:
+            self._expire()
+            if self._pending >= self.max_pending:
+                raise JobQueueFull(f"{self._pending} jobs already pending")
+            self._pending += 1
+            job = self._new_record(job_id, options)
+
+        self._spool(job, file_data, options)
+        self._queue.put((job_id, file_data, options))
+        return self._public(job)
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Current state of a job, or None if it is unknown or expired."""
+        self._ensure_started()
+        if not JOB_ID_RE.fullmatch(job_id):
+            return None
+        # The spool is shared, so it also knows jobs submitted to other processes
+        state = self._load(job_id)
+        if state is not None:
+            job = state["job"]
+            if job["status"] in FINISHED_STATUSES and job.get("_expires_at", 0) <= time.time():
+                self._remove(job_id)
+                return None
+            return self._public(job)
+        with self._lock:
+            self._expire()
+            job = self._jobs.get(job_id)
+            return self._public(job) if job else None
+
+    def stats(self) -> Dict[str, Any]:
+        """Queue counters reported on /health."""
+        with self._lock:
+            self._expire()
+            running = sum(1 for job in self._jobs.values() if job["status"] == STATUS_RUNNING)
+            return {
+                "workers": self.max_workers,
+                "pending": self._pending - running,
+                "running": running,
+                "tracked": len(self._jobs),
+                "max_pending": self.max_pending,
+                "ttl_seconds": self.ttl_seconds
+            }
+
+    def _ensure_started(self) -> None:
+        """Start workers (and recover spooled jobs) on first use."""
+        with self._lock:
+            if self._started:
+                return
+            self._started = True
+            for index in range(self.max_workers):
+                worker = threading.Thread(target=self._work, name=f"parse-job-{index}", daemon=True)
+                worker.start()
+                self._workers.append(worker)
+        self._recover()
+
+    def _work(self) -> None:
+        """Worker loop: run queued jobs forever."""
+        while True:
+            job_id, file_data, options = self._queue.get()
+            claim = None
+            if self.spool_dir:
+                claim = self._claim(job_id)
+                if claim is None:
+                    # Finished or running in another process sharing the spool
+                    with self._lock:
+                        self._jobs.pop(job_id, None)
+                        self._pending -= 1
+                    continue
+                if file_data is None:
+                    file_data = claim.read()
+
+            with self._lock:
+                job = self._jobs[job_id]
+                job["status"] = STATUS_RUNNING
+                job["started_at"] = datetime.now().isoformat()
+            self._save(job, options)
+
+            try:
+                result = self.handler(file_data, options["filename"], options["file_type"], options["mode"])
+                status, error = STATUS_DONE, None
+            except Exception as e:
+                self.logger.error(f"Job {job_id} failed: {e}", exc_info=True)
+                result, status, error = None, STATUS_FAILED, str(e)
+            file_data = None
+
+            with self._lock:
+                job.update(status=status, result=result, error=error,
+                           finished_at=datetime.now().isoformat())
+                job["_expires"] = time.monotonic() + self.ttl_seconds
+                job["_expires_at"] = time.time() + self.ttl_seconds
+                self._finished.append((job["_expires"], job_id))
+                self._pending -= 1
+            self._save(job, options)
+            self._unspool(job_id)
+            if claim is not None:
+                claim.close()
+            self._sweep()
+
+    def _expire(self) -> None:
+        """Drop finished jobs past their TTL. Caller holds the lock."""
+        now = time.monotonic()
+        while self._finished and self._finished[0][0] <= now:
+            _, job_id = self._finished.popleft()
+            self._jobs.pop(job_id, None)
+
+    def _new_record(self, job_id: str, options: Dict[str, str]) -> Dict[str, Any]:
+        """Register a queued job. Caller holds the lock."""
+        job = {
+            "job_id": job_id,
+            "status": STATUS_QUEUED,
+            "filename": options["filename"],
+            "mode": options["mode"],
+            "created_at": datetime.now().isoformat(),
+            "started_at": None,
+            "finished_at": None,
+            "result": None,
+            "error": None
+        }
+        self._jobs[job_id] = job
+        return job
+
+    def _public(self, job: Dict[str, Any]) -> Dict[str, Any]:
+        """Job record without internal bookkeeping."""
+        return {key: value for key, value in job.items() if not key.startswith('_')}
+
+    def _spool(self, job: Dict[str, Any], file_data: bytes, options: Dict[str, str]) -> None:
+        """Persist a pending job so other processes see it and it survives a restart."""
+        if not self.spool_dir:
+            return
+        try:
+            os.makedirs(self.spool_dir, exist_ok=True)
+            with open(os.path.join(self.spool_dir, f"{job['job_id']}.bin"), 'wb') as handle:
+                handle.write(file_data)
+        except OSError as e:
+            self.logger.warning(f"Could not spool job {job['job_id']}: {e}")
+            return
+        self._save(job, options)
+
+    def _save(self, job: Dict[str, Any], options: Dict[str, str]) -> None:
+        """Atomically replace a job's record in the spool directory."""
+        if not self.spool_dir:
+            return
+        base = os.path.join(self.spool_dir, job["job_id"])
+        try:
+            with open(f"{base}.json.{os.getpid()}.tmp", 'w') as handle:
+                json.dump({"options": options, "job": job}, handle)
+            os.replace(f"{base}.json.{os.getpid()}.tmp", f"{base}.json")
+        except (OSError, TypeError, ValueError) as e:
+            self.logger.warning(f"Could not save job {job['job_id']}: {e}")
+
+    def _load(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """A job's record and options from the spool directory, or None."""
+        if not self.spool_dir:
+            return None
+        try:
+            with open(os.path.join(self.spool_dir, f"{job_id}.json")) as handle:
+                state = json.load(handle)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Unreadable spooled job {job_id}: {e}")
+            return None
+        if "job" not in state:
+            # Spooled by an older version: the options of a queued job only
+            return {"options": state, "job": {"job_id": job_id, "status": STATUS_QUEUED}}
+        return state
+
+    def _claim(self, job_id: str) -> Optional[BinaryIO]:
+        """
+        Lock a spooled job's file for this process.
+
+        Returns:
+            Optional[BinaryIO]: The locked file, open at its start; None if another
+                process holds the lock or the job has already finished
+        """
+        try:
+            handle = open(os.path.join(self.spool_dir, f"{job_id}.bin"), 'rb')
+        except FileNotFoundError:
+            return None
+        try:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            handle.close()
+            return None
+        # Unlinked after we opened it: the job finished while we waited for the lock
+        if os.fstat(handle.fileno()).st_nlink == 0:
+            handle.close()
+            return None
+        state = self._load(job_id)
+        if state is not None and state["job"]["status"] in FINISHED_STATUSES:
+            handle.close()
+            return None
+        return handle
+
+    def _unspool(self, job_id: str) -> None:
+        """Drop a finished job's file; its record stays pollable until the TTL."""
+        if not self.spool_dir:
+            return
+        try:
+            os.remove(os.path.join(self.spool_dir, f"{job_id}.bin"))
+        except OSError:
+            pass
+
+    def _remove(self, job_id: str) -> None:
+        """Remove every spool file of a job."""
+        for suffix in ('.json', '.bin'):
+            try:
+                os.remove(os.path.join(self.spool_dir, job_id + suffix))
+            except OSError:
+                pass
+
+    def _sweep(self) -> None:
+        """Remove expired job records from the spool directory, at most once per SPOOL_SWEEP_INTERVAL."""
+        now = time.monotonic()
+        if not self.spool_dir or now - self._last_sweep < SPOOL_SWEEP_INTERVAL:
+            return
+        self._last_sweep = now
+        try:
+            entries = os.listdir(self.spool_dir)
+        except OSError:
+            return
+        for entry in entries:
+            if not entry.endswith('.json') or not JOB_ID_RE.fullmatch(entry[:-len('.json')]):
+                continue
+            state = self._load(entry[:-len('.json')])
+            job = state["job"] if state else None
+            if job and job["status"] in FINISHED_STATUSES and job.get("_expires_at", 0) <= time.time():
+                self._remove(job["job_id"])
+
+    def _recover(self) -> None:
+        """
+        Queue spooled jobs that have not finished: left by a previous process,
+        or queued in another one. Whoever claims a job first runs it.
+        """
+        if not self.spool_dir or not os.path.isdir(self.spool_dir):
+            return
+        self._sweep()
+        recovered = 0
+        for entry in sorted(os.listdir(self.spool_dir)):
+            job_id = entry[:-len('.json')]
+            if not entry.endswith('.json') or not JOB_ID_RE.fullmatch(job_id):
+                continue
+            state = self._load(job_id)
+            if state is None or state["job"]["status"] in FINISHED_STATUSES:
+                continue
+            if not os.path.exists(os.path.join(self.spool_dir, f"{job_id}.bin")):
+                continue
+            options = state["options"]
+            with self._lock:
+                if job_id in self._jobs:
+                    continue
+                self._pending += 1
+                job = self._new_record(job_id, options)
+                job["created_at"] = state["job"].get("created_at", job["created_at"])
+            # The file is read once the job is claimed
+            self._queue.put((job_id, None, options))
+            recovered += 1
+        if recovered:
+            self.logger.info(f"Recovered {recovered} spooled parse jobs")
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Startup Prewarm
+Optionally parses a tiny embedded PDF and DOCX when the app starts, so the
+first real request does not pay for importing pdfplumber/pdfminer and PyPDF2
+or for their first-use setup (font metrics, XML parsers).
+Enable it with PARSER_PREWARM=1; under serve.py it runs once in the master
+before workers fork.
+"""
+
+import io
+import os
+import time
+import base64
+import logging
+import zipfile
+from typing import Dict
+
+from uploads import PDF_MIME
+from text_extraction import (iter_engine_pages, extract_docx_text, load_format_libraries,
+                             ENGINE_PYPDF2, ENGINE_PDFPLUMBER, PDF_AVAILABLE, PDFPLUMBER_AVAILABLE)
+
+logger = logging.getLogger(__name__)
+
+# One-page PDF with a name, email and phone (generated by benchmarks/samples.py)
+PREWARM_PDF = base64.b64decode(
+    'JVBERi0xLjQKMSAwIG9iago8PCAvVHlwZSAvQ2F0YWxvZyAvUGFnZXMgMiAwIFIgPj4KZW5kb2JqCjIgMCBvYmoK'
+    'PDwgL1R5cGUgL1BhZ2VzIC9LaWRzIFs0IDAgUl0gL0NvdW50IDEgPj4KZW5kb2JqCjMgMCBvYmoKPDwgL1R5cGUg'
+    'L0ZvbnQgL1N1YnR5cGUgL1R5cGUxIC9CYXNlRm9udCAvSGVsdmV0aWNhIC9FbmNvZGluZyAvV2luQW5zaUVuY29k'
+    'aW5nID4+CmVuZG9iago0IDAgb2JqCjw8IC9UeXBlIC9QYWdlIC9QYXJlbnQgMiAwIFIgL01lZGlhQm94IFswIDAg'
+    'NjEyIDc5Ml0gL1Jlc291cmNlcyA8PCAvRm9udCA8PCAvRjEgMyAwIFIgPj4gPj4gL0NvbnRlbnRzIDUgMCBSID4+'
+    'CmVuZG9iago1IDAgb2JqCjw8IC9MZW5ndGggMTU5ID4+CnN0cmVhbQpCVCAvRjEgMTAuNSBUZiA1NCA3NDAgVGQg'
+    'KFByZXdhcm0gU2FtcGxlKSBUaiBFVCBCVCAvRjEgMTAuNSBUZiA1NCA3MjYgVGQgKHByZXdhcm1AZXhhbXBsZS5j'
+    'b20gfCA1NTUtMDEwLTAxOTkpIFRqIEVUIEJUIC9GMSAxMC41IFRmIDU0IDcxMiBUZCAoRXhwZXJpZW5jZSkgVGog'
+    'RVQKZW5kc3RyZWFtCmVuZG9iagp4cmVmCjAgNgowMDAwMDAwMDAwIDY1NTM1IGYgCjAwMDAwMDAwMDkgMDAwMDAg'
+    'biAKMDAwMDAwMDA1OCAwMDAwMCBuIAowMDAwMDAwMTE1IDAwMDAwIG4gCjAwMDAwMDAyMTIgMDAwMDAgbiAKMDAw'
+    'MDAwMDMzOCAwMDAwMCBuIAp0cmFpbGVyCjw8IC9TaXplIDYgL1Jvb3QgMSAwIFIgPj4Kc3RhcnR4cmVmCjU0OAol'
+    'JUVPRgo='
+)
+
+# Smallest DOCX package: content types, one relationship, one paragraph
+PREWARM_DOCX_PARTS = {
+    '[Content_Types].xml': (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/word/document.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+        '</Types>'
+    ),
+    '_rels/.rels': (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" Target="word/document.xml" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument"/>'
+        '</Relationships>'
+    ),
+    'word/document.xml': (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+        '<w:body><w:p><w:r><w:t>Prewarm Sample</w:t></w:r></w:p></w:body>'
+        '</w:document>'
+    )
+}
+
+
+def prewarm_docx() -> bytes:
+    """Build the embedded DOCX package."""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w') as package:
+        for name, xml in PREWARM_DOCX_PARTS.items():
+            package.writestr(name, xml)
+    return buffer.getvalue()
+
+
+def prewarm() -> Dict[str, float]:
+    """
+    Import the document libraries and run each engine once on tiny inputs.
+
+    Returns:
+        Dict[str, float]: Milliseconds spent per step
+    """
+    timings = {}
+
+    def timed(step, func, *args):
+        start = time.perf_counter()
+        try:
+            func(*args)
+        except Exception as e:
+            logger.warning(f"Prewarm step {step} failed: {e}")
+        timings[step] = round((time.perf_counter() - start) * 1000, 1)
+
+    timed('import_pdf', load_format_libraries, PDF_MIME)
+    if PDF_AVAILABLE:
+        timed(ENGINE_PYPDF2, lambda: list(iter_engine_pages(PREWARM_PDF, ENGINE_PYPDF2)))
+    if PDFPLUMBER_AVAILABLE:
+        timed(ENGINE_PDFPLUMBER, lambda: list(iter_engine_pages(PREWARM_PDF, ENGINE_PDFPLUMBER)))
+    timed('docx', extract_docx_text, prewarm_docx())
+
+    logger.info(f"Prewarm finished: {timings}")
+    return timings
+
+
+def prewarm_from_env() -> Dict[str, float]:
+    """Run prewarm() if PARSER_PREWARM=1, otherwise do nothing."""
+    if os.environ.get('PARSER_PREWARM') != '1':
+        return {}
+    return prewarm()
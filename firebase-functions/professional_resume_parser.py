@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Professional Resume Parser
+Inspired by the intake curation agent pattern for robust document processing.
+
+The parser class on its own, without the Flask app in professional_parser.py,
+so batch and directory workers can build one without starting an app,
+admission controller, job manager or prewarm of their own.
+"""
+
+import time
+import logging
+from typing import Dict, Any, Optional
+
+from parse_cache import ParseCache
+from extraction_worker import SupervisedExtractor, get_extractor
+from field_extraction import extract_fields
+from text_extraction import (scan_pdf_fields, scan_pdf_layout, extract_docx_text, load_format_libraries, ENGINE_DOCX,
+                             MODE_FULL, MODE_CONTACT, MODE_LAYOUT, PDF_AVAILABLE, PDFPLUMBER_AVAILABLE, OCR_AVAILABLE)
+from metrics import stage_timer, record_parse, STAGE_FIELDS
+
+PARSER_VERSION = "2.2.1"
+
+# Suppress noisy logging
+logging.getLogger('pdfminer').setLevel(logging.WARNING)
+
+class ProfessionalResumeParser:
+    """
+    Professional Resume Parser Agent
+    Extracts structured profile information from resumes with robust error handling.
+    """
+
+    def __init__(self, extractor: Optional[SupervisedExtractor] = None):
+        """
+        Initialize the agent with professional logging.
+
+        Args:
+            extractor (SupervisedExtractor): Extraction workers to use (default: the process-wide pool)
+        """
+        self.logger = logging.getLogger(self.__class__.__name__)
+        if not self.logger.handlers:
+            handler = logging.StreamHandler()
+            formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+            handler.setFormatter(formatter)
+            self.logger.addHandler(handler)
+            self.logger.setLevel(logging.INFO)
+
+        self.logger.info("ProfessionalResumeParser initialized")
+        self.logger.info(f"PDF Support: {'✅' if PDF_AVAILABLE or PDFPLUMBER_AVAILABLE else '❌'}")
+        self.logger.info(f"OCR Support: {'✅' if OCR_AVAILABLE else '❌'}")
+
+        self.cache = ParseCache.from_env(self.__class__.__name__, PARSER_VERSION)
+        self.extractor = extractor or get_extractor()
+
+    def process_resume(self, file_data: bytes, filename: str, file_type: str,
+                       mode: str = MODE_FULL) -> Dict[str, Any]:
+        """
+        Main entry point for processing a resume file.
+        
+        Args:
+            file_data (bytes): Raw file content
+            filename (str): Original filename
+            file_type (str): MIME type of the file
+            mode (str): 'full' reads every page, 'contact' stops once name/email/phone are found,
+                'layout' reads them from the first page's layout
+            
+        Returns:
+            Dict[str, Any]: Structured profile information
+        """
+        start_time = time.perf_counter()
+        result = self._process_resume(file_data, filename, file_type, mode, start_time)
+        record_parse(self.__class__.__name__, result, len(file_data), time.perf_counter() - start_time)
+        return result
+
+    def _process_resume(self, file_data: bytes, filename: str, file_type: str, mode: str,
+                        start_time: float) -> Dict[str, Any]:
+        """Cache lookup and extraction behind process_resume."""
+        self.logger.info(f"Processing resume: {filename} (type: {file_type})")
+
+        cache_key = self.cache.make_key(file_data, file_type, mode)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            self.logger.info(f"⚡ Cache hit for {filename}")
+            return cached
+        
+        try:
+            # Import this format's libraries here so extraction workers inherit them
+            load_format_libraries(file_type)
+
+            # Extract fields based on file type
+            if file_type == 'application/pdf':
+                # Pages stream through the field scanner; contact mode stops early
+                self.logger.info(f"Extracting PDF text page by page ({mode} mode)...")
+                if mode == MODE_LAYOUT:
+                    scan = self.extractor.run(scan_pdf_layout, file_data)
+                else:
+                    scan = self.extractor.run(scan_pdf_fields, file_data, mode == MODE_CONTACT)
+                fields, has_text, engine = scan.fields, scan.has_text, scan.engine
+                self.logger.info(f"✅ PDF scanned with {engine}: {scan.pages_read} page(s), quality {scan.quality}")
+            elif file_type == 'application/vnd.openxmlformats-officedocument.wordprocessingml.document':
+                text = self._extract_docx_text(file_data)
+                with stage_timer(STAGE_FIELDS):
+                    fields = extract_fields(text)
+                has_text, engine = bool(text.strip()), ENGINE_DOCX
+            else:
+                return self._create_fallback_response(f"Unsupported file type: {file_type}")
+
+            if not has_text:
+                return self._create_fallback_response("Could not extract text from file")
+
+            # Extract profile information
+            profile = self._extract_profile_info(fields)
+            
+            processing_time = time.perf_counter() - start_time
+            self.logger.info(f"✅ Successfully processed {filename} in {processing_time:.2f}s")
+            
+            result = {
+                "name": profile.get("name", ""),
+                "email": profile.get("email", ""),
+                "phone": profile.get("phone", ""),
+                "_fallback": profile.get("_fallback", False),
+                "_error": profile.get("_error", ""),
+                "_missing_fields": profile.get("_missing_fields", []),
+                "_message": profile.get("_message", ""),
+                "_extraction_engine": engine
+            }
+            self.cache.put(cache_key, result)
+            return result
+            
+        except Exception as e:
+            self.logger.error(f"❌ Error processing {filename}: {e}", exc_info=True)
+            
+            return self._create_fallback_response(f"Processing failed: {str(e)}")
+
+    def _extract_docx_text(self, file_data: bytes) -> str:
+        """Extract text from DOCX file."""
+        self.logger.info("Extracting DOCX text...")
+        try:
+            text = self.extractor.run(extract_docx_text, file_data)
+            self.logger.info(f"✅ DOCX text extracted: {len(text)} chars")
+            return text
+        except Exception as e:
+            self.logger.error(f"DOCX extraction failed: {e}")
+            raise
+
+    def _extract_profile_info(self, fields: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the profile from extracted fields, flagging missing ones."""
+        profile = dict(fields)
+        
+        # Check if we have essential information
+        missing_fields = [k for k, v in profile.items() if not v and k in ['name', 'email', 'phone']]
+        
+        if missing_fields:
+            profile["_fallback"] = True
+            profile["_missing_fields"] = missing_fields
+            profile["_message"] = f"Missing essential fields: {', '.join(missing_fields)}. Please enter manually."
+        
+        self.logger.info(f"Profile extraction complete. Missing fields: {missing_fields}")
+        return profile
+
+    def _create_fallback_response(self, message: str) -> Dict[str, Any]:
+        """Create a fallback response when processing fails."""
+        return {
+            "name": "",
+            "email": "",
+            "phone": "",
+            "_fallback": True,
+            "_error": message
+        }
@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+"""
+Columnar Result Export
+Writes process_resume results to Parquet or Arrow IPC files for analytics,
+and reads them back for offline re-scoring.
+
+Rows are buffered in plain column lists and written one row group (Parquet)
+or record batch (Arrow IPC) at a time, so an export holds at most
+row_group_size results in memory however large the source is. Reading goes
+batch by batch in the same way.
+
+Every key of a parse result maps to a column of the same name; keys a parser
+does not produce are null and are left out again on import, so results from
+ResumeParserAgent and ProfessionalResumeParser share one schema and round
+trip unchanged. Keys outside the schema are kept as JSON in `_extra`.
+
+Parquet and Arrow need pyarrow. JSON Lines (.jsonl) works without it and is
+also what parse tooling writes, so it is accepted everywhere a file is.
+"""
+
+import os
+import json
+import logging
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Tuple
+
+from lazy_imports import module_available, load_module
+
+PYARROW_AVAILABLE = module_available('pyarrow')
+
+FORMAT_PARQUET = 'parquet'
+FORMAT_ARROW = 'arrow'
+FORMAT_JSONL = 'jsonl'
+FORMATS = (FORMAT_PARQUET, FORMAT_ARROW, FORMAT_JSONL)
+
+EXTENSIONS = {
+    '.parquet': FORMAT_PARQUET,
+    '.pq': FORMAT_PARQUET,
+    '.arrow': FORMAT_ARROW,
+    '.feather': FORMAT_ARROW,
+    '.ipc': FORMAT_ARROW,
+    '.jsonl': FORMAT_JSONL,
+    '.ndjson': FORMAT_JSONL,
+}
+
+DEFAULT_ROW_GROUP_SIZE = 10000
+
+# (column, type) in file order; 'list' columns hold lists of strings
+SOURCE_COLUMNS = [('parser', 'string'), ('parser_version', 'string')]
+RESULT_COLUMNS = [
+    ('document_id', 'string'),
+    ('filename', 'string'),
+    ('status', 'string'),
+    ('name', 'string'),
+    ('email', 'string'),
+    ('phone', 'string'),
+    ('skills', 'list'),
+    ('experience', 'string'),
+    ('education', 'string'),
+    ('summary', 'string'),
+    ('extraction_engine', 'string'),
+    ('_extraction_engine', 'string'),
+    ('extracted_text_length', 'int64'),
+    ('processing_time_seconds', 'float64'),
+    ('error', 'string'),
+    ('_fallback', 'bool'),
+    ('_error', 'string'),
+    ('_missing_fields', 'list'),
+    ('_message', 'string'),
+]
+EXTRA_COLUMN = '_extra'
+COLUMNS = [name for name, _ in SOURCE_COLUMNS + RESULT_COLUMNS] + [EXTRA_COLUMN]
+
+_RESULT_KEYS = frozenset(name for name, _ in RESULT_COLUMNS)
+
+
+def detect_format(path: str, fmt: Optional[str] = None) -> str:
+    """The explicit format if given, else the one implied by the file extension."""
+    if fmt:
+        if fmt not in FORMATS:
+            raise ValueError(f"Unsupported format: {fmt} (expected one of {', '.join(FORMATS)})")
+        return fmt
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in EXTENSIONS:
+        raise ValueError(f"Cannot tell the format of {path}; use .parquet, .arrow or .jsonl")
+    return EXTENSIONS[extension]
+
+
+def result_schema():
+    """The pyarrow schema every export uses."""
+    pa = load_module('pyarrow')
+    types = {'string': pa.string(), 'list': pa.list_(pa.string()), 'int64': pa.int64(),
+             'float64': pa.float64(), 'bool': pa.bool_()}
+    return pa.schema([(name, types[kind]) for name, kind in SOURCE_COLUMNS + RESULT_COLUMNS]
+                     + [(EXTRA_COLUMN, pa.string())])
+
+
+def flatten_result(result: Dict[str, Any], parser: str = '', parser_version: str = '') -> Dict[str, Any]:
+    """One export row: schema keys as columns, everything else as JSON in _extra."""
+    row = {name: result.get(name) for name in _RESULT_KEYS}
+    row['parser'] = parser or None
+    row['parser_version'] = parser_version or None
+    extra = {key: value for key, value in result.items() if key not in _RESULT_KEYS}
+    row[EXTRA_COLUMN] = json.dumps(extra) if extra else None
+    return row
+
+
+def unflatten_row(row: Dict[str, Any]) -> Dict[str, Any]:
+    """The parse result behind an export row, with its source columns."""
+    result = {name: row[name] for name, _ in RESULT_COLUMNS if row.get(name) is not None}
+    if row.get(EXTRA_COLUMN):
+        result.update(json.loads(row[EXTRA_COLUMN]))
+    for name, _ in SOURCE_COLUMNS:
+        if row.get(name):
+            result[name] = row[name]
+    return result
+
+
+class ResultWriter:
+    """
+    Streams parse results to a Parquet, Arrow IPC or JSON Lines file.
+    """
+
+    def __init__(self, path: str, fmt: Optional[str] = None,
+                 row_group_size: int = DEFAULT_ROW_GROUP_SIZE):
+        """
+        Args:
+            path (str): Output file, replaced if it exists
+            fmt (str): 'parquet', 'arrow' or 'jsonl' (default: from the extension)
+            row_group_size (int): Results buffered before a row group is written
+
+        Raises:
+            ValueError: If the format is unknown
+            RuntimeError: If Parquet or Arrow is requested without pyarrow
+        """
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.path = path
+        self.format = detect_format(path, fmt)
+        self.row_group_size = max(1, row_group_size)
+        if self.format != FORMAT_JSONL and not PYARROW_AVAILABLE:
+            raise RuntimeError("pyarrow is not installed; export to .jsonl or install pyarrow")
+
+        self._columns: Dict[str, List[Any]] = {name: [] for name in COLUMNS}
+        self._buffered = 0
+        self._sink = None
+        self._closed = False
+        self.rows = 0
+        self.row_groups = 0
+
+    def __enter__(self) -> "ResultWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def write(self, result: Dict[str, Any], parser: str = '', parser_version: str = '') -> None:
+        """Buffer one result, writing a row group once row_group_size are buffered."""
+        row = flatten_result(result, parser, parser_version)
+        for name in COLUMNS:
+            self._columns[name].append(row[name])
+        self._buffered += 1
+        self.rows += 1
+        if self._buffered >= self.row_group_size:
+            self._write_buffer()
+
+    def write_all(self, results: Iterable[Dict[str, Any]], parser: str = '', parser_version: str = '') -> int:
+        """Write every result from an iterable; returns how many."""
+        count = 0
+        for result in results:
+            self.write(result, parser, parser_version)
+            count += 1
+        return count
+
+    def close(self) -> None:
+        """Write the last partial row group and finish the file."""
+        if self._closed:
+            return
+        self._write_buffer()
+        self._sink.close()
+        self._sink = None
+        self._closed = True
+
+    def _write_buffer(self) -> None:
+        """Write the buffered rows as one row group / record batch and empty the buffer."""
+        if self.format == FORMAT_JSONL:
+            if self._sink is None:
+                self._sink = open(self.path, 'w', encoding='utf-8')
+            for index in range(self._buffered):
+                row = {name: self._columns[name][index] for name in COLUMNS}
+                self._sink.write(json.dumps(unflatten_row(row)) + '\n')
+        else:
+            pa = load_module('pyarrow')
+            schema = result_schema()
+            if self._sink is None:
+                if self.format == FORMAT_PARQUET:
+                    self._sink = load_module('pyarrow.parquet').ParquetWriter(self.path, schema)
+                else:
+                    self._sink = pa.ipc.new_file(self.path, schema)
+            if self._buffered:
+                batch = pa.RecordBatch.from_arrays(
+                    [pa.array(self._columns[name], type=schema.field(name).type) for name in COLUMNS],
+                    schema=schema
+                )
+                if self.format == FORMAT_PARQUET:
+                    self._sink.write_batch(batch, row_group_size=self._buffered)
+                else:
+                    self._sink.write_batch(batch)
+
+        if self._buffered:
+            self.row_groups += 1
+        self._columns = {name: [] for name in COLUMNS}
+        self._buffered = 0
+
+
+def export_results(results: Iterable[Dict[str, Any]], path: str, fmt: Optional[str] = None,
+                   row_group_size: int = DEFAULT_ROW_GROUP_SIZE, parser: str = '',
+                   parser_version: str = '') -> Dict[str, Any]:
+    """
+    Write results to a columnar file.
+
+    Args:
+        results (Iterable[Dict[str, Any]]): process_resume results, consumed lazily
+        path (str): Output file
+        fmt (str): 'parquet', 'arrow' or 'jsonl' (default: from the extension)
+        row_group_size (int): Results per row group
+        parser (str): Parser name recorded with each row
+        parser_version (str): Parser version recorded with each row
+
+    Returns:
+        Dict[str, Any]: path, format, rows and row_groups written
+    """
+    with ResultWriter(path, fmt, row_group_size) as writer:
+        writer.write_all(results, parser, parser_version)
+    return {"path": path, "format": writer.format, "rows": writer.rows, "row_groups": writer.row_groups}
+
+
+def iter_record_batches(path: str, fmt: Optional[str] = None,
+                        batch_size: int = DEFAULT_ROW_GROUP_SIZE) -> Iterator[List[Dict[str, Any]]]:
+    """
+    Read an export back in batches of parse results.
+
+    Args:
+        path (str): File written by export_results (or any JSON Lines file of results)
+        fmt (str): 'parquet', 'arrow' or 'jsonl' (default: from the extension)
+        batch_size (int): Results per batch for JSON Lines and Parquet; Arrow IPC
+            files yield the record batches they were written with
+
+    Yields:
+        List[Dict[str, Any]]: Results, each with parser/parser_version when recorded
+
+    Raises:
+        RuntimeError: If the file is Parquet or Arrow and pyarrow is not installed
+    """
+    fmt = detect_format(path, fmt)
+    if fmt == FORMAT_JSONL:
+        batch = []
+        with open(path, encoding='utf-8') as handle:
+            for line in handle:
+                if line.strip():
+                    batch.append(json.loads(line))
+                if len(batch) >= batch_size:
+                    yield batch
+                    batch = []
+        if batch:
+            yield batch
+        return
+
+    if not PYARROW_AVAILABLE:
+        raise RuntimeError("pyarrow is not installed; cannot read Parquet or Arrow files")
+    if fmt == FORMAT_PARQUET:
+        batches = load_module('pyarrow.parquet').ParquetFile(path).iter_batches(batch_size=batch_size)
+    else:
+        reader = load_module('pyarrow').ipc.open_file(path)
+        batches = (reader.get_batch(index) for index in range(reader.num_record_batches))
+    for record_batch in batches:
+        yield [unflatten_row(row) for row in record_batch.to_pylist()]
+
+
+def iter_results(path: str, fmt: Optional[str] = None,
+                 batch_size: int = DEFAULT_ROW_GROUP_SIZE) -> Iterator[Dict[str, Any]]:
+    """Every result in an export, one at a time; see iter_record_batches."""
+    for batch in iter_record_batches(path, fmt, batch_size):
+        yield from batch
+
+
+def iter_batch_output(path: str) -> Iterator[Dict[str, Any]]:
+    """Results from a saved /parse-resumes response ({"results": [...]}), a JSON list or JSON Lines."""
+    if not path.lower().endswith('.json'):
+        yield from iter_results(path, FORMAT_JSONL)
+        return
+    with open(path, encoding='utf-8') as handle:
+        data = json.load(handle)
+    yield from data.get('results', []) if isinstance(data, dict) else data
+
+
+def cached_results(entries: Iterable[Tuple[str, str, str, Dict[str, Any]]]) -> Iterator[Tuple[str, str, Dict[str, Any]]]:
+    """
+    (parser, version, result) for parse_cache.iter_entries rows, with document_id
+    filled in from the key's content address where the parser does not store it.
+    """
+    for key, namespace, version, result in entries:
+        if 'document_id' not in result:
+            result = {"document_id": key.rsplit(':', 1)[-1], **result}
+        yield namespace, version, result
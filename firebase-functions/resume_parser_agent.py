@@ -3,33 +3,34 @@ Professional Resume Parser Agent
 Inspired by the intake curation agent pattern for robust document processing.
 """
 
+import os
 import json
-import re
-import io
+import time
 import logging
 from datetime import datetime
-from typing import Dict, List, Any, Optional
-from flask import Flask, request, jsonify
+from typing import Dict, List, Any, Optional, Tuple
+from flask import Flask, Response, request, jsonify
 from flask_cors import CORS
 
-# PDF processing libraries
-try:
-    import PyPDF2
-    PDF_AVAILABLE = True
-except ImportError:
-    PDF_AVAILABLE = False
-
-try:
-    import pdfplumber
-    PDFPLUMBER_AVAILABLE = True
-except ImportError:
-    PDFPLUMBER_AVAILABLE = False
-
-try:
-    from docx import Document
-    DOCX_AVAILABLE = True
-except ImportError:
-    DOCX_AVAILABLE = False
+from parse_cache import ParseCache
+from extraction_worker import get_extractor, ExtractionError
+from admission import AdmissionController, AdmissionRejected
+from similarity_index import SimilarityIndex, document_id, minhash_signature
+from search_index import SearchIndex
+from candidate_matching import CandidateMatcher
+from lazy_imports import import_timings
+from prewarm import prewarm_from_env
+from uploads import read_upload, UploadError
+from field_extraction import extract_fields
+from skill_matcher import get_skill_matcher
+from sections import segment_sections
+from text_extraction import (scan_pdf_fields, extract_docx_text, load_format_libraries, ENGINE_DOCX,
+                             PDF_AVAILABLE, PDFPLUMBER_AVAILABLE, OCR_AVAILABLE)
+from metrics import (stage_timer, record_parse, render_metrics, CONTENT_TYPE, STAGE_DECODE,
+                     STAGE_FIELDS, STAGE_SECTIONS, STAGE_SKILLS, STAGE_SIMILARITY,
+                     STAGE_SEARCH_INDEX)
+
+PARSER_VERSION = "1.5.1"
 
 # Suppress noisy logging
 logging.getLogger('werkzeug').setLevel(logging.WARNING)
@@ -52,7 +53,19 @@ class ResumeParserAgent:
 
         self.logger.info("ResumeParserAgent initialized")
         self.logger.info(f"PDF Support: {'✅' if PDF_AVAILABLE or PDFPLUMBER_AVAILABLE else '❌'}")
-        self.logger.info(f"DOCX Support: {'✅' if DOCX_AVAILABLE else '❌'}")
+        self.logger.info(f"OCR Support: {'✅' if OCR_AVAILABLE else '❌'}")
+
+        self.cache = ParseCache.from_env(self.__class__.__name__, PARSER_VERSION)
+        self.extractor = get_extractor()
+        self.skill_matcher = get_skill_matcher()
+        self.logger.info(f"Skill taxonomy: {len(self.skill_matcher.skills)} skills")
+        self.similarity = SimilarityIndex.from_env()
+        self.search_index = SearchIndex.from_env()
+        self.matcher = CandidateMatcher()
+        if self.matcher.available:
+            loaded = self.matcher.load((doc_id, profile.get('skills') or [])
+                                       for doc_id, profile in self.search_index.profiles())
+            self.logger.info(f"Candidate matcher: {loaded} stored candidates")
 
     def process_resume(self, file_data: bytes, filename: str, file_type: str) -> Dict[str, Any]:
         """
@@ -66,37 +79,64 @@ class ResumeParserAgent:
         Returns:
             Dict[str, Any]: Structured profile information
         """
-        start_time = datetime.now()
+        start_time = time.perf_counter()
+        result = self._process_resume(file_data, filename, file_type, start_time)
+        record_parse(self.__class__.__name__, result, len(file_data), time.perf_counter() - start_time)
+        return result
+
+    def _process_resume(self, file_data: bytes, filename: str, file_type: str,
+                        start_time: float) -> Dict[str, Any]:
+        """Cache lookup and extraction behind process_resume."""
         self.logger.info(f"Processing resume: {filename} (type: {file_type})")
+
+        cache_key = self.cache.make_key(file_data, file_type, self.skill_matcher.digest)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            processing_time = time.perf_counter() - start_time
+            self.logger.info(f"Cache hit for {filename}")
+            return {
+                **cached,
+                "processing_time_seconds": processing_time,
+                "filename": filename
+            }
         
         try:
-            # Extract text based on file type
-            if file_type == 'application/pdf':
-                text = self._extract_pdf_text(file_data)
-            elif file_type == 'application/vnd.openxmlformats-officedocument.wordprocessingml.document':
-                text = self._extract_docx_text(file_data)
-            else:
-                raise ValueError(f"Unsupported file type: {file_type}")
+            text, engine = self._extract_text(file_data, file_type)
 
             if not text.strip():
                 return self._create_fallback_response("Could not extract text from file")
 
             # Extract structured profile information
             profile = self._extract_profile_info(text)
+
+            # Index the text so later uploads can be checked for near-duplicates
+            doc_id = document_id(file_data)
+            with stage_timer(STAGE_SIMILARITY):
+                self.similarity.add(doc_id, minhash_signature(text), filename)
+
+            # Keep the profile searchable for /search
+            with stage_timer(STAGE_SEARCH_INDEX):
+                self.search_index.add(doc_id, {**profile, "filename": filename})
+            if self.matcher.available:
+                self.matcher.add(doc_id, profile["skills"])
             
-            processing_time = (datetime.now() - start_time).total_seconds()
+            processing_time = time.perf_counter() - start_time
             self.logger.info(f"Successfully processed {filename} in {processing_time:.2f}s")
             
-            return {
+            result = {
                 "status": "SUCCESS",
                 "processing_time_seconds": processing_time,
                 "filename": filename,
                 "extracted_text_length": len(text),
+                "extraction_engine": engine,
+                "document_id": doc_id,
                 **profile
             }
+            self.cache.put(cache_key, result)
+            return result
             
         except Exception as e:
-            processing_time = (datetime.now() - start_time).total_seconds()
+            processing_time = time.perf_counter() - start_time
             self.logger.error(f"Error processing {filename}: {e}", exc_info=True)
             
             return {
@@ -107,50 +147,84 @@ class ResumeParserAgent:
                 **self._create_fallback_response(f"Processing failed: {str(e)}")
             }
 
-    def _extract_pdf_text(self, file_data: bytes) -> str:
-        """Extract text from PDF using multiple methods for better accuracy."""
-        self.logger.info("Extracting text from PDF...")
+    def find_similar(self, file_data: bytes, filename: str, file_type: str,
+                     threshold: Optional[float] = None, limit: int = 10) -> Dict[str, Any]:
+        """
+        Look a resume up in the near-duplicate index without adding it.
+        
+        Args:
+            file_data (bytes): Raw file content
+            filename (str): Original filename
+            file_type (str): MIME type of the file
+            threshold (float): Minimum estimated similarity (default: SIMILARITY_THRESHOLD)
+            limit (int): Maximum matches returned
+            
+        Returns:
+            Dict[str, Any]: The upload's document_id and its matches, best first
+        """
+        self.logger.info(f"Finding resumes similar to {filename}")
+        doc_id = document_id(file_data)
+        text, _ = self._extract_text(file_data, file_type)
+        if not text.strip():
+            raise ValueError("Could not extract text from file")
+        
+        with stage_timer(STAGE_SIMILARITY):
+            matches = self.similarity.query(minhash_signature(text), threshold, limit, exclude=doc_id)
+        return {"document_id": doc_id, "filename": filename, "matches": matches}
+
+    def match_candidates(self, jobs: List[Dict[str, Any]], limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        Rank stored candidates against job descriptions by skill overlap.
         
-        # Method 1: Try pdfplumber first (better for complex layouts)
-        if PDFPLUMBER_AVAILABLE:
-            try:
-                with pdfplumber.open(io.BytesIO(file_data)) as pdf:
-                    text = ""
-                    for page in pdf.pages:
-                        page_text = page.extract_text()
-                        if page_text:
-                            text += page_text + "\n"
-                    if text.strip():
-                        self.logger.info(f"PDF text extracted using pdfplumber: {len(text)} chars")
-                        return text
-            except Exception as e:
-                self.logger.warning(f"pdfplumber failed: {e}")
+        Args:
+            jobs (List[Dict[str, Any]]): Each with a `job_description` and/or a `skills` list
+            limit (int): Candidates returned per job
+            
+        Returns:
+            List[Dict[str, Any]]: Per job, the recognized job_skills and the ranked candidates
+            with their stored contact fields
+        """
+        job_skills = [
+            self.skill_matcher.match(f"{job.get('job_description') or ''}\n{', '.join(job.get('skills') or [])}")
+            for job in jobs
+        ]
+        ranked = self.matcher.match(job_skills, limit)
         
-        # Method 2: Fallback to PyPDF2
-        if PDF_AVAILABLE:
-            try:
-                pdf_reader = PyPDF2.PdfReader(io.BytesIO(file_data))
-                text = ""
-                for page in pdf_reader.pages:
-                    text += page.extract_text() + "\n"
-                self.logger.info(f"PDF text extracted using PyPDF2: {len(text)} chars")
-                return text
-            except Exception as e:
-                self.logger.error(f"PyPDF2 failed: {e}")
+        profiles = self.search_index.get_profiles([hit["document_id"] for hits in ranked for hit in hits])
+        return [
+            {
+                "job_skills": skills,
+                "results": [{**hit, **{field: profiles.get(hit["document_id"], {}).get(field, "")
+                                       for field in ('name', 'email', 'phone', 'filename')}}
+                            for hit in hits]
+            }
+            for skills, hits in zip(job_skills, ranked)
+        ]
+
+    def _extract_text(self, file_data: bytes, file_type: str) -> Tuple[str, str]:
+        """Extract text based on file type; returns (text, engine)."""
+        # Import this format's libraries here so extraction workers inherit them
+        load_format_libraries(file_type)
+
+        if file_type == 'application/pdf':
+            return self._extract_pdf_text(file_data)
+        if file_type == 'application/vnd.openxmlformats-officedocument.wordprocessingml.document':
+            return self._extract_docx_text(file_data), ENGINE_DOCX
+        raise ValueError(f"Unsupported file type: {file_type}")
+
+    def _extract_pdf_text(self, file_data: bytes) -> Tuple[str, str]:
+        """Extract text from PDF with the cheapest engine that scores well; returns (text, engine)."""
+        self.logger.info("Extracting text from PDF...")
         
-        raise Exception("No PDF processing libraries available")
+        scan = self.extractor.run(scan_pdf_fields, file_data, False, True)
+        self.logger.info(f"PDF text extracted using {scan.engine}: {len(scan.text)} chars, quality {scan.quality}")
+        return scan.text, scan.engine
 
     def _extract_docx_text(self, file_data: bytes) -> str:
         """Extract text from DOCX file."""
-        if not DOCX_AVAILABLE:
-            raise Exception("DOCX processing library not available")
-        
         self.logger.info("Extracting text from DOCX...")
         try:
-            doc = Document(io.BytesIO(file_data))
-            text = ""
-            for paragraph in doc.paragraphs:
-                text += paragraph.text + "\n"
+            text = self.extractor.run(extract_docx_text, file_data)
             self.logger.info(f"DOCX text extracted: {len(text)} chars")
             return text
         except Exception as e:
@@ -161,14 +235,19 @@ class ResumeParserAgent:
         """Extract structured profile information from text."""
         self.logger.info("Extracting profile information...")
         
+        with stage_timer(STAGE_SECTIONS):
+            sections = segment_sections(text)
+        with stage_timer(STAGE_FIELDS):
+            fields = extract_fields(text)
+        with stage_timer(STAGE_SKILLS):
+            skills = self._extract_skills(text)
+        
         profile = {
-            "name": self._extract_name(text),
-            "email": self._extract_email(text),
-            "phone": self._extract_phone(text),
-            "skills": self._extract_skills(text),
-            "experience": self._extract_experience(text),
-            "education": self._extract_education(text),
-            "summary": self._extract_summary(text)
+            **fields,
+            "skills": skills,
+            "experience": self._extract_experience(sections),
+            "education": self._extract_education(sections),
+            "summary": self._extract_summary(sections)
         }
         
         # Check if we have essential information
@@ -182,111 +261,21 @@ class ResumeParserAgent:
         self.logger.info(f"Profile extraction complete. Missing fields: {missing_fields}")
         return profile
 
-    def _extract_name(self, text: str) -> Optional[str]:
-        """Extract candidate name from resume text."""
-        lines = [line.strip() for line in text.split('\n') if line.strip()]
-        
-        # Look for name patterns in first few lines
-        name_patterns = [
-            r'^[A-Z][a-z]+ [A-Z][a-z]+$',  # First Last
-            r'^[A-Z][a-z]+ [A-Z]\. [A-Z][a-z]+$',  # First M. Last
-            r'^[A-Z][a-z]+ [A-Z][a-z]+ [A-Z][a-z]+$'  # First Middle Last
-        ]
-        
-        for line in lines[:10]:  # Check first 10 lines
-            if not any(char in line.lower() for char in ['@', 'phone', 'email', 'tel', 'fax', 'linkedin']):
-                for pattern in name_patterns:
-                    if re.match(pattern, line):
-                        return line
-        return None
-
-    def _extract_email(self, text: str) -> Optional[str]:
-        """Extract email address from text."""
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        match = re.search(email_pattern, text)
-        return match.group(0) if match else None
-
-    def _extract_phone(self, text: str) -> Optional[str]:
-        """Extract phone number from text."""
-        phone_patterns = [
-            r'(\+?1[-.\s]?)?\(?([0-9]{3})\)?[-.\s]?([0-9]{3})[-.\s]?([0-9]{4})',
-            r'(\+?[0-9]{1,3}[-.\s]?)?\(?([0-9]{3})\)?[-.\s]?([0-9]{3})[-.\s]?([0-9]{4})',
-            r'\+?[0-9]{10,15}'
-        ]
-        
-        for pattern in phone_patterns:
-            match = re.search(pattern, text)
-            if match:
-                phone = re.sub(r'\D', '', match.group(0))
-                if len(phone) >= 10:
-                    return phone
-        return None
-
     def _extract_skills(self, text: str) -> List[str]:
-        """Extract skills from resume text."""
-        # Common technical skills
-        skill_keywords = [
-            'JavaScript', 'Python', 'Java', 'React', 'Node.js', 'SQL', 'MongoDB',
-            'AWS', 'Docker', 'Git', 'HTML', 'CSS', 'TypeScript', 'Angular', 'Vue.js',
-            'Machine Learning', 'AI', 'Data Science', 'Analytics', 'Project Management'
-        ]
-        
-        found_skills = []
-        text_lower = text.lower()
-        
-        for skill in skill_keywords:
-            if skill.lower() in text_lower:
-                found_skills.append(skill)
-        
-        return found_skills[:10]  # Limit to top 10 skills
+        """Extract skills from resume text, most frequently mentioned first."""
+        return self.skill_matcher.match(text)
 
-    def _extract_experience(self, text: str) -> str:
+    def _extract_experience(self, sections: Dict[str, List[str]]) -> str:
         """Extract work experience summary."""
-        # Look for experience-related sections
-        experience_keywords = ['experience', 'work history', 'employment', 'career']
-        
-        lines = text.split('\n')
-        experience_lines = []
-        
-        for i, line in enumerate(lines):
-            if any(keyword in line.lower() for keyword in experience_keywords):
-                # Capture next few lines as experience
-                for j in range(i, min(i + 10, len(lines))):
-                    if lines[j].strip():
-                        experience_lines.append(lines[j].strip())
-        
-        return ' '.join(experience_lines[:200])  # Limit length
+        return ' '.join(sections.get('experience', [])[:200])  # Limit length
 
-    def _extract_education(self, text: str) -> str:
+    def _extract_education(self, sections: Dict[str, List[str]]) -> str:
         """Extract education information."""
-        education_keywords = ['education', 'degree', 'university', 'college', 'bachelor', 'master', 'phd']
-        
-        lines = text.split('\n')
-        education_lines = []
-        
-        for i, line in enumerate(lines):
-            if any(keyword in line.lower() for keyword in education_keywords):
-                for j in range(i, min(i + 5, len(lines))):
-                    if lines[j].strip():
-                        education_lines.append(lines[j].strip())
-        
-        return ' '.join(education_lines[:100])  # Limit length
+        return ' '.join(sections.get('education', [])[:100])  # Limit length
 
-    def _extract_summary(self, text: str) -> str:
+    def _extract_summary(self, sections: Dict[str, List[str]]) -> str:
         """Extract professional summary or objective."""
-        summary_keywords = ['summary', 'objective', 'profile', 'about']
-        
-        lines = text.split('\n')
-        for i, line in enumerate(lines):
-            if any(keyword in line.lower() for keyword in summary_keywords):
-                # Get next few lines as summary
-                summary_lines = []
-                for j in range(i + 1, min(i + 4, len(lines))):
-                    if lines[j].strip():
-                        summary_lines.append(lines[j].strip())
-                return ' '.join(summary_lines[:150])  # Limit length
-        
-        return ""
+        return ' '.join(sections.get('summary', [])[:150])  # Limit length
 
     def _create_fallback_response(self, message: str) -> Dict[str, Any]:
         """Create a fallback response when processing fails."""
@@ -308,23 +297,35 @@ CORS(app)
 
 # Initialize the agent
 parser_agent = ResumeParserAgent()
+admission = AdmissionController.from_env()
+
+# Before the first extraction worker forks, so workers start warm
+PREWARM_TIMINGS = prewarm_from_env()
+
+MAX_SIMILAR_RESULTS = 100
+MAX_SEARCH_RESULTS = 100
+MAX_MATCH_JOBS = 50
 
 @app.route('/parse-resume', methods=['POST'])
 def parse_resume():
     """Flask endpoint for resume parsing."""
     try:
-        data = request.get_json()
-        
-        if not data or 'file' not in data:
-            return jsonify({"error": "No file provided"}), 400
-        
-        # Decode base64 file content
-        file_content = base64.b64decode(data['file'])
-        file_type = data.get('type', '')
-        filename = data.get('filename', 'unknown')
+        # Decode the upload (base64 JSON, multipart or raw body)
+        try:
+            with stage_timer(STAGE_DECODE):
+                upload = read_upload(request)
+        except UploadError as e:
+            return jsonify({"error": str(e)}), e.status
         
-        # Process the resume
-        result = parser_agent.process_resume(file_content, filename, file_type)
+        # Process the resume once enough slots are free (larger uploads take more)
+        try:
+            with admission.admit(len(upload.file_data)):
+                result = parser_agent.process_resume(upload.file_data, upload.filename, upload.file_type)
+        except AdmissionRejected as e:
+            parser_agent.logger.warning(f"Rejecting parse of {upload.filename}: {e}")
+            response = jsonify({"error": str(e)})
+            response.headers['Retry-After'] = str(e.retry_after)
+            return response, e.status
         
         return jsonify(result)
         
@@ -336,6 +337,124 @@ def parse_resume():
             **parser_agent._create_fallback_response(f"Server error: {str(e)}")
         }), 500
 
+@app.route('/similar', methods=['POST'])
+def similar():
+    """Flask endpoint returning indexed resumes that look like the uploaded one."""
+    try:
+        try:
+            with stage_timer(STAGE_DECODE):
+                upload = read_upload(request)
+            threshold, limit = _similarity_options(upload.options)
+        except (UploadError, ValueError) as e:
+            return jsonify({"error": str(e)}), getattr(e, 'status', 400)
+        
+        try:
+            result = parser_agent.find_similar(upload.file_data, upload.filename, upload.file_type, threshold, limit)
+        except (ValueError, ExtractionError) as e:
+            return jsonify({"error": str(e)}), 422
+        
+        return jsonify({**result, "count": len(result["matches"])})
+        
+    except Exception as e:
+        parser_agent.logger.error(f"Similar endpoint error: {e}", exc_info=True)
+        return jsonify({"error": f"Server error: {str(e)}"}), 500
+
+@app.route('/similar/<doc_id>', methods=['GET'])
+def similar_to_document(doc_id):
+    """Flask endpoint returning resumes similar to an already indexed one."""
+    try:
+        threshold, limit = _similarity_options(request.args)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    
+    signature = parser_agent.similarity.get_signature(doc_id)
+    if signature is None:
+        return jsonify({"error": "Unknown document"}), 404
+    
+    matches = parser_agent.similarity.query(signature, threshold, limit, exclude=doc_id)
+    return jsonify({"document_id": doc_id, "matches": matches, "count": len(matches)})
+
+def _similarity_options(options) -> Tuple[Optional[float], int]:
+    """Parse threshold/limit request options, raising ValueError on bad values."""
+    threshold = float(options['threshold']) if options.get('threshold') else None
+    if threshold is not None and not 0.0 <= threshold <= 1.0:
+        raise ValueError("threshold must be between 0 and 1")
+    limit = int(options.get('limit') or 10)
+    if not 1 <= limit <= MAX_SIMILAR_RESULTS:
+        raise ValueError(f"limit must be between 1 and {MAX_SIMILAR_RESULTS}")
+    return threshold, limit
+
+@app.route('/search', methods=['GET', 'POST'])
+def search():
+    """Flask endpoint for BM25 full-text search over parsed resumes."""
+    try:
+        options = (request.get_json(silent=True) or {}) if request.method == 'POST' else request.args
+        query = str(options.get('q') or options.get('query') or '').strip()
+        if not query:
+            return jsonify({"error": "No query provided"}), 400
+        try:
+            limit = int(options.get('limit') or 10)
+        except (TypeError, ValueError):
+            return jsonify({"error": "limit must be an integer"}), 400
+        if not 1 <= limit <= MAX_SEARCH_RESULTS:
+            return jsonify({"error": f"limit must be between 1 and {MAX_SEARCH_RESULTS}"}), 400
+        
+        start_time = time.perf_counter()
+        results = parser_agent.search_index.search(query, limit)
+        
+        return jsonify({
+            "query": query,
+            "count": len(results),
+            "took_ms": round((time.perf_counter() - start_time) * 1000, 2),
+            "results": results
+        })
+        
+    except Exception as e:
+        parser_agent.logger.error(f"Search endpoint error: {e}", exc_info=True)
+        return jsonify({"error": f"Server error: {str(e)}"}), 500
+
+@app.route('/match', methods=['POST'])
+def match():
+    """Flask endpoint ranking stored candidates against one job description, or a batch under `jobs`."""
+    try:
+        data = request.get_json(silent=True)
+        if not isinstance(data, dict):
+            return jsonify({"error": "No job provided"}), 400
+        
+        jobs = data.get('jobs') if 'jobs' in data else [data]
+        if not isinstance(jobs, list) or not jobs or not all(isinstance(job, dict) for job in jobs):
+            return jsonify({"error": "jobs must be a non-empty list of objects"}), 400
+        if len(jobs) > MAX_MATCH_JOBS:
+            return jsonify({"error": f"Too many jobs (max {MAX_MATCH_JOBS} per request)"}), 400
+        if not all(job.get('job_description') or job.get('skills') for job in jobs):
+            return jsonify({"error": "Each job needs a job_description or skills"}), 400
+        try:
+            limit = int(data.get('limit') or 10)
+        except (TypeError, ValueError):
+            return jsonify({"error": "limit must be an integer"}), 400
+        if not 1 <= limit <= MAX_SEARCH_RESULTS:
+            return jsonify({"error": f"limit must be between 1 and {MAX_SEARCH_RESULTS}"}), 400
+        
+        if not parser_agent.matcher.available:
+            return jsonify({"error": "Candidate matching requires NumPy"}), 503
+        
+        start_time = time.perf_counter()
+        matches = parser_agent.match_candidates(jobs, limit)
+        took_ms = round((time.perf_counter() - start_time) * 1000, 2)
+        
+        if 'jobs' in data:
+            return jsonify({"jobs": matches, "took_ms": took_ms})
+        return jsonify({**matches[0], "count": len(matches[0]["results"]), "took_ms": took_ms})
+        
+    except Exception as e:
+        parser_agent.logger.error(f"Match endpoint error: {e}", exc_info=True)
+        return jsonify({"error": f"Server error: {str(e)}"}), 500
+
+@app.route('/metrics', methods=['GET'])
+def metrics():
+    """Prometheus metrics endpoint."""
+    return Response(render_metrics(), content_type=CONTENT_TYPE)
+
 @app.route('/health', methods=['GET'])
 def health():
     """Health check endpoint."""
@@ -344,17 +463,36 @@ def health():
         "service": "resume-parser-agent",
         "timestamp": datetime.now().isoformat(),
         "pdf_available": PDF_AVAILABLE or PDFPLUMBER_AVAILABLE,
-        "docx_available": DOCX_AVAILABLE,
-        "version": "1.0.0"
+        "docx_available": True,
+        "ocr_available": OCR_AVAILABLE,
+        "version": PARSER_VERSION,
+        "cache": parser_agent.cache.stats(),
+        "extraction": parser_agent.extractor.stats(),
+        "admission": admission.stats(),
+        "similarity": parser_agent.similarity.stats(),
+        "search": parser_agent.search_index.stats(),
+        "matching": parser_agent.matcher.stats(),
+        "imports": import_timings(),
+        "prewarm": PREWARM_TIMINGS
     })
 
+def shutdown():
+    """Stop extraction workers and write buffered search postings when the server process exits."""
+    parser_agent.extractor.shutdown()
+    parser_agent.search_index.flush()
+
 if __name__ == '__main__':
     print("🚀 Starting Professional Resume Parser Agent...")
     print("📄 PDF Support:", "✅" if PDF_AVAILABLE or PDFPLUMBER_AVAILABLE else "❌")
-    print("📝 DOCX Support:", "✅" if DOCX_AVAILABLE else "❌")
+    print("🔎 OCR Support:", "✅" if OCR_AVAILABLE else "❌")
     print("🌐 Server: http://localhost:5006")
     print("🔗 Health: http://localhost:5006/health")
     print("📋 Parse: http://localhost:5006/parse-resume")
+    print("👯 Similar: http://localhost:5006/similar")
+    print("🔎 Search: http://localhost:5006/search?q=python")
+    print("🎯 Match: http://localhost:5006/match")
+    print("📈 Metrics: http://localhost:5006/metrics")
     print()
     
-    app.run(debug=True, host='0.0.0.0', port=5006)
+    # Development server only; use serve.py (gunicorn) in production
+    app.run(debug=os.environ.get('FLASK_DEBUG') == '1', host='0.0.0.0', port=int(os.environ.get('PORT', 5006)))
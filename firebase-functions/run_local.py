@@ -4,144 +4,63 @@ Local development server for testing the resume parser
 Run this with: python run_local.py
 """
 
+import os
 import json
-import re
-import io
 from flask import Flask, request, jsonify
 from flask_cors import CORS
-import base64
-
-# Try to import PDF libraries, fallback if not available
-try:
-    import PyPDF2
-    PDF_AVAILABLE = True
-except ImportError:
-    PDF_AVAILABLE = False
-    print("PyPDF2 not available, PDF parsing will be limited")
-
-try:
-    import pdfplumber
-    PDFPLUMBER_AVAILABLE = True
-except ImportError:
-    PDFPLUMBER_AVAILABLE = False
-    print("pdfplumber not available, using PyPDF2 only")
-
-try:
-    from docx import Document
-    DOCX_AVAILABLE = True
-except ImportError:
-    DOCX_AVAILABLE = False
-    print("python-docx not available, DOCX parsing will not work")
+from uploads import read_upload, UploadError
+from text_extraction import (extract_pdf_text, extract_docx_text, scan_pdf_fields, scan_pdf_layout,
+                             MODE_CONTACT, MODE_LAYOUT, PARSE_MODES, PDF_AVAILABLE, PDFPLUMBER_AVAILABLE, OCR_AVAILABLE,
+                             DocumentTooLarge)
+from field_extraction import extract_fields
+from lazy_imports import import_timings
+from prewarm import prewarm_from_env
 
 app = Flask(__name__)
 CORS(app)
 
+PREWARM_TIMINGS = prewarm_from_env()
+
 def extract_text_from_pdf(file_content):
     """Extract text from PDF using available methods"""
-    text = ""
-    
-    if PDFPLUMBER_AVAILABLE:
-        try:
-            with pdfplumber.open(io.BytesIO(file_content)) as pdf:
-                for page in pdf.pages:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text += page_text + "\n"
-                if text.strip():
-                    return text
-        except Exception as e:
-            print(f"pdfplumber failed: {e}")
-    
-    if PDF_AVAILABLE:
-        try:
-            pdf_reader = PyPDF2.PdfReader(io.BytesIO(file_content))
-            for page in pdf_reader.pages:
-                text += page.extract_text() + "\n"
-            return text
-        except Exception as e:
-            print(f"PyPDF2 failed: {e}")
-    
-    return text
+    try:
+        # PyPDF2 first, escalating to pdfplumber when its output scores low
+        return extract_pdf_text(file_content)
+    except DocumentTooLarge:
+        raise
+    except Exception as e:
+        print(f"PDF extraction failed: {e}")
+        return ""
 
 def extract_text_from_docx(file_content):
     """Extract text from DOCX file"""
-    if not DOCX_AVAILABLE:
-        return ""
-    
     try:
-        doc = Document(io.BytesIO(file_content))
-        text = ""
-        for paragraph in doc.paragraphs:
-            text += paragraph.text + "\n"
-        return text
+        return extract_docx_text(file_content)
     except Exception as e:
         print(f"DOCX extraction failed: {e}")
         return ""
 
 def extract_profile_info(text):
     """Extract name, email, and phone from text"""
-    profile = {
-        "name": None,
-        "email": None,
-        "phone": None
-    }
-    
-    # Extract email
-    email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-    email_match = re.search(email_pattern, text)
-    if email_match:
-        profile["email"] = email_match.group(0)
-    
-    # Extract phone (various formats)
-    phone_patterns = [
-        r'(\+?1[-.\s]?)?\(?([0-9]{3})\)?[-.\s]?([0-9]{3})[-.\s]?([0-9]{4})',
-        r'(\+?[0-9]{1,3}[-.\s]?)?\(?([0-9]{3})\)?[-.\s]?([0-9]{3})[-.\s]?([0-9]{4})',
-        r'\+?[0-9]{10,15}'
-    ]
-    
-    for pattern in phone_patterns:
-        phone_match = re.search(pattern, text)
-        if phone_match:
-            phone = re.sub(r'\D', '', phone_match.group(0))
-            if len(phone) >= 10:
-                profile["phone"] = phone
-                break
-    
-    # Extract name (look for common patterns)
-    lines = [line.strip() for line in text.split('\n') if line.strip()]
-    
-    # Common name patterns
-    name_patterns = [
-        r'^[A-Z][a-z]+ [A-Z][a-z]+$',  # First Last
-        r'^[A-Z][a-z]+ [A-Z]\. [A-Z][a-z]+$',  # First M. Last
-        r'^[A-Z][a-z]+ [A-Z][a-z]+ [A-Z][a-z]+$'  # First Middle Last
-    ]
-    
-    for line in lines[:10]:  # Check first 10 lines
-        if not any(char in line for char in ['@', 'phone', 'email', 'tel', 'fax']):
-            for pattern in name_patterns:
-                if re.match(pattern, line):
-                    profile["name"] = line
-                    break
-            if profile["name"]:
-                break
-    
-    return profile
+    return extract_fields(text)
 
 @app.route('/parse-resume', methods=['POST'])
 def parse_resume():
     """Parse resume and extract profile information"""
     try:
-        data = request.get_json()
-        
-        if not data or 'file' not in data:
-            return jsonify({"error": "No file provided"}), 400
-        
-        # Decode base64 file content
-        file_content = base64.b64decode(data['file'])
-        file_type = data.get('type', '')
+        # Decode the upload (base64 JSON, multipart or raw body)
+        try:
+            upload = read_upload(request)
+        except UploadError as e:
+            return jsonify({"error": str(e)}), e.status
         
+        file_content = upload.file_data
+        file_type = upload.file_type
+        mode = upload.options.get('mode', MODE_CONTACT)
+        if mode not in PARSE_MODES:
+            return jsonify({"error": f"Unsupported mode: {mode}"}), 400
         # Extract text based on file type
+        fields = None
         if file_type == 'application/pdf':
             if not PDF_AVAILABLE and not PDFPLUMBER_AVAILABLE:
                 return jsonify({
@@ -151,16 +70,18 @@ def parse_resume():
                     "_fallback": True,
                     "_error": "PDF parsing libraries not available. Please install PyPDF2 or pdfplumber."
                 })
-            text = extract_text_from_pdf(file_content)
+            if mode == MODE_LAYOUT:
+                # Name, email and phone come from the first page's layout
+                scan = scan_pdf_layout(file_content, keep_text=True)
+                text, fields = scan.text, scan.fields
+            elif mode == MODE_CONTACT:
+                # Stop reading pages once name, email and phone are found; the
+                # fields come from that scan, so the text is not scanned again
+                scan = scan_pdf_fields(file_content, stop_when_complete=True, keep_text=True)
+                text, fields = scan.text, scan.fields
+            else:
+                text = extract_text_from_pdf(file_content)
         elif file_type == 'application/vnd.openxmlformats-officedocument.wordprocessingml.document':
-            if not DOCX_AVAILABLE:
-                return jsonify({
-                    "name": "",
-                    "email": "",
-                    "phone": "",
-                    "_fallback": True,
-                    "_error": "DOCX parsing library not available. Please install python-docx."
-                })
             text = extract_text_from_docx(file_content)
         else:
             return jsonify({"error": "Unsupported file type"}), 400
@@ -175,10 +96,12 @@ def parse_resume():
             })
         
         # Extract profile information
-        profile = extract_profile_info(text)
+        profile = fields if fields is not None else extract_profile_info(text)
         
         return jsonify(profile)
         
+    except DocumentTooLarge as e:
+        return jsonify({"error": str(e)}), 413
     except Exception as e:
         print(f"Error parsing resume: {e}")
         return jsonify({
@@ -197,16 +120,20 @@ def health():
         "service": "resume-parser",
         "pdf_available": PDF_AVAILABLE,
         "pdfplumber_available": PDFPLUMBER_AVAILABLE,
-        "docx_available": DOCX_AVAILABLE
+        "docx_available": True,
+        "ocr_available": OCR_AVAILABLE,
+        "imports": import_timings(),
+        "prewarm": PREWARM_TIMINGS
     })
 
 if __name__ == '__main__':
     print("🚀 Starting Resume Parser Server...")
     print("📄 PDF Support:", "✅" if PDF_AVAILABLE or PDFPLUMBER_AVAILABLE else "❌")
-    print("📝 DOCX Support:", "✅" if DOCX_AVAILABLE else "❌")
+    print("🔎 OCR Support:", "✅" if OCR_AVAILABLE else "❌")
     print("🌐 Server will be available at: http://localhost:5006")
     print("🔗 Health check: http://localhost:5006/health")
     print("📋 Parse endpoint: http://localhost:5006/parse-resume")
     print()
     
-    app.run(debug=True, host='0.0.0.0', port=5006)
+    # Development server only; use serve.py (gunicorn) in production
+    app.run(debug=os.environ.get('FLASK_DEBUG') == '1', host='0.0.0.0', port=int(os.environ.get('PORT', 5006)))
@@ -0,0 +1,649 @@
+#!/usr/bin/env python3
+"""
+Resume Search Index
+Incremental inverted index over parsed resumes with BM25 ranking, so
+recruiters can search candidates without scanning every record.
+
+Each parsed profile (name, skills, experience, education, summary) is
+tokenized and its postings are appended to per-term blocks of up to 256
+entries. A block stores doc-number gaps and term frequencies as packed
+integer arrays compressed with zlib, so a query decodes whole blocks in C
+and only the postings of its own terms. Blocks, document lengths and the
+stored profiles live in SQLite: in memory by default, or in the file named
+by SEARCH_INDEX_PATH so the index survives restarts.
+
+New documents are buffered and written every SEARCH_FLUSH_DOCS documents
+(default 1); buffered documents are already searchable. Re-indexing a
+document_id replaces the earlier version.
+
+Several processes (e.g. gunicorn workers) may share one index file. Doc
+numbers are only provisional until a flush, which takes the SQLite write
+lock, loads what other processes wrote since this one last looked, and
+renumbers the buffered documents after them before writing. Searches pick
+up other processes' documents the same way, detected with PRAGMA data_version.
+
+Scoring uses NumPy when it is installed. The plain Python fallback uses
+MaxScore pruning: terms are scored rarest first, and once the current top
+hits cannot be overtaken by a document that only matches the remaining
+(common) terms, those terms are only looked up for documents already
+scored, decoding just the blocks that hold them.
+"""
+
+import os
+import re
+import json
+import time
+import zlib
+import heapq
+import math
+import sqlite3
+import logging
+import threading
+from array import array
+from bisect import bisect_left, bisect_right
+from contextlib import contextmanager
+from itertools import accumulate
+from operator import itemgetter
+from typing import Dict, Any, Iterator, List, NamedTuple, Optional, Tuple
+
+from lazy_imports import module_available, load_module
+
+NUMPY_AVAILABLE = module_available('numpy')
+
+BLOCK_SIZE = 256
+MAX_TERM_FREQUENCY = 65535
+
+# BM25 parameters
+K1 = 1.2
+B = 0.75
+
+# Recompute per-document length norms once the average length drifts this much
+NORM_DRIFT = 0.01
+
+# Profile fields that are indexed, and the ones returned with each hit
+INDEXED_FIELDS = ('name', 'skills', 'experience', 'education', 'summary')
+STORED_FIELDS = ('name', 'email', 'phone', 'skills', 'filename')
+
+# Words, plus skill spellings like c++, c# and node.js
+TOKEN_RE = re.compile(r"[a-z0-9]+(?:[+#]+|(?:\.[a-z0-9]+)+)?")
+STOPWORDS = frozenset(
+    "a an and are as at be by for from in into is of on or the to with was were".split()
+)
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercased search terms, without stopwords."""
+    return [token for token in TOKEN_RE.findall(text.lower()) if token not in STOPWORDS]
+
+
+def profile_text(profile: Dict[str, Any]) -> str:
+    """The searchable text of a parsed profile."""
+    parts = []
+    for field in INDEXED_FIELDS:
+        value = profile.get(field) or ''
+        parts.append(' '.join(value) if isinstance(value, list) else str(value))
+    return '\n'.join(parts)
+
+
+def encode_block(doc_nums: List[int], frequencies: List[int]) -> Tuple[int, bytes]:
+    """Pack a run of ascending doc numbers as (first doc, compressed gaps + frequencies)."""
+    first = doc_nums[0]
+    gaps = array('I', [0] + [doc_nums[i] - doc_nums[i - 1] for i in range(1, len(doc_nums))])
+    return first, zlib.compress(gaps.tobytes() + array('H', frequencies).tobytes())
+
+
+def decode_block(first: int, count: int, blob: bytes) -> Tuple[array, array]:
+    """Inverse of encode_block: (doc numbers, frequencies)."""
+    raw = zlib.decompress(blob)
+    gaps = array('I')
+    gaps.frombytes(raw[:count * gaps.itemsize])
+    frequencies = array('H')
+    frequencies.frombytes(raw[count * gaps.itemsize:])
+    return array('I', accumulate(gaps, initial=first))[1:], frequencies
+
+
+class TermPostings(NamedTuple):
+    """A term's stored blocks (first doc, count, compressed postings) plus its buffered postings."""
+    blocks: List[Tuple[int, int, bytes]]
+    pending: Tuple[List[int], List[int]]
+
+    @property
+    def count(self) -> int:
+        return sum(count for _, count, _ in self.blocks) + len(self.pending[0])
+
+    def decode(self) -> Tuple[array, array]:
+        """Every posting as (doc numbers, frequencies), in doc order."""
+        doc_nums, tfs = array('I'), array('H')
+        for first, count, blob in self.blocks:
+            block_docs, block_tfs = decode_block(first, count, blob)
+            doc_nums.extend(block_docs)
+            tfs.extend(block_tfs)
+        doc_nums.extend(self.pending[0])
+        tfs.extend(self.pending[1])
+        return doc_nums, tfs
+
+    def decode_vectors(self, np) -> Tuple[Any, Any]:
+        """Every posting as NumPy vectors (doc numbers, frequencies), decoded without Python loops."""
+        doc_parts, tf_parts = [], []
+        for first, count, blob in self.blocks:
+            raw = zlib.decompress(blob)
+            doc_parts.append(np.cumsum(np.frombuffer(raw, dtype=np.uint32, count=count), dtype=np.int64) + first)
+            tf_parts.append(np.frombuffer(raw, dtype=np.uint16, offset=count * 4))
+        if self.pending[0]:
+            doc_parts.append(np.asarray(self.pending[0], dtype=np.int64))
+            tf_parts.append(np.asarray(self.pending[1], dtype=np.uint16))
+        return np.concatenate(doc_parts), np.concatenate(tf_parts)
+
+    def lookup(self, doc_nums: List[int]) -> Dict[int, int]:
+        """Frequencies of the given doc numbers, decoding only the blocks that can hold them."""
+        firsts = [first for first, _, _ in self.blocks]
+        wanted: Dict[int, List[int]] = {}
+        for doc_num in doc_nums:
+            block = bisect_right(firsts, doc_num) - 1
+            if block >= 0:
+                wanted.setdefault(block, []).append(doc_num)
+
+        found: Dict[int, int] = {}
+        for block, candidates in wanted.items():
+            block_docs, block_tfs = decode_block(*self.blocks[block])
+            for doc_num in candidates:
+                index = bisect_left(block_docs, doc_num)
+                if index < len(block_docs) and block_docs[index] == doc_num:
+                    found[doc_num] = block_tfs[index]
+        if self.pending[0]:
+            pending = dict(zip(*self.pending))
+            found.update((doc_num, pending[doc_num]) for doc_num in doc_nums if doc_num in pending)
+        return found
+
+
+class SearchIndex:
+    """
+    Incremental BM25 inverted index stored in SQLite.
+    """
+
+    def __init__(self, path: Optional[str] = None, flush_every: int = 1):
+        """
+        Args:
+            path (str): SQLite file; None keeps the index in memory for this process
+            flush_every (int): Buffered documents that trigger a write to the store
+        """
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.path = path
+        self.flush_every = max(1, flush_every)
+
+        self._lock = threading.RLock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._conn_pid: Optional[int] = None
+        # Doc numbers below _synced are in the store; data_version as of the last sync
+        self._synced = 0
+        self._data_version: Optional[int] = None
+
+        # Per-document state, indexed by doc number
+        self._lengths = array('I')
+        self._doc_ids: List[Optional[str]] = []
+        self._live: Dict[str, int] = {}
+        self._deleted: set = set()
+        self._total_length = 0
+
+        # Buffered documents and their postings, not yet in the store
+        self._pending_docs: List[Tuple[int, str, int, str]] = []
+        self._pending_deletes: List[int] = []
+        self._pending_postings: Dict[str, Tuple[List[int], List[int]]] = {}
+
+        self._norms: List[float] = []
+        self._norms_average = 0.0
+        self._norm_vector = None
+
+        self.queries = 0
+
+    @classmethod
+    def from_env(cls) -> "SearchIndex":
+        """Build an index configured from SEARCH_INDEX_PATH / SEARCH_FLUSH_DOCS."""
+        return cls(
+            path=os.environ.get('SEARCH_INDEX_PATH') or None,
+            flush_every=int(os.environ.get('SEARCH_FLUSH_DOCS', 1))
+        )
+
+    def add(self, doc_id: str, profile: Dict[str, Any]) -> None:
+        """
+        Index a parsed profile, replacing any earlier version of the same document.
+
+        Args:
+            doc_id (str): Content address of the resume, see similarity_index.document_id()
+            profile (Dict[str, Any]): Parse result with the INDEXED_FIELDS
+        """
+        terms = tokenize(profile_text(profile))
+        frequencies: Dict[str, int] = {}
+        for term in terms:
+            frequencies[term] = frequencies.get(term, 0) + 1
+        stored = json.dumps({field: profile.get(field, '') for field in STORED_FIELDS})
+
+        with self._lock:
+            self._synced_connection()
+            previous = self._live.get(doc_id)
+            if previous is not None:
+                self._deleted.add(previous)
+                self._pending_deletes.append(previous)
+                self._total_length -= self._lengths[previous]
+
+            doc_num = len(self._doc_ids)
+            self._doc_ids.append(doc_id)
+            self._lengths.append(len(terms))
+            self._live[doc_id] = doc_num
+            self._total_length += len(terms)
+            self._norms_append(len(terms))
+
+            self._pending_docs.append((doc_num, doc_id, len(terms), stored))
+            for term, frequency in frequencies.items():
+                doc_nums, tfs = self._pending_postings.setdefault(term, ([], []))
+                doc_nums.append(doc_num)
+                tfs.append(min(frequency, MAX_TERM_FREQUENCY))
+
+            if len(self._pending_docs) >= self.flush_every:
+                self.flush()
+
+    def search(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        Rank indexed resumes against a free-text query with BM25.
+
+        Args:
+            query (str): Search terms, e.g. "python kubernetes terraform"
+            limit (int): Maximum hits returned
+
+        Returns:
+            List[Dict[str, Any]]: Hits with document_id, score and the stored profile fields, best first
+        """
+        terms = list(dict.fromkeys(tokenize(query)))
+        with self._lock, self._snapshot():
+            self.queries += 1
+            documents = len(self._live)
+            if not terms or not documents:
+                return []
+            self._refresh_norms()
+            postings = [self._postings(term) for term in terms]
+            norms = self._norm_array() if NUMPY_AVAILABLE else self._norms
+            deleted = set(self._deleted)
+
+        # Each term's weight is also the most it can add to any document's score
+        weighted = []
+        for term_postings in postings:
+            document_frequency = term_postings.count
+            if not document_frequency:
+                continue
+            idf = math.log(1 + (documents - document_frequency + 0.5) / (document_frequency + 0.5))
+            weighted.append((idf * (K1 + 1), term_postings))
+        if not weighted:
+            return []
+
+        if NUMPY_AVAILABLE:
+            ranked = self._rank_numpy(weighted, norms, deleted, limit)
+        else:
+            ranked = self._rank_python(weighted, norms, deleted, limit)
+        return self._hits(ranked)
+
+    def get_profiles(self, doc_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Stored fields of the given documents; unknown ids are left out."""
+        with self._lock:
+            self._synced_connection()
+            doc_nums = {self._live[doc_id]: doc_id for doc_id in doc_ids if doc_id in self._live}
+            profiles = self._stored(list(doc_nums))
+        return {doc_nums[doc_num]: json.loads(stored) for doc_num, stored in profiles.items()}
+
+    def profiles(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """(document_id, stored fields) of every live document, oldest first."""
+        with self._lock:
+            rows = self._synced_connection().execute(
+                "SELECT doc_num, doc_id, profile FROM search_documents WHERE deleted = 0 ORDER BY doc_num"
+            ).fetchall()
+            rows += [(doc_num, doc_id, stored) for doc_num, doc_id, _, stored in self._pending_docs]
+            live = set(self._live.values())
+        for doc_num, doc_id, stored in rows:
+            if doc_num in live:
+                yield doc_id, json.loads(stored)
+
+    def flush(self) -> None:
+        """
+        Write buffered documents and postings to the store in one transaction.
+
+        The write lock is taken first, so the buffered documents are numbered
+        after everything other processes have written.
+        """
+        with self._lock:
+            if not self._pending_docs and not self._pending_deletes:
+                return
+            conn = self._connection()
+            try:
+                if not conn.in_transaction:
+                    conn.execute("BEGIN IMMEDIATE")
+                with conn:
+                    self._catch_up(conn, force=True)
+                    # Insert first: a document replaced before it was flushed is in both lists
+                    conn.executemany(
+                        "INSERT INTO search_documents (doc_num, doc_id, length, profile) VALUES (?, ?, ?, ?)",
+                        self._pending_docs
+                    )
+                    conn.executemany("UPDATE search_documents SET deleted = 1 WHERE doc_num = ?",
+                                     [(doc_num,) for doc_num in self._pending_deletes])
+                    for term, (doc_nums, tfs) in self._pending_postings.items():
+                        self._append_postings(conn, term, doc_nums, tfs)
+            except sqlite3.Error as e:
+                # Keep the buffer; the next flush retries
+                self.logger.warning(f"Search index write failed: {e}")
+                return
+            self._pending_docs = []
+            self._pending_deletes = []
+            self._pending_postings = {}
+            self._synced = len(self._doc_ids)
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters reported on /health."""
+        with self._lock:
+            self._synced_connection()
+            return {
+                "documents": len(self._live),
+                "deleted": len(self._deleted),
+                "pending": len(self._pending_docs),
+                "queries": self.queries,
+                "numpy": NUMPY_AVAILABLE,
+                "disk_enabled": self.path is not None
+            }
+
+    def _rank_python(self, weighted, norms, deleted, limit) -> List[Tuple[int, float]]:
+        """Accumulate BM25 scores in a dict, rarest term first, with MaxScore pruning."""
+        weighted.sort(key=itemgetter(0), reverse=True)
+        remaining = sum(weight for weight, _ in weighted)
+        scores: Dict[int, float] = {}
+        get = scores.get
+
+        for weight, term_postings in weighted:
+            if len(scores) >= limit and heapq.nlargest(limit, scores.values())[-1] > remaining:
+                # Documents not scored yet can gain at most `remaining`, less than the current top hits
+                for doc_num, tf in term_postings.lookup(list(scores)).items():
+                    scores[doc_num] += weight * tf / (tf + norms[doc_num])
+            else:
+                doc_nums, tfs = term_postings.decode()
+                if scores:
+                    for doc_num, tf in zip(doc_nums, tfs):
+                        scores[doc_num] = get(doc_num, 0.0) + weight * tf / (tf + norms[doc_num])
+                else:
+                    scores = dict(zip(doc_nums, [weight * tf / (tf + norms[doc_num])
+                                                 for doc_num, tf in zip(doc_nums, tfs)]))
+                    get = scores.get
+                for doc_num in deleted:
+                    scores.pop(doc_num, None)
+            remaining -= weight
+
+        # Ties go to the earlier document, as in _rank_numpy
+        return heapq.nlargest(limit, scores.items(), key=lambda item: (item[1], -item[0]))
+
+    def _rank_numpy(self, weighted, norm_vector, deleted, limit) -> List[Tuple[int, float]]:
+        """Accumulate BM25 scores into a dense vector and partition out the top hits."""
+        np = load_module('numpy')
+        scores = np.zeros(len(norm_vector), dtype=np.float64)
+        for weight, term_postings in weighted:
+            doc_vector, tf_vector = term_postings.decode_vectors(np)
+            tf_vector = tf_vector.astype(np.float64)
+            scores[doc_vector] += weight * tf_vector / (tf_vector + norm_vector[doc_vector])
+        if deleted:
+            scores[np.fromiter(deleted, dtype=np.int64)] = 0.0
+        matched = np.count_nonzero(scores)
+        limit = min(limit, matched)
+        if not limit:
+            return []
+        top = np.argpartition(-scores, limit - 1)[:limit]
+        top = top[np.lexsort((top, -scores[top]))]
+        return [(int(doc_num), float(scores[doc_num])) for doc_num in top]
+
+    def _hits(self, ranked: List[Tuple[int, float]]) -> List[Dict[str, Any]]:
+        """Attach the stored profile fields to (doc number, score) pairs."""
+        if not ranked:
+            return []
+        with self._lock:
+            profiles = self._stored([doc_num for doc_num, _ in ranked])
+            return [
+                {"document_id": self._doc_ids[doc_num], "score": round(score, 4), **json.loads(profiles[doc_num])}
+                for doc_num, score in ranked
+            ]
+
+    def _stored(self, doc_nums: List[int]) -> Dict[int, str]:
+        """Stored profile JSON by doc number, from the buffer or the store. Caller holds the lock."""
+        wanted = set(doc_nums)
+        profiles = {doc_num: stored for doc_num, _, _, stored in self._pending_docs if doc_num in wanted}
+        missing = [doc_num for doc_num in wanted if doc_num not in profiles]
+        if missing:
+            placeholders = ', '.join('?' * len(missing))
+            profiles.update(self._connection().execute(
+                f"SELECT doc_num, profile FROM search_documents WHERE doc_num IN ({placeholders})", missing
+            ).fetchall())
+        return profiles
+
+    def _postings(self, term: str) -> TermPostings:
+        """A term's stored blocks, still compressed, plus a copy of its buffered postings. Caller holds the lock."""
+        blocks = self._connection().execute(
+            "SELECT first_doc, count, postings FROM search_blocks WHERE term = ? ORDER BY block", (term,)
+        ).fetchall()
+        doc_nums, tfs = self._pending_postings.get(term, ([], []))
+        return TermPostings(blocks, (list(doc_nums), list(tfs)))
+
+    def _append_postings(self, conn: sqlite3.Connection, term: str, doc_nums: List[int], tfs: List[int]) -> None:
+        """Top up the term's last block and add new full blocks. Caller holds the lock."""
+        block = 0
+        row = conn.execute(
+            "SELECT block, first_doc, count, postings FROM search_blocks WHERE term = ? "
+            "ORDER BY block DESC LIMIT 1", (term,)
+        ).fetchone()
+        if row is not None:
+            block, first, count, blob = row
+            if count < BLOCK_SIZE:
+                block_docs, block_tfs = decode_block(first, count, blob)
+                doc_nums = list(block_docs) + doc_nums
+                tfs = list(block_tfs) + tfs
+            else:
+                block += 1
+
+        rows = []
+        for start in range(0, len(doc_nums), BLOCK_SIZE):
+            first, blob = encode_block(doc_nums[start:start + BLOCK_SIZE], tfs[start:start + BLOCK_SIZE])
+            rows.append((term, block, first, len(doc_nums[start:start + BLOCK_SIZE]), blob))
+            block += 1
+        conn.executemany(
+            "INSERT OR REPLACE INTO search_blocks (term, block, first_doc, count, postings) VALUES (?, ?, ?, ?, ?)",
+            rows
+        )
+
+    def _norm(self, length: int, average: float) -> float:
+        return K1 * (1 - B + B * length / average) if average else K1
+
+    def _norms_append(self, length: int) -> None:
+        """Extend the norm cache for a new document. Caller holds the lock."""
+        self._norms.append(self._norm(length, self._norms_average))
+
+    def _refresh_norms(self) -> None:
+        """Recompute length norms if the average document length has drifted. Caller holds the lock."""
+        average = self._total_length / len(self._live) if self._live else 0.0
+        if self._norms_average and abs(average - self._norms_average) <= NORM_DRIFT * self._norms_average:
+            return
+        self._norms = [self._norm(length, average) for length in self._lengths]
+        self._norms_average = average
+        self._norm_vector = None
+
+    def _norm_array(self):
+        """Norms as a NumPy vector, rebuilt when documents were added or norms recomputed. Caller holds the lock."""
+        if self._norm_vector is None or len(self._norm_vector) != len(self._norms):
+            np = load_module('numpy')
+            self._norm_vector = np.asarray(self._norms, dtype=np.float64)
+        return self._norm_vector
+
+    def _connection(self) -> sqlite3.Connection:
+        """Open the store lazily (loading document state), and again after a fork. Caller holds the lock."""
+        if self._conn is not None and self._conn_pid == os.getpid():
+            return self._conn
+
+        start = time.perf_counter()
+        try:
+            conn = self._open(self.path)
+            # Read before the documents, so a write between the two is picked up by the next sync
+            data_version = self._version(conn)
+        except sqlite3.Error as e:
+            if self.path is None:
+                raise
+            self.logger.warning(f"Search index file unavailable ({self.path}), keeping it in memory: {e}")
+            self.path = None
+            conn = self._open(None)
+            data_version = self._version(conn)
+
+        self._lengths = array('I')
+        self._doc_ids = []
+        self._live = {}
+        self._deleted = set()
+        self._total_length = 0
+        for doc_num, doc_id, length, deleted in conn.execute(
+            "SELECT doc_num, doc_id, length, deleted FROM search_documents ORDER BY doc_num"
+        ):
+            while len(self._doc_ids) < doc_num:
+                self._doc_ids.append(None)
+                self._lengths.append(0)
+            self._doc_ids.append(doc_id)
+            self._lengths.append(length)
+            if deleted:
+                self._deleted.add(doc_num)
+            else:
+                self._live[doc_id] = doc_num
+                self._total_length += length
+        self._norms, self._norms_average = [], 0.0
+        self._refresh_norms()
+        self._synced = len(self._doc_ids)
+        self._data_version = data_version
+
+        self._conn = conn
+        self._conn_pid = os.getpid()
+        if NUMPY_AVAILABLE:
+            load_module('numpy')
+        if self._live:
+            self.logger.info(f"Loaded search index: {len(self._live)} documents in "
+                             f"{time.perf_counter() - start:.2f}s")
+        return conn
+
+    def _synced_connection(self) -> sqlite3.Connection:
+        """The store, with documents other processes wrote since the last call loaded. Caller holds the lock."""
+        conn = self._connection()
+        if self.path is not None:
+            self._catch_up(conn)
+        return conn
+
+    @contextmanager
+    def _snapshot(self) -> Iterator[sqlite3.Connection]:
+        """
+        Sync and read inside one read transaction, so no block read holds a
+        document written after the sync. Caller holds the lock.
+        """
+        conn = self._connection()
+        if self.path is None or conn.in_transaction:
+            yield conn
+            return
+        conn.execute("BEGIN")
+        try:
+            self._catch_up(conn)
+            yield conn
+        finally:
+            conn.commit()
+
+    def _catch_up(self, conn: sqlite3.Connection, force: bool = False) -> None:
+        """
+        Load documents and deletions other processes have written since the
+        last sync, and move buffered documents to doc numbers after them.
+        Caller holds the lock.
+
+        Args:
+            force (bool): Look even if data_version is unchanged (a flush must
+                never reuse a doc number, however the last sync raced)
+        """
+        version = self._version(conn)
+        if version == self._data_version and not force:
+            return
+        self._data_version = version
+
+        synced = self._synced
+        for (doc_num,) in conn.execute(
+            "SELECT doc_num FROM search_documents WHERE deleted = 1 AND doc_num < ?", (synced,)
+        ):
+            if doc_num not in self._deleted:
+                self._deleted.add(doc_num)
+                if self._live.get(self._doc_ids[doc_num]) == doc_num:
+                    del self._live[self._doc_ids[doc_num]]
+                    self._total_length -= self._lengths[doc_num]
+
+        rows = conn.execute(
+            "SELECT doc_num, doc_id, length, deleted FROM search_documents WHERE doc_num >= ? ORDER BY doc_num",
+            (synced,)
+        ).fetchall()
+        if not rows:
+            return
+        self._synced = rows[-1][0] + 1
+
+        # Buffered documents move up past the new rows first
+        offset = self._synced - synced
+
+        def move(doc_num: int) -> int:
+            return doc_num + offset if doc_num >= synced else doc_num
+
+        pending_ids = self._doc_ids[synced:]
+        pending_lengths = self._lengths[synced:]
+        self._doc_ids[synced:] = [None] * offset + pending_ids
+        self._lengths[synced:] = array('I', [0] * offset) + pending_lengths
+        self._live = {doc_id: move(doc_num) for doc_id, doc_num in self._live.items()}
+        self._deleted = {move(doc_num) for doc_num in self._deleted}
+        self._pending_deletes = [move(doc_num) for doc_num in self._pending_deletes]
+        self._pending_docs = [(move(doc_num), *rest) for doc_num, *rest in self._pending_docs]
+        self._pending_postings = {term: ([move(doc_num) for doc_num in doc_nums], tfs)
+                                  for term, (doc_nums, tfs) in self._pending_postings.items()}
+
+        for doc_num, doc_id, length, deleted in rows:
+            self._doc_ids[doc_num] = doc_id
+            self._lengths[doc_num] = length
+            if deleted:
+                self._deleted.add(doc_num)
+                continue
+            previous = self._live.get(doc_id)
+            if previous is not None and previous >= self._synced:
+                # Also buffered here, and that copy will be written later: it replaces this one
+                self._deleted.add(doc_num)
+                self._pending_deletes.append(doc_num)
+                continue
+            if previous is not None:
+                # Indexed by two processes at once: the newer copy replaces ours
+                self._deleted.add(previous)
+                self._pending_deletes.append(previous)
+                self._total_length -= self._lengths[previous]
+            self._live[doc_id] = doc_num
+            self._total_length += length
+
+        self._norms = self._norms[:synced] + [self._norm(length, self._norms_average)
+                                              for length in self._lengths[synced:]]
+        self._norm_vector = None
+
+    @staticmethod
+    def _version(conn: sqlite3.Connection) -> int:
+        """Changes whenever another connection commits to the store."""
+        return conn.execute("PRAGMA data_version").fetchone()[0]
+
+    @staticmethod
+    def _open(path: Optional[str]) -> sqlite3.Connection:
+        conn = sqlite3.connect(path or ':memory:', timeout=5.0, check_same_thread=False)
+        if path:
+            conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS search_documents ("
+            "doc_num INTEGER PRIMARY KEY, doc_id TEXT NOT NULL, length INTEGER NOT NULL, "
+            "profile TEXT NOT NULL, deleted INTEGER NOT NULL DEFAULT 0)"
+        )
+        # Lets _catch_up find other processes' deletions without a table scan
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS search_documents_deleted ON search_documents (doc_num) WHERE deleted = 1"
+        )
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS search_blocks ("
+            "term TEXT NOT NULL, block INTEGER NOT NULL, first_doc INTEGER NOT NULL, count INTEGER NOT NULL, "
+            "postings BLOB NOT NULL, PRIMARY KEY (term, block)) WITHOUT ROWID"
+        )
+        return conn
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Resume Section Segmentation
+Labels every line of a resume with the section it belongs to in a single
+pass, so experience, education and summary become lookups instead of
+separate rescans with overlapping keyword windows.
+"""
+
+import re
+from typing import Dict, List
+
+# Header phrase -> section label
+SECTION_HEADERS = {
+    'summary': [
+        'summary', 'professional summary', 'career summary', 'executive summary',
+        'objective', 'career objective', 'professional objective',
+        'profile', 'professional profile', 'personal profile', 'about', 'about me'
+    ],
+    'experience': [
+        'experience', 'work experience', 'professional experience', 'relevant experience',
+        'work history', 'employment', 'employment history', 'career', 'career history'
+    ],
+    'education': [
+        'education', 'academic background', 'academic history', 'qualifications',
+        'academic qualifications', 'educational background'
+    ],
+    'skills': [
+        'skills', 'technical skills', 'key skills', 'core skills', 'core competencies',
+        'competencies', 'technologies', 'tools'
+    ],
+    'projects': ['projects', 'personal projects', 'key projects', 'selected projects'],
+    'certifications': ['certifications', 'certificates', 'licenses', 'licenses and certifications'],
+    'awards': ['awards', 'honors', 'honours', 'achievements', 'awards and honors'],
+    'publications': ['publications', 'research', 'papers'],
+    'languages': ['languages'],
+    'interests': ['interests', 'hobbies', 'hobbies and interests'],
+    'volunteering': ['volunteering', 'volunteer experience', 'community involvement'],
+    'references': ['references']
+}
+
+HEADER_LOOKUP = {phrase: section for section, phrases in SECTION_HEADERS.items() for phrase in phrases}
+
+# Lines before the first recognised header (name, contact details)
+PREAMBLE = 'header'
+
+# Keyword lines used when a resume has no explicit header for a section
+FALLBACK_KEYWORDS = {
+    'experience': re.compile(r'^.*(?:experience|work history|employment|career).*$',
+                             re.IGNORECASE | re.MULTILINE),
+    'education': re.compile(r'^.*(?:education|degree|university|college|bachelor|master|phd).*$',
+                            re.IGNORECASE | re.MULTILINE)
+}
+
+WHITESPACE_RE = re.compile(r'\s+')
+MAX_HEADER_CHARS = 48
+
+
+def detect_header(line: str) -> str:
+    """
+    Return the section a line introduces, or '' if it is not a header.
+
+    Only a line that is exactly a header phrase counts, in any case and with an
+    optional trailing colon ('Work Experience:', 'EDUCATION', 'Awards & Honors').
+    A line that merely starts with one ('Research Engineer', 'Tools Team Lead')
+    is a job title or content, not a header.
+    """
+    if len(line) > MAX_HEADER_CHARS:
+        return ''
+    phrase = WHITESPACE_RE.sub(' ', line.lower().replace('&', ' and ')).strip()
+    return HEADER_LOOKUP.get(phrase.rstrip(':').rstrip(), '')
+
+
+def segment_sections(text: str) -> Dict[str, List[str]]:
+    """
+    Split resume text into labelled sections in one pass.
+
+    Returns:
+        Dict[str, List[str]]: Section label -> its non-empty, de-duplicated lines,
+        in document order. Sections without a header are filled from keyword
+        lines (see FALLBACK_KEYWORDS), which needs a regex scan only in that case.
+    """
+    sections: Dict[str, Dict[str, None]] = {PREAMBLE: {}}
+    bucket = sections[PREAMBLE]
+
+    for raw_line in text.split('\n'):
+        line = raw_line.strip()
+        if not line:
+            continue
+
+        section = detect_header(line) if len(line) <= MAX_HEADER_CHARS else ''
+        if section:
+            bucket = sections.setdefault(section, {})
+            continue
+
+        bucket[line] = None
+
+    result = {section: list(lines) for section, lines in sections.items() if lines or section != PREAMBLE}
+    for section, pattern in FALLBACK_KEYWORDS.items():
+        if not result.get(section):
+            lines = dict.fromkeys(match.group(0).strip() for match in pattern.finditer(text))
+            lines.pop('', None)
+            if lines:
+                result[section] = [line for line in lines if not detect_header(line)]
+    return result
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Production Server Entry Point
+Runs a parser app under gunicorn instead of Flask's single-process debug
+server. Run this with: python serve.py
+
+PDF/DOCX libraries are imported once in the master so workers share those
+pages copy-on-write; the app module itself is imported in each worker after
+fork, so every worker builds its own parser instance (and its own pools and
+locks) exactly once.
+
+Parse jobs (/parse-jobs) must be visible to every worker, since a poll can
+land on any of them. With more than one worker and no PARSE_JOB_SPOOL_DIR,
+a private spool directory is created for this server and removed when it
+exits (set PARSE_JOB_SPOOL_DIR to keep pending jobs across restarts).
+
+Configuration (environment variables):
+    PARSER_TARGET            'flask' (default) or 'cloud-functions'
+    PARSER_APP               WSGI app for the flask target (default professional_parser:app)
+    PARSER_FUNCTION_TARGET   Function for the cloud-functions target (default resume_parser)
+    PARSER_FUNCTION_SOURCE   Source file for the cloud-functions target (default main.py)
+    HOST / PORT              Bind address (default 0.0.0.0:5006)
+    PARSER_WORKERS           Worker processes (default: available cores)
+    PARSER_THREADS           Threads per worker (default 4)
+    PARSER_KEEPALIVE         Keep-alive seconds (default 5)
+    PARSER_TIMEOUT           Seconds before a silent worker is restarted (default 120)
+    PARSER_GRACEFUL_TIMEOUT  Seconds to finish in-flight requests on shutdown (default 30)
+    PARSER_MAX_REQUESTS      Recycle workers after this many requests (default 0, never)
+    PARSER_PREWARM           1 to parse a tiny PDF and DOCX in the master before forking
+    PARSE_JOB_SPOOL_DIR      Job state shared by the workers (default: a temporary directory)
+"""
+
+import os
+import sys
+import shutil
+import tempfile
+import importlib
+from typing import Any, Dict, Optional
+
+from gunicorn.app.base import BaseApplication
+
+from batch_parser import available_cpus
+from lazy_imports import load_module
+from prewarm import prewarm_from_env
+
+TARGET_FLASK = 'flask'
+TARGET_CLOUD_FUNCTIONS = 'cloud-functions'
+
+# Imported in the master so forked workers share them
+PRELOAD_MODULES = ('pdfplumber', 'pdfminer.high_level', 'PyPDF2', 'flask', 'flask_cors')
+
+
+def server_config() -> Dict[str, Any]:
+    """Gunicorn settings from the environment."""
+    workers = int(os.environ.get('PARSER_WORKERS', 0)) or available_cpus()
+    return {
+        'bind': f"{os.environ.get('HOST', '0.0.0.0')}:{os.environ.get('PORT', '5006')}",
+        'workers': workers,
+        'threads': int(os.environ.get('PARSER_THREADS', 4)),
+        'worker_class': 'gthread',
+        'keepalive': int(os.environ.get('PARSER_KEEPALIVE', 5)),
+        'timeout': int(os.environ.get('PARSER_TIMEOUT', 120)),
+        'graceful_timeout': int(os.environ.get('PARSER_GRACEFUL_TIMEOUT', 30)),
+        'max_requests': int(os.environ.get('PARSER_MAX_REQUESTS', 0)),
+        'max_requests_jitter': int(os.environ.get('PARSER_MAX_REQUESTS', 0)) // 10,
+        'preload_app': False,
+        'accesslog': '-',
+        'worker_exit': _worker_exit,
+        'on_exit': _on_exit,
+    }
+
+
+def load_wsgi_app():
+    """Import the configured WSGI app (runs inside each worker)."""
+    target = os.environ.get('PARSER_TARGET', TARGET_FLASK)
+
+    if target == TARGET_CLOUD_FUNCTIONS:
+        from functions_framework import create_app
+        return create_app(
+            target=os.environ.get('PARSER_FUNCTION_TARGET', 'resume_parser'),
+            source=os.environ.get('PARSER_FUNCTION_SOURCE', 'main.py')
+        )
+
+    if target != TARGET_FLASK:
+        raise ValueError(f"Unknown PARSER_TARGET: {target}")
+
+    module_name, _, attribute = os.environ.get('PARSER_APP', 'professional_parser:app').partition(':')
+    return getattr(importlib.import_module(module_name), attribute or 'app')
+
+
+def _worker_exit(server, worker) -> None:
+    """Let the app module release pools and threads on graceful shutdown."""
+    module_name = os.environ.get('PARSER_APP', 'professional_parser:app').partition(':')[0]
+    module = sys.modules.get(module_name)
+    shutdown = getattr(module, 'shutdown', None)
+    if callable(shutdown):
+        shutdown()
+
+
+def share_job_spool(workers: int) -> Optional[str]:
+    """
+    Give the workers one spool directory for parse jobs, so any of them can
+    answer a poll. Returns the directory if it was created here.
+    """
+    if workers <= 1 or os.environ.get('PARSE_JOB_SPOOL_DIR'):
+        return None
+    spool_dir = tempfile.mkdtemp(prefix='resume-parse-jobs-')
+    os.environ['PARSE_JOB_SPOOL_DIR'] = spool_dir
+    return spool_dir
+
+
+def _on_exit(server) -> None:
+    """Remove the job spool created by share_job_spool() when the master exits."""
+    spool_dir = getattr(server.app, 'job_spool_dir', None)
+    if spool_dir:
+        shutil.rmtree(spool_dir, ignore_errors=True)
+
+
+def preload_libraries() -> None:
+    """Import heavy document libraries (and optionally prewarm them) in the master before forking."""
+    for module_name in PRELOAD_MODULES:
+        try:
+            load_module(module_name)
+        except ImportError:
+            pass
+    prewarm_from_env()
+
+
+class ParserServer(BaseApplication):
+    """Gunicorn application wrapper configured from the environment."""
+
+    def __init__(self, options: Dict[str, Any], job_spool_dir: Optional[str] = None):
+        self.options = options
+        self.job_spool_dir = job_spool_dir
+        super().__init__()
+
+    def load_config(self):
+        for key, value in self.options.items():
+            if key in self.cfg.settings and value is not None:
+                self.cfg.set(key, value)
+
+    def load(self):
+        return load_wsgi_app()
+
+
+def main():
+    options = server_config()
+    job_spool_dir = share_job_spool(options['workers'])
+    preload_libraries()
+
+    print("🚀 Starting Resume Parser (gunicorn)...")
+    print(f"🎯 Target: {os.environ.get('PARSER_TARGET', TARGET_FLASK)}")
+    print(f"🌐 Bind: {options['bind']}")
+    print(f"👷 Workers: {options['workers']} x {options['threads']} threads")
+    print(f"⏳ Job spool: {os.environ.get('PARSE_JOB_SPOOL_DIR') or 'in memory (one worker)'}")
+    print()
+
+    ParserServer(options, job_spool_dir).run()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,327 @@
+#!/usr/bin/env python3
+"""
+Near-Duplicate Resume Index
+MinHash signatures with locality-sensitive hashing (LSH), so a resume can be
+checked against every previously parsed one without comparing all pairs.
+
+Each resume's text is reduced to word 3-gram shingles and a 120-value
+MinHash signature; the fraction of equal signature values estimates the
+Jaccard similarity of the two shingle sets. The signature is cut into 20
+bands of 6 values and every band is hashed to a bucket. Two resumes only
+become candidates when they share a bucket in at least one band, which
+happens with probability about 0.99 at 0.8 similarity and 0.27 at 0.5, so a
+lookup costs 20 indexed bucket reads plus a few signature comparisons
+however large the index grows.
+
+The index lives in SQLite: in memory by default, or in the file named by
+SIMILARITY_INDEX_PATH so it survives restarts and can be shared with the
+dedupe_corpus.py batch tool.
+"""
+
+import os
+import re
+import zlib
+import random
+import sqlite3
+import hashlib
+import logging
+import threading
+from array import array
+from datetime import datetime
+from typing import Dict, Any, Iterable, List, Optional, Sequence, Tuple
+
+NUM_PERM = 120
+BANDS = 20
+ROWS_PER_BAND = NUM_PERM // BANDS
+SHINGLE_WORDS = 3
+DEFAULT_THRESHOLD = 0.8
+
+# Universal hashing (a * x + b) mod p over a Mersenne prime, truncated to 32 bits
+MERSENNE_PRIME = (1 << 61) - 1
+MAX_HASH = (1 << 32) - 1
+PERMUTATION_SEED = 1
+
+# Stored with the index; signatures made under another scheme are dropped
+SIGNATURE_SCHEME = f"minhash-{NUM_PERM}x{BANDS}-w{SHINGLE_WORDS}-s{PERMUTATION_SEED}"
+
+WORD_RE = re.compile(r"[a-z0-9]+")
+
+_rng = random.Random(PERMUTATION_SEED)
+_PERMUTATIONS = [(_rng.randrange(1, MERSENNE_PRIME), _rng.randrange(0, MERSENNE_PRIME)) for _ in range(NUM_PERM)]
+
+
+def document_id(file_data: bytes) -> str:
+    """Content address of an uploaded file (same digest as the parse cache)."""
+    return hashlib.blake2b(file_data, digest_size=20).hexdigest()
+
+
+def shingle_hashes(text: str) -> List[int]:
+    """32-bit hashes of the distinct word 3-grams in the text."""
+    words = WORD_RE.findall(text.lower())
+    if len(words) < SHINGLE_WORDS:
+        return [zlib.crc32(' '.join(words).encode())] if words else []
+    shingles = {' '.join(words[i:i + SHINGLE_WORDS]) for i in range(len(words) - SHINGLE_WORDS + 1)}
+    return [zlib.crc32(shingle.encode()) for shingle in shingles]
+
+
+def minhash_signature(text: str) -> List[int]:
+    """
+    MinHash signature of a resume's text.
+
+    Args:
+        text (str): Extracted resume text
+
+    Returns:
+        List[int]: NUM_PERM values; all MAX_HASH for text without words
+    """
+    hashes = shingle_hashes(text)
+    if not hashes:
+        return [MAX_HASH] * NUM_PERM
+    prime = MERSENNE_PRIME
+    return [min([(a * x + b) % prime for x in hashes]) & MAX_HASH for a, b in _PERMUTATIONS]
+
+
+def estimate_similarity(left: Sequence[int], right: Sequence[int]) -> float:
+    """Estimated Jaccard similarity: the share of equal signature values."""
+    return sum(1 for a, b in zip(left, right) if a == b) / NUM_PERM
+
+
+def band_buckets(signature: Sequence[int]) -> List[int]:
+    """One signed 64-bit bucket id per band (fits an SQLite INTEGER)."""
+    buckets = []
+    for band in range(BANDS):
+        rows = array('Q', signature[band * ROWS_PER_BAND:(band + 1) * ROWS_PER_BAND]).tobytes()
+        digest = hashlib.blake2b(rows, digest_size=8).digest()
+        buckets.append(int.from_bytes(digest, 'big', signed=True))
+    return buckets
+
+
+class SimilarityIndex:
+    """
+    MinHash/LSH index of parsed resumes, stored in SQLite.
+    """
+
+    def __init__(self, path: Optional[str] = None, threshold: float = DEFAULT_THRESHOLD):
+        """
+        Args:
+            path (str): SQLite file; None keeps the index in memory for this process
+            threshold (float): Default minimum estimated similarity for a match
+        """
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.path = path
+        self.threshold = threshold
+
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._conn_pid: Optional[int] = None
+
+        self.lookups = 0
+        self.candidates = 0
+
+    @classmethod
+    def from_env(cls) -> "SimilarityIndex":
+        """Build an index configured from SIMILARITY_INDEX_PATH / SIMILARITY_THRESHOLD."""
+        return cls(
+            path=os.environ.get('SIMILARITY_INDEX_PATH') or None,
+            threshold=float(os.environ.get('SIMILARITY_THRESHOLD', DEFAULT_THRESHOLD))
+        )
+
+    def add(self, doc_id: str, signature: Sequence[int], filename: str = '') -> None:
+        """
+        Insert or replace a document.
+
+        Args:
+            doc_id (str): Content address, see document_id()
+            signature (Sequence[int]): minhash_signature() of its text
+            filename (str): Name reported in matches
+        """
+        rows = [(band, bucket, doc_id) for band, bucket in enumerate(band_buckets(signature))]
+        with self._lock:
+            conn = self._connection()
+            if conn is None:
+                return
+            try:
+                with conn:
+                    conn.execute("DELETE FROM similarity_buckets WHERE doc_id = ?", (doc_id,))
+                    conn.execute(
+                        "INSERT OR REPLACE INTO similarity_documents (doc_id, filename, signature, added_at) "
+                        "VALUES (?, ?, ?, ?)",
+                        (doc_id, filename, array('Q', signature).tobytes(), datetime.now().isoformat())
+                    )
+                    conn.executemany(
+                        "INSERT OR IGNORE INTO similarity_buckets (band, bucket, doc_id) VALUES (?, ?, ?)", rows
+                    )
+            except sqlite3.Error as e:
+                self.logger.warning(f"Similarity index write failed: {e}")
+
+    def query(self, signature: Sequence[int], threshold: Optional[float] = None, limit: int = 10,
+              exclude: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Find indexed documents similar to a signature.
+
+        Args:
+            signature (Sequence[int]): minhash_signature() of the text to look up
+            threshold (float): Minimum estimated similarity (default: the index threshold)
+            limit (int): Maximum matches returned
+            exclude (str): Document id to leave out, normally the query document itself
+
+        Returns:
+            List[Dict[str, Any]]: Matches with document_id, filename and similarity, best first
+        """
+        threshold = self.threshold if threshold is None else threshold
+        buckets = band_buckets(signature)
+        # OR of (band, bucket) pairs so SQLite answers each one from the primary key
+        conditions = ' OR '.join(['(band = ? AND bucket = ?)'] * BANDS)
+        params = [value for band, bucket in enumerate(buckets) for value in (band, bucket)]
+
+        with self._lock:
+            conn = self._connection()
+            if conn is None:
+                return []
+            try:
+                rows = conn.execute(
+                    "SELECT d.doc_id, d.filename, d.signature FROM similarity_documents d JOIN "
+                    f"(SELECT DISTINCT doc_id FROM similarity_buckets WHERE {conditions}) b "
+                    "ON b.doc_id = d.doc_id",
+                    params
+                ).fetchall()
+            except sqlite3.Error as e:
+                self.logger.warning(f"Similarity index read failed: {e}")
+                return []
+            self.lookups += 1
+            self.candidates += len(rows)
+
+        matches = []
+        for doc_id, filename, blob in rows:
+            if doc_id == exclude:
+                continue
+            similarity = estimate_similarity(signature, array('Q', blob))
+            if similarity >= threshold:
+                matches.append({"document_id": doc_id, "filename": filename, "similarity": round(similarity, 4)})
+        matches.sort(key=lambda match: (-match["similarity"], match["document_id"]))
+        return matches[:limit]
+
+    def get_signature(self, doc_id: str) -> Optional[List[int]]:
+        """Stored signature of a document, or None if it is not indexed."""
+        with self._lock:
+            conn = self._connection()
+            if conn is None:
+                return None
+            try:
+                row = conn.execute(
+                    "SELECT signature FROM similarity_documents WHERE doc_id = ?", (doc_id,)
+                ).fetchone()
+            except sqlite3.Error as e:
+                self.logger.warning(f"Similarity index read failed: {e}")
+                return None
+        return list(array('Q', row[0])) if row else None
+
+    def dedupe(self, documents: Iterable[Tuple[str, Sequence[int], str]],
+               threshold: Optional[float] = None) -> List[List[Dict[str, Any]]]:
+        """
+        Add a corpus to the index and group its duplicates and near-duplicates.
+
+        Each document is looked up before it is added, so it is compared with
+        everything already indexed (including earlier imports) in one pass.
+
+        Args:
+            documents: (doc_id, signature, filename) tuples
+            threshold (float): Minimum estimated similarity (default: the index threshold)
+
+        Returns:
+            List[List[Dict[str, Any]]]: Groups of two or more files, each entry
+            with document_id and filename; byte-identical files share a document_id
+        """
+        parents: Dict[str, str] = {}
+        filenames: Dict[str, List[str]] = {}
+
+        def find(doc_id: str) -> str:
+            while parents[doc_id] != doc_id:
+                parents[doc_id] = parents[parents[doc_id]]
+                doc_id = parents[doc_id]
+            return doc_id
+
+        def union(left: str, right: str) -> None:
+            parents[find(left)] = find(right)
+
+        for doc_id, signature, filename in documents:
+            if doc_id in filenames:
+                filenames[doc_id].append(filename)
+                continue
+            parents[doc_id] = doc_id
+            filenames[doc_id] = [filename]
+            for match in self.query(signature, threshold, limit=NUM_PERM, exclude=doc_id):
+                if match["document_id"] not in parents:
+                    parents[match["document_id"]] = match["document_id"]
+                    filenames[match["document_id"]] = [match["filename"]]
+                union(doc_id, match["document_id"])
+            self.add(doc_id, signature, filename)
+
+        groups: Dict[str, List[Dict[str, Any]]] = {}
+        for doc_id, names in filenames.items():
+            groups.setdefault(find(doc_id), []).extend(
+                {"document_id": doc_id, "filename": name} for name in names
+            )
+        return sorted(
+            (sorted(group, key=lambda entry: entry["filename"]) for group in groups.values() if len(group) > 1),
+            key=lambda group: group[0]["filename"]
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters reported on /health."""
+        with self._lock:
+            conn = self._connection()
+            documents = 0
+            if conn is not None:
+                try:
+                    documents = conn.execute("SELECT COUNT(*) FROM similarity_documents").fetchone()[0]
+                except sqlite3.Error:
+                    pass
+            return {
+                "documents": documents,
+                "threshold": self.threshold,
+                "lookups": self.lookups,
+                "candidates": self.candidates,
+                "disk_enabled": self.path is not None
+            }
+
+    def _connection(self) -> Optional[sqlite3.Connection]:
+        """Open the index lazily, and again after a fork. Caller holds the lock."""
+        if self._conn is not None and self._conn_pid == os.getpid():
+            return self._conn
+
+        try:
+            conn = sqlite3.connect(self.path or ':memory:', timeout=5.0, check_same_thread=False)
+            if self.path:
+                conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS similarity_documents ("
+                "doc_id TEXT PRIMARY KEY, filename TEXT NOT NULL, signature BLOB NOT NULL, added_at TEXT NOT NULL)"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS similarity_buckets ("
+                "band INTEGER NOT NULL, bucket INTEGER NOT NULL, doc_id TEXT NOT NULL, "
+                "PRIMARY KEY (band, bucket, doc_id)) WITHOUT ROWID"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS similarity_buckets_doc ON similarity_buckets (doc_id)")
+            conn.execute("CREATE TABLE IF NOT EXISTS similarity_meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+            with conn:
+                row = conn.execute("SELECT value FROM similarity_meta WHERE key = 'scheme'").fetchone()
+                if row is None or row[0] != SIGNATURE_SCHEME:
+                    purged = conn.execute("DELETE FROM similarity_documents").rowcount
+                    conn.execute("DELETE FROM similarity_buckets")
+                    conn.execute("INSERT OR REPLACE INTO similarity_meta (key, value) VALUES ('scheme', ?)",
+                                 (SIGNATURE_SCHEME,))
+                    if purged:
+                        self.logger.info(f"Purged {purged} signatures made under an older scheme")
+        except sqlite3.Error as e:
+            if self.path is None:
+                self.logger.warning(f"Similarity index unavailable: {e}")
+                return None
+            self.logger.warning(f"Similarity index file unavailable ({self.path}), keeping it in memory: {e}")
+            self.path = None
+            return self._connection()
+
+        self._conn = conn
+        self._conn_pid = os.getpid()
+        return conn
@@ -4,6 +4,7 @@ Simple Resume Parser - Works without external dependencies
 Based on the professional agent pattern but simplified for easy deployment.
 """
 
+import os
 import json
 import re
 import io
@@ -281,4 +282,5 @@ if __name__ == '__main__':
     print("📋 Parse: http://localhost:5006/parse-resume")
     print()
     
-    app.run(debug=True, host='0.0.0.0', port=5006)
+    # Development server only; use serve.py (gunicorn) in production
+    app.run(debug=os.environ.get('FLASK_DEBUG') == '1', host='0.0.0.0', port=int(os.environ.get('PORT', 5006)))
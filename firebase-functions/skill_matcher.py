@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Skill Matcher
+Aho-Corasick automaton over a loadable skill taxonomy.
+
+Every skill name and synonym is matched in a single pass over the text,
+only on word boundaries (so "AI" never matches inside "maintain"). The built
+automaton is pickled under a hash of the taxonomy file, so later starts
+load it instead of rebuilding. Unpickling can run code, so the cache directory
+must belong to this user and be closed to others: no other local user can
+plant a file there.
+"""
+
+import os
+import re
+import pickle
+import hashlib
+import logging
+import threading
+from collections import deque
+from typing import Dict, List, Optional, Tuple
+
+from parse_cache import private_cache_dir, user_temp_dir
+
+DEFAULT_TAXONOMY_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'skills_taxonomy.txt')
+
+# Bump when the pickled automaton layout changes
+AUTOMATON_FORMAT = 1
+
+WHITESPACE_RE = re.compile(r'\s+')
+
+
+def load_taxonomy(path: str) -> Dict[str, List[str]]:
+    """
+    Read a taxonomy file.
+
+    Each non-comment line is 'Canonical Name | synonym | synonym ...'.
+
+    Returns:
+        Dict[str, List[str]]: Canonical skill name -> all names that match it
+    """
+    taxonomy: Dict[str, List[str]] = {}
+    with open(path, encoding='utf-8') as handle:
+        for raw_line in handle:
+            line = raw_line.strip()
+            if not line or line.startswith('#'):
+                continue
+            names = [name.strip() for name in line.split('|') if name.strip()]
+            taxonomy.setdefault(names[0], []).extend(names)
+    return taxonomy
+
+
+def normalize(text: str) -> str:
+    """Lowercase and collapse whitespace so multi-word skills match across line breaks."""
+    return WHITESPACE_RE.sub(' ', text.lower())
+
+
+class SkillMatcher:
+    """
+    Word-boundary skill matcher built on an Aho-Corasick automaton.
+    """
+
+    def __init__(self, taxonomy: Dict[str, List[str]]):
+        """Build the automaton for every name in the taxonomy."""
+        self.skills: List[str] = list(taxonomy)
+        self.digest = ''
+
+        # goto[state] maps a character to the next state; fail[state] is the
+        # longest proper suffix state; output[state] lists (skill index, length)
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[Tuple[int, int]]] = [[]]
+
+        for skill_id, canonical in enumerate(self.skills):
+            for name in set(normalize(name) for name in taxonomy[canonical]):
+                self._add_pattern(name, skill_id)
+        self._build_failure_links()
+
+    @classmethod
+    def load(cls, taxonomy_path: Optional[str] = None, cache_dir: Optional[str] = None) -> "SkillMatcher":
+        """
+        Load a matcher for a taxonomy file, reusing a pickled automaton when the file is unchanged.
+
+        Args:
+            taxonomy_path (str): Taxonomy file (default: SKILL_TAXONOMY_PATH or the bundled list)
+            cache_dir (str): Where automata are pickled (default: SKILL_CACHE_DIR or a
+                per-user directory in the temp dir); not used unless private to this user
+        """
+        logger = logging.getLogger(cls.__name__)
+        taxonomy_path = taxonomy_path or os.environ.get('SKILL_TAXONOMY_PATH') or DEFAULT_TAXONOMY_PATH
+        cache_dir = private_cache_dir(cache_dir or os.environ.get('SKILL_CACHE_DIR') or user_temp_dir('skill-automata'))
+
+        with open(taxonomy_path, 'rb') as handle:
+            digest = hashlib.blake2b(handle.read(), digest_size=16).hexdigest()
+        cache_path = (os.path.join(cache_dir, f"skill-automaton-v{AUTOMATON_FORMAT}-{digest}.pkl")
+                      if cache_dir else None)
+
+        if cache_path:
+            try:
+                with open(cache_path, 'rb') as handle:
+                    return pickle.load(handle)
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                logger.warning(f"Ignoring unreadable skill automaton {cache_path}: {e}")
+
+        matcher = cls(load_taxonomy(taxonomy_path))
+        matcher.digest = digest
+        logger.info(f"Built skill automaton: {len(matcher.skills)} skills, {len(matcher._goto)} states")
+
+        if cache_path:
+            try:
+                tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+                with open(tmp_path, 'wb') as handle:
+                    pickle.dump(matcher, handle, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_path, cache_path)
+            except OSError as e:
+                logger.warning(f"Could not cache skill automaton: {e}")
+
+        return matcher
+
+    def find(self, text: str) -> List[Tuple[int, int]]:
+        """
+        Find every word-boundary skill occurrence.
+
+        Returns:
+            List[Tuple[int, int]]: (skill index, start offset in the normalized text)
+        """
+        text = normalize(text)
+        goto, fail, output = self._goto, self._fail, self._output
+        length = len(text)
+        matches = []
+        state = 0
+
+        for end, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+
+            if output[state]:
+                after = end + 1
+                if after < length and text[after].isalnum():
+                    continue
+                for skill_id, size in output[state]:
+                    start = end - size + 1
+                    if start == 0 or not text[start - 1].isalnum():
+                        matches.append((skill_id, start))
+
+        return matches
+
+    def match(self, text: str, limit: Optional[int] = None) -> List[str]:
+        """
+        Skills mentioned in the text, most frequent first, ties broken by first mention.
+
+        Args:
+            text (str): Resume text
+            limit (int): Optional cap on the number of skills returned
+        """
+        counts: Dict[int, int] = {}
+        first_seen: Dict[int, int] = {}
+        for skill_id, start in self.find(text):
+            counts[skill_id] = counts.get(skill_id, 0) + 1
+            if skill_id not in first_seen:
+                first_seen[skill_id] = start
+
+        ranked = sorted(counts, key=lambda skill_id: (-counts[skill_id], first_seen[skill_id]))
+        return [self.skills[skill_id] for skill_id in ranked[:limit]]
+
+    def _add_pattern(self, pattern: str, skill_id: int) -> None:
+        """Insert one normalized name into the trie."""
+        state = 0
+        for char in pattern:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            state = next_state
+        if (skill_id, len(pattern)) not in self._output[state]:
+            self._output[state].append((skill_id, len(pattern)))
+
+    def _build_failure_links(self) -> None:
+        """Breadth-first failure links, folding suffix outputs into each state."""
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                link = self._goto[fallback].get(char, 0)
+                self._fail[next_state] = link if link != next_state else 0
+                self._output[next_state] = self._output[next_state] + [
+                    match for match in self._output[link] if match not in self._output[next_state]
+                ]
+
+
+_default_matcher: Optional[SkillMatcher] = None
+_default_lock = threading.Lock()
+
+
+def get_skill_matcher() -> SkillMatcher:
+    """Process-wide matcher for the configured taxonomy, loaded on first use."""
+    global _default_matcher
+    with _default_lock:
+        if _default_matcher is None:
+            _default_matcher = SkillMatcher.load()
+        return _default_matcher
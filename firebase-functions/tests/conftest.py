@@ -0,0 +1,6 @@
+"""Put the function sources (the parent directory) on sys.path for the tests."""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
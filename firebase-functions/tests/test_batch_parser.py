@@ -0,0 +1,24 @@
+"""Batch items are decoded with the same limits as single uploads."""
+
+import base64
+
+import batch_parser
+from batch_parser import BatchResumeParser
+
+
+def test_oversized_and_invalid_items_get_fallback_entries(monkeypatch):
+    monkeypatch.setattr(batch_parser, 'MAX_FILE_BYTES', 1024)
+    parser = BatchResumeParser(max_workers=1)
+    try:
+        results = parser.parse_batch([
+            {"file": base64.b64encode(b'%PDF' + b'x' * 4096).decode('ascii'), "filename": "big.pdf"},
+            {"file": "not base64!", "filename": "bad.pdf"},
+            {"filename": "empty.pdf"},
+        ])
+    finally:
+        parser.shutdown()
+
+    assert [result['filename'] for result in results] == ['big.pdf', 'bad.pdf', 'empty.pdf']
+    assert all(result['_fallback'] for result in results)
+    assert results[0]['_error'].startswith('File is')
+    assert results[1]['_error'].startswith('Invalid batch item')
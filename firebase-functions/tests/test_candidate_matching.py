@@ -0,0 +1,76 @@
+"""Candidate matching stays correct as rows are appended, replaced and compacted."""
+
+import random
+
+import pytest
+
+import candidate_matching
+from candidate_matching import CandidateMatcher
+
+pytest.importorskip('numpy')
+
+SKILLS = ['Python', 'Go', 'SQL', 'Docker', 'Kubernetes', 'React', 'Java', 'Terraform', 'AWS', 'Rust']
+JOBS = [['Python', 'SQL'], ['Kubernetes', 'Go', 'Terraform'], ['Rust'], ['COBOL']]
+
+
+def random_candidates(rng, count, ids):
+    return [(f"doc-{rng.randrange(ids)}", rng.sample(SKILLS, rng.randint(0, 5))) for _ in range(count)]
+
+
+def rebuilt(matcher):
+    """A fresh matcher holding the same live candidates, in the same order."""
+    fresh = CandidateMatcher()
+    rows = sorted(matcher._rows.items(), key=lambda item: item[1])
+    for doc_id, row in rows:
+        start, end = matcher._indptr[row], matcher._indptr[row + 1]
+        fresh.add(doc_id, [matcher._skill_names[column] for column in matcher._indices[start:end]])
+    return fresh
+
+
+def assert_same_results(left, right):
+    for left_job, right_job in zip(left, right):
+        assert [match['document_id'] for match in left_job] == [match['document_id'] for match in right_job]
+        assert [match['score'] for match in left_job] == pytest.approx([match['score'] for match in right_job])
+
+
+def test_incremental_snapshot_matches_a_full_rebuild():
+    rng = random.Random(3)
+    matcher = CandidateMatcher()
+    for _ in range(20):
+        matcher.load(random_candidates(rng, rng.randint(1, 30), ids=200))
+        # A limit past every candidate, so ties at the cut-off cannot differ
+        assert_same_results(matcher.match(JOBS, limit=1000), rebuilt(matcher).match(JOBS, limit=1000))
+
+
+def test_match_after_add_only_copies_the_new_rows():
+    matcher = CandidateMatcher()
+    matcher.load([(f"doc-{index}", ['Python', 'SQL']) for index in range(100)])
+    matcher.match(JOBS)
+    # The first growth doubles the buffers...
+    matcher.add('doc-100', ['Python'])
+    matcher.match(JOBS)
+    data_buffer = matcher._buffers[0]
+
+    # ...so later additions are written into their spare capacity
+    matcher.add('doc-101', ['Go'])
+    assert matcher.match([['Go']])[0][0]['document_id'] == 'doc-101'
+    assert matcher._buffers[0] is data_buffer
+
+
+def test_replaced_rows_are_compacted(monkeypatch):
+    monkeypatch.setattr(candidate_matching, 'COMPACT_MIN_DELETED', 4)
+    matcher = CandidateMatcher()
+    matcher.load([(f"doc-{index}", ['Python', 'Go']) for index in range(10)])
+    matcher.match(JOBS)
+
+    for index in range(4):
+        matcher.add(f"doc-{index}", ['Rust'])
+    stats = matcher.stats()
+    assert stats['compactions'] == 1
+    assert stats['replaced_rows'] == 0
+    assert stats['nonzeros'] == 6 * 2 + 4
+
+    results = matcher.match([['Rust'], ['Go']], limit=20)
+    assert sorted(match['document_id'] for match in results[0]) == [f"doc-{index}" for index in range(4)]
+    assert len(results[1]) == 6
+    assert_same_results(results, rebuilt(matcher).match([['Rust'], ['Go']], limit=20))
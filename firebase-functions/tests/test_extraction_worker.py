@@ -0,0 +1,39 @@
+"""Worker timeouts and the deadline a stage such as OCR can extend."""
+
+import time
+
+import pytest
+
+from extraction_worker import SupervisedExtractor, ExtractionTimeout, extend_deadline
+
+
+def slow(seconds, extension):
+    if extension:
+        extend_deadline(extension)
+    time.sleep(seconds)
+    return 'done'
+
+
+def test_slow_call_is_timed_out():
+    extractor = SupervisedExtractor(max_workers=1, timeout=0.5)
+    try:
+        with pytest.raises(ExtractionTimeout):
+            extractor.run(slow, 2, 0)
+        assert extractor.stats()['restarts'] == 1
+    finally:
+        extractor.shutdown()
+
+
+def test_extended_deadline_lets_the_call_finish():
+    extractor = SupervisedExtractor(max_workers=1, timeout=0.5)
+    try:
+        assert extractor.run(slow, 1.5, 5) == 'done'
+        # The worker is kept and still answers within the normal timeout
+        assert extractor.run(slow, 0, 0) == 'done'
+        assert extractor.stats()['restarts'] == 0
+    finally:
+        extractor.shutdown()
+
+
+def test_extend_deadline_is_ignored_in_process():
+    assert SupervisedExtractor(max_workers=0).run(slow, 0, 5) == 'done'
@@ -0,0 +1,106 @@
+"""Name/email/phone extraction against the per-field functions it replaced."""
+
+import re
+import random
+from typing import Optional
+
+import pytest
+
+from field_extraction import FieldScanner, extract_fields
+
+
+# Legacy ProfessionalResumeParser._extract_* (the phone patterns were the same in every app)
+def legacy_extract_name(text: str) -> Optional[str]:
+    lines = [line.strip() for line in text.split('\n') if line.strip()]
+    name_patterns = [
+        r'^[A-Z][a-z]+ [A-Z][a-z]+$',
+        r'^[A-Z][a-z]+ [A-Z]\. [A-Z][a-z]+$',
+        r'^[A-Z][a-z]+ [A-Z][a-z]+ [A-Z][a-z]+$',
+        r'^[A-Z][a-z]+ [A-Z][a-z]+ [A-Z][a-z]+ [A-Z][a-z]+$'
+    ]
+    for line in lines[:15]:
+        if not any(keyword in line.lower() for keyword in [
+            '@', 'phone', 'email', 'tel', 'fax', 'linkedin', 'github', 'portfolio',
+            'resume', 'cv', 'curriculum', 'vitae', 'objective', 'summary',
+            'experience', 'education', 'skills', 'projects', 'contact'
+        ]):
+            for pattern in name_patterns:
+                if re.match(pattern, line):
+                    return line
+    for line in lines[:10]:
+        if len(line.split()) >= 2 and len(line.split()) <= 4:
+            if not any(keyword in line.lower() for keyword in ['@', 'phone', 'email', 'tel']):
+                words = line.split()
+                if all(word[0].isupper() for word in words if word):
+                    return line
+    return None
+
+
+def legacy_extract_email(text: str) -> Optional[str]:
+    match = re.search(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', text)
+    return match.group(0) if match else None
+
+
+def legacy_extract_phone(text: str) -> Optional[str]:
+    phone_patterns = [
+        r'(\+?1[-.\s]?)?\(?([0-9]{3})\)?[-.\s]?([0-9]{3})[-.\s]?([0-9]{4})',
+        r'(\+?[0-9]{1,3}[-.\s]?)?\(?([0-9]{3})\)?[-.\s]?([0-9]{3})[-.\s]?([0-9]{4})',
+        r'\+?[0-9]{10,15}'
+    ]
+    for pattern in phone_patterns:
+        match = re.search(pattern, text)
+        if match:
+            phone = re.sub(r'\D', '', match.group(0))
+            if len(phone) >= 10:
+                return phone
+    return None
+
+
+def legacy_fields(text: str):
+    return {"name": legacy_extract_name(text), "email": legacy_extract_email(text),
+            "phone": legacy_extract_phone(text)}
+
+
+RESUMES = [
+    "Jane Doe\njane.doe@example.com\nPhone: 919876543210\n",
+    "Curriculum Vitae\nRavi K. Sharma\nravi@example.in | +91 98765 43210\n",
+    "JOHN SMITH\nSenior Engineer\nTel: +1 (415) 555-0100\nExperience\n",
+    "Mary Ann Lee Wong\nmary@example.org\n+44 20 7946 0958\n",
+    "Summary\nBuilt things.\nContact: 020-7946-0958 or 07700 900123\n",
+    "Ann Marie\nOrder 12345678901234 shipped; call 555.123.4567\n",
+    "Objective: lead\nPedro Alvarez\n(555)123-4567 x12\npedro@mail.com\n",
+    "no capitals here\nids 123 456 7890 1234\n",
+]
+
+
+@pytest.mark.parametrize('text', RESUMES)
+def test_matches_legacy_output(text):
+    assert extract_fields(text) == legacy_fields(text)
+
+
+def test_bare_digit_run_keeps_legacy_phone():
+    # The grouped pattern wins over the whole run, as before
+    assert extract_fields("Phone: 919876543210")["phone"] == '9198765432'
+
+
+def test_matches_legacy_output_on_random_text():
+    rng = random.Random(5)
+    alphabet = '0123456789' * 4 + ' -.()+\n' + 'AbcdeXyz@.' + ' '
+    words = ['Jane', 'Doe', 'Ravi', 'K.', 'Sharma', 'phone', 'Email', 'jd@x.io', 'Skills']
+    for _ in range(3000):
+        parts = []
+        for _ in range(rng.randint(1, 12)):
+            if rng.random() < 0.5:
+                parts.append(''.join(rng.choice(alphabet) for _ in range(rng.randint(1, 16))))
+            else:
+                parts.append(' '.join(rng.choice(words) for _ in range(rng.randint(1, 4))))
+        text = rng.choice([' ', '\n']).join(parts)
+        assert extract_fields(text) == legacy_fields(text), text
+
+
+def test_page_by_page_matches_whole_text():
+    pages = ["Jane Doe\nEngineer\n", "Worked at Example\n", "jane@example.com\nPhone 415 555 0100\n"]
+    scanner = FieldScanner()
+    for page in pages:
+        scanner.feed(page)
+    assert scanner.result() == extract_fields(''.join(pages)) == legacy_fields(''.join(pages))
@@ -0,0 +1,25 @@
+"""The contact-mode endpoint answers from the page scan alone."""
+
+import os
+import sys
+import base64
+
+import pytest
+
+pytest.importorskip('PyPDF2')
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'benchmarks'))
+
+from samples import make_pdf, lines_to_runs  # noqa: E402
+import main  # noqa: E402
+
+
+def test_contact_mode_does_not_rescan_the_text(monkeypatch):
+    def rescan(text):
+        raise AssertionError("text scanned a second time")
+
+    monkeypatch.setattr(main, 'extract_fields', rescan)
+    pdf = make_pdf([lines_to_runs(["Maria Garcia", "maria@example.com | (415) 555-0134", "Experience"])] * 2)
+    response = main.app.test_client().post('/parse-resume', json={
+        "file": base64.b64encode(pdf).decode('ascii'), "type": "application/pdf"})
+    assert response.get_json() == {"name": "Maria Garcia", "email": "maria@example.com", "phone": "4155550134"}
@@ -0,0 +1,58 @@
+"""OCR pages are cached as they are recognized, not only when the scan ends."""
+
+import io
+
+import pytest
+
+import ocr_extraction
+from parse_cache import ParseCache
+
+pypdfium2 = pytest.importorskip('pypdfium2')
+
+
+def blank_pdf(pages):
+    document = pypdfium2.PdfDocument.new()
+    for _ in range(pages):
+        document.new_page(612, 792)
+    buffer = io.BytesIO()
+    document.save(buffer)
+    document.close()
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def disk_cache(tmp_path, monkeypatch):
+    path = str(tmp_path / 'ocr.sqlite3')
+    monkeypatch.setattr(ocr_extraction, '_cache', ParseCache('ocr', ocr_extraction.OCR_VERSION, path=path))
+    monkeypatch.setattr(ocr_extraction, 'render_page', lambda document, index: str(index).encode())
+    return path
+
+
+def test_each_page_is_on_disk_before_the_next_is_read(disk_cache, monkeypatch):
+    recognized = []
+
+    def recognize(image, running=None):
+        recognized.append(image)
+        return f"page {image.decode()}"
+
+    monkeypatch.setattr(ocr_extraction, 'recognize_image', recognize)
+    pdf = blank_pdf(3)
+    pages = ocr_extraction.iter_ocr_pages(pdf, workers=1)
+
+    assert next(pages) == "page 0"
+    # A fresh cache on the same file, as a replacement worker would open it
+    retry = ParseCache('ocr', ocr_extraction.OCR_VERSION, path=disk_cache)
+    entry = retry.get(retry.make_key(pdf, ocr_extraction.OCR_LANGUAGE, ocr_extraction.OCR_DPI))
+    assert entry == {"pages": ["page 0"], "page_count": 3}
+
+    pages.close()
+    recognized.clear()
+    assert list(ocr_extraction.iter_ocr_pages(pdf, workers=1)) == ["page 0", "page 1", "page 2"]
+    assert b"0" not in recognized
+
+
+def test_disk_tier_keeps_the_newest_rows(tmp_path):
+    cache = ParseCache('ocr', '1', max_entries=0, path=str(tmp_path / 'ocr.sqlite3'), max_disk_entries=2)
+    for index in range(4):
+        cache.put(f"key-{index}", {"pages": [str(index)]})
+    assert [cache.get(f"key-{index}") is not None for index in range(4)] == [False, False, True, True]
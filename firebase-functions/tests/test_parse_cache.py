@@ -0,0 +1,41 @@
+"""What opening the disk tier purges when parser versions share one file."""
+
+from parse_cache import ParseCache, older_versions
+
+
+def open_cache(path, version, namespace='ProfessionalResumeParser'):
+    return ParseCache(namespace, version, max_entries=0, path=str(path))
+
+
+def put(cache, name):
+    key = cache.make_key(name.encode())
+    cache.put(key, {"name": name})
+    return key
+
+
+def test_versions_are_ordered_numerically():
+    assert older_versions(['1.9.0', '2.10.0', '2.2.1', '2.2.0', 'dev'], '2.2.1') == ['1.9.0', '2.2.0']
+    assert older_versions(['2.2.0'], 'dev') == []
+
+
+def test_old_workers_do_not_purge_newer_entries(tmp_path):
+    path = tmp_path / 'cache.db'
+    new = open_cache(path, '2.2.1')
+    new_key = put(new, 'new')
+
+    # Old workers still starting or restarting mid-deploy
+    old = open_cache(path, '2.2.0')
+    old_key = put(old, 'old')
+    assert open_cache(path, '2.2.0').get(old_key) == {"name": "old"}
+
+    assert open_cache(path, '2.2.1').get(new_key) == {"name": "new"}
+
+
+def test_older_versions_are_purged(tmp_path):
+    path = tmp_path / 'cache.db'
+    old_key = put(open_cache(path, '2.2.0'), 'old')
+    other_key = put(open_cache(path, '1.0.0', namespace='ResumeParserAgent'), 'other')
+
+    open_cache(path, '2.2.1').get('warm-up')
+    assert open_cache(path, '2.2.0').get(old_key) is None
+    assert open_cache(path, '1.0.0', namespace='ResumeParserAgent').get(other_key) == {"name": "other"}
@@ -0,0 +1,77 @@
+"""Parse jobs polled from, and recovered by, processes sharing a spool directory."""
+
+import time
+import threading
+
+from parse_jobs import ParseJobManager, STATUS_DONE
+
+
+def wait_for(manager, job_id, status=STATUS_DONE, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        job = manager.get(job_id)
+        if job and job["status"] == status:
+            return job
+        time.sleep(0.01)
+    raise AssertionError(f"job {job_id} never reached {status}: {manager.get(job_id)}")
+
+
+def test_in_memory_job_runs_and_is_pollable():
+    manager = ParseJobManager(lambda data, filename, file_type, mode: {"size": len(data)})
+    job = manager.submit(b'abc', 'cv.pdf', 'application/pdf', 'full')
+    assert wait_for(manager, job["job_id"])["result"] == {"size": 3}
+    assert manager.get('0' * 32) is None
+
+
+def test_job_is_pollable_from_another_process(tmp_path):
+    handler = lambda data, filename, file_type, mode: {"filename": filename}  # noqa: E731
+    submitter = ParseJobManager(handler, spool_dir=str(tmp_path))
+    poller = ParseJobManager(handler, spool_dir=str(tmp_path))
+
+    job = submitter.submit(b'abc', 'cv.pdf', 'application/pdf', 'full')
+    assert wait_for(poller, job["job_id"])["result"] == {"filename": "cv.pdf"}
+    # The record is marked done before the file is dropped
+    spooled_file = tmp_path / f"{job['job_id']}.bin"
+    deadline = time.monotonic() + 5
+    while spooled_file.exists() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert not spooled_file.exists()
+
+
+def test_running_job_is_not_started_twice(tmp_path):
+    release = threading.Event()
+    runs = []
+
+    def handler(data, filename, file_type, mode):
+        runs.append(filename)
+        release.wait(5)
+        return {}
+
+    first = ParseJobManager(handler, spool_dir=str(tmp_path))
+    job = first.submit(b'abc', 'cv.pdf', 'application/pdf', 'full')
+    wait_for(first, job["job_id"], status='running')
+
+    # A second worker starting up queues every unfinished spooled job
+    second = ParseJobManager(handler, spool_dir=str(tmp_path))
+    second.get(job["job_id"])
+    time.sleep(0.1)
+    release.set()
+    wait_for(second, job["job_id"])
+    time.sleep(0.1)
+    assert runs == ['cv.pdf']
+
+
+def test_unclaimed_job_is_recovered_by_the_next_process(tmp_path):
+    # A process that died with the job queued left only its spool files
+    dead = ParseJobManager(lambda *args: {}, spool_dir=str(tmp_path))
+    with dead._lock:
+        dead._started = True
+    job = dead.submit(b'abc', 'cv.pdf', 'application/pdf', 'full')
+
+    successor = ParseJobManager(lambda data, *args: {"size": len(data)}, spool_dir=str(tmp_path))
+    assert wait_for(successor, job["job_id"])["result"] == {"size": 3}
+
+
+def test_invalid_job_ids_are_not_looked_up(tmp_path):
+    manager = ParseJobManager(lambda *args: {}, spool_dir=str(tmp_path))
+    assert manager.get('../../etc/passwd') is None
@@ -0,0 +1,71 @@
+"""BM25 search index, alone and shared by several writers."""
+
+from search_index import SearchIndex
+
+
+def profile(name, skills):
+    return {"name": name, "skills": skills, "email": f"{name.split()[0].lower()}@example.com"}
+
+
+def test_search_ranks_matching_profiles():
+    index = SearchIndex()
+    index.add('a', profile('Ada Lovelace', ['Python', 'Kubernetes']))
+    index.add('b', profile('Grace Hopper', ['COBOL']))
+    hits = index.search('python kubernetes')
+    assert [hit['document_id'] for hit in hits] == ['a']
+    assert hits[0]['name'] == 'Ada Lovelace'
+
+
+def test_reindexing_replaces_the_earlier_version(tmp_path):
+    path = str(tmp_path / 'search.db')
+    index = SearchIndex(path, flush_every=2)
+    index.add('a', profile('Ada Lovelace', ['Python']))
+    index.add('a', profile('Ada Lovelace', ['Rust']))
+    index.flush()
+    assert index.search('python') == []
+
+    reopened = SearchIndex(path)
+    assert [hit['document_id'] for hit in reopened.search('rust')] == ['a']
+    assert reopened.stats()['documents'] == 1
+
+
+def test_writers_sharing_a_file_do_not_collide(tmp_path):
+    path = str(tmp_path / 'search.db')
+    first, second = SearchIndex(path), SearchIndex(path)
+    first.stats()
+    second.stats()
+
+    for number in range(10):
+        writer = first if number % 2 else second
+        writer.add(f'doc-{number}', profile(f'Candidate{number} Smith', ['Python', f'skill{number}']))
+
+    for index in (first, second):
+        assert index.stats()['pending'] == 0
+        assert index.stats()['documents'] == 10
+        assert len(index.search('python', limit=20)) == 10
+        assert [hit['document_id'] for hit in index.search('skill7')] == ['doc-7']
+    assert len(list(SearchIndex(path).profiles())) == 10
+
+
+def test_buffered_documents_are_renumbered_after_other_writers(tmp_path):
+    path = str(tmp_path / 'search.db')
+    buffered, other = SearchIndex(path, flush_every=100), SearchIndex(path)
+    buffered.add('mine', profile('Ada Lovelace', ['Haskell']))
+    other.add('theirs', profile('Grace Hopper', ['COBOL']))
+    assert [hit['document_id'] for hit in buffered.search('haskell')] == ['mine']
+    assert [hit['document_id'] for hit in buffered.search('cobol')] == ['theirs']
+
+    buffered.flush()
+    assert buffered.stats()['pending'] == 0
+    assert [hit['document_id'] for hit in other.search('haskell')] == ['mine']
+    assert [hit['document_id'] for hit in SearchIndex(path).search('cobol')] == ['theirs']
+
+
+def test_replacement_by_another_writer(tmp_path):
+    path = str(tmp_path / 'search.db')
+    first, second = SearchIndex(path), SearchIndex(path)
+    first.add('a', profile('Ada Lovelace', ['Python']))
+    second.add('a', profile('Ada Lovelace', ['Rust']))
+    assert first.search('python') == []
+    assert [hit['document_id'] for hit in first.search('rust')] == ['a']
+    assert first.stats()['documents'] == 1
@@ -0,0 +1,44 @@
+"""Section headers are whole header phrases, never job titles that start with one."""
+
+import pytest
+
+from sections import detect_header, segment_sections
+
+
+@pytest.mark.parametrize('line, section', [
+    ('Experience', 'experience'),
+    ('WORK EXPERIENCE', 'experience'),
+    ('Work Experience:', 'experience'),
+    ('Awards & Honors', 'awards'),
+    ('Technical  Skills :', 'skills'),
+])
+def test_header_phrases_in_any_case(line, section):
+    assert detect_header(line) == section
+
+
+@pytest.mark.parametrize('line', [
+    'Research Engineer, Google',
+    'Research Engineer',
+    'Tools Team Lead',
+    'Career Highlights',
+    'Education & Training',
+    'Experienced engineer',
+])
+def test_lines_that_only_start_with_a_header_phrase(line):
+    assert detect_header(line) == ''
+
+
+def test_job_titles_stay_in_their_section():
+    text = ("Maria Garcia\nExperience\nResearch Engineer, Google\nBuilt ranking systems for search\n"
+            "Tools Team Lead\nLed build tooling\nEducation\nBSc Computer Science")
+    sections = segment_sections(text)
+    assert sections['experience'] == ["Research Engineer, Google", "Built ranking systems for search",
+                                      "Tools Team Lead", "Led build tooling"]
+    assert sections['education'] == ["BSc Computer Science"]
+    assert 'publications' not in sections
+    assert 'skills' not in sections
+
+
+def test_keyword_lines_fill_a_section_without_a_header():
+    sections = segment_sections("Maria Garcia\nTen years of experience in search\nResearch Engineer, Google")
+    assert sections['experience'] == ["Ten years of experience in search"]
@@ -0,0 +1,45 @@
+"""Skill matching and where the built automaton is cached."""
+
+import os
+import stat
+
+from skill_matcher import SkillMatcher, AUTOMATON_FORMAT, private_cache_dir
+
+
+def write_taxonomy(tmp_path):
+    path = tmp_path / 'taxonomy.txt'
+    path.write_text("Java\nJavaScript | JS\nMachine Learning | ML\n", encoding='utf-8')
+    return str(path)
+
+
+def cached_files(directory):
+    return [name for name in os.listdir(directory) if name.startswith(f'skill-automaton-v{AUTOMATON_FORMAT}-')]
+
+
+def test_matches_on_word_boundaries(tmp_path):
+    matcher = SkillMatcher.load(write_taxonomy(tmp_path), cache_dir=str(tmp_path / 'cache'))
+    assert matcher.match("Maintained Java and JS services; some machine\nlearning") == [
+        'Java', 'JavaScript', 'Machine Learning']
+
+
+def test_private_directory_is_created_and_reused(tmp_path):
+    taxonomy = write_taxonomy(tmp_path)
+    cache_dir = tmp_path / 'cache'
+    first = SkillMatcher.load(taxonomy, cache_dir=str(cache_dir))
+    assert stat.S_IMODE(os.stat(cache_dir).st_mode) == 0o700
+    assert len(cached_files(cache_dir)) == 1
+
+    second = SkillMatcher.load(taxonomy, cache_dir=str(cache_dir))
+    assert second.digest == first.digest
+    assert second.match("java") == ['Java']
+
+
+def test_shared_directory_is_not_used(tmp_path):
+    shared = tmp_path / 'shared'
+    shared.mkdir()
+    os.chmod(shared, 0o1777)
+    assert private_cache_dir(str(shared)) is None
+
+    matcher = SkillMatcher.load(write_taxonomy(tmp_path), cache_dir=str(shared))
+    assert matcher.match("java") == ['Java']
+    assert cached_files(shared) == []
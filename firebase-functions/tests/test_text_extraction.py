@@ -0,0 +1,52 @@
+"""Which PDFs the PyPDF2 -> pdfplumber cascade escalates, and why."""
+
+import os
+import sys
+
+import pytest
+
+pytest.importorskip('PyPDF2')
+pytest.importorskip('pdfplumber')
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'benchmarks'))
+
+from samples import make_pdf, lines_to_runs  # noqa: E402
+from bench_cascade import BODY, word_runs  # noqa: E402
+from text_extraction import (TextQuality, QUALITY_THRESHOLD, ENGINE_PYPDF2, ENGINE_PDFPLUMBER,  # noqa: E402
+                             scan_pdf_fields)
+
+HEADER = ["Maria Garcia", "maria.garcia@example.com | (415) 555-0134"]
+
+
+def score(text):
+    quality = TextQuality()
+    quality.feed(text)
+    return quality.score()
+
+
+def test_bullets_and_separators_are_not_counted_as_bad_words():
+    assert score("• Built services in Python | Go - 2019 – 2024") == 1.0
+
+
+def test_glued_and_spaced_out_text_scores_low():
+    assert score("BuiltdocumentprocessingservicesinPython andGorunningonKubernetes") < QUALITY_THRESHOLD
+    assert score("M a r i a G a r c i a") < QUALITY_THRESHOLD
+
+
+@pytest.mark.parametrize('header', [
+    HEADER,
+    ["Maria Garcia"],
+    ["maria.garcia@example.com"],
+    [],
+], ids=['all fields', 'name only', 'email only', 'no contact fields'])
+def test_clean_pdf_stays_on_pypdf2_whatever_fields_it_has(header):
+    scan = scan_pdf_fields(make_pdf([lines_to_runs(header + BODY)]))
+    assert scan.engine == ENGINE_PYPDF2
+    assert scan.quality >= QUALITY_THRESHOLD
+
+
+@pytest.mark.parametrize('header', [HEADER, ["Maria Garcia"]], ids=['all fields', 'name only'])
+def test_positioned_words_escalate_to_pdfplumber(header):
+    scan = scan_pdf_fields(make_pdf([word_runs(header + BODY)]))
+    assert scan.engine == ENGINE_PDFPLUMBER
+    assert scan.fields['name'] == 'Maria Garcia'
@@ -0,0 +1,81 @@
+"""Upload decoding: base64 JSON bodies and their size limits."""
+
+import os
+import json
+import base64
+
+import pytest
+from flask import Flask
+
+from uploads import DECODE_CHUNK_CHARS, UploadError, UploadTooLarge, decode_base64, read_json, read_upload
+
+app = Flask(__name__)
+
+
+def post_json(payload):
+    with app.test_request_context('/parse-resume', method='POST', data=json.dumps(payload),
+                                  content_type='application/json'):
+        from flask import request
+        return read_upload(request)
+
+
+def wrapped(data, line_ending='\n'):
+    """MIME-style base64: 76-character lines."""
+    return base64.encodebytes(data).decode('ascii').replace('\n', line_ending)
+
+
+@pytest.mark.parametrize('line_ending', ['\n', '\r\n'])
+def test_wrapped_base64_over_one_slice_decodes(line_ending):
+    # 76 data characters and a line break per line: by the third 256K slice a raw cut
+    # would straddle a 4-character group
+    data = os.urandom(700 * 1024)
+    encoded = wrapped(data, line_ending)
+    assert len(encoded) > DECODE_CHUNK_CHARS
+    if len(encoded) % 4:
+        data = data[:-(len(encoded) % 4) * 57]
+        encoded = wrapped(data, line_ending)
+    assert len(encoded) % 4 == 0 and len(encoded) > DECODE_CHUNK_CHARS
+
+    upload = post_json({"file": encoded, "filename": "scan.pdf", "type": "application/pdf"})
+    assert upload.file_data == data
+    assert upload.filename == 'scan.pdf'
+
+
+def test_unbroken_base64_over_one_slice_decodes():
+    data = os.urandom(DECODE_CHUNK_CHARS)
+    assert decode_base64(base64.b64encode(data).decode('ascii')) == data
+
+
+def test_base64_with_other_whitespace_decodes():
+    data = os.urandom(DECODE_CHUNK_CHARS)
+    encoded = base64.b64encode(data).decode('ascii')
+    # Four spaces keep the length a multiple of 4 but shift every later slice
+    encoded = encoded[:1001] + '    ' + encoded[1001:]
+    assert decode_base64(encoded) == data
+
+
+def test_invalid_base64_is_rejected():
+    with pytest.raises(UploadError) as excinfo:
+        decode_base64('QUJD' * 10 + 'Q')
+    assert excinfo.value.status == 400
+
+
+def test_oversized_base64_is_refused_before_decoding():
+    encoded = 'A' * (4 * 1024)
+    with pytest.raises(UploadTooLarge) as excinfo:
+        decode_base64(encoded, limit=1024)
+    assert excinfo.value.status == 413
+
+
+def test_line_breaks_do_not_count_towards_the_limit():
+    data = os.urandom(3000)
+    assert decode_base64(wrapped(data), limit=len(data)) == data
+
+
+def test_batch_body_over_its_limit_is_refused_before_reading():
+    body = json.dumps({"files": [{"file": base64.b64encode(b'x' * 4096).decode('ascii')}]})
+    with app.test_request_context('/parse-resumes', method='POST', data=body, content_type='application/json'):
+        from flask import request
+        with pytest.raises(UploadTooLarge):
+            read_json(request, limit=1024)
+        assert request.stream.read(1)
@@ -0,0 +1,383 @@
+#!/usr/bin/env python3
+"""
+Page-by-page Text Extraction
+Yields PDF text one page at a time so callers can stop reading as soon as
+they have what they need, instead of concatenating every page up front.
+Each pdfplumber page's layout cache is released once its text is out, so
+memory stays flat as page count grows.
+
+Engines run cheapest first: PyPDF2's output is scored and pdfplumber only
+runs when that score is low. Layout mode reads only the first page's
+character coordinates (see layout_extraction). Scanned PDFs with no text
+layer at all are run through local OCR (see ocr_extraction).
+"""
+
+import io
+import os
+import re
+import logging
+from typing import Dict, Any, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+from field_extraction import FieldScanner
+from layout_extraction import chars_to_words, find_contact_block
+from docx_extraction import iter_docx_paragraphs
+from ocr_extraction import iter_ocr_pages, OCR_AVAILABLE
+from lazy_imports import module_available, load_module
+from uploads import PDF_MIME, DOCX_MIME
+from metrics import (Stopwatch, stage_timer, PDF_FALLBACKS, PDF_ENGINE_DOCUMENTS,
+                     STAGE_PDFPLUMBER, STAGE_PYPDF2, STAGE_DOCX, STAGE_FIELDS, STAGE_LAYOUT)
+
+# Document libraries are imported on first use (see lazy_imports)
+PDF_AVAILABLE = module_available('PyPDF2')
+PDFPLUMBER_AVAILABLE = module_available('pdfplumber')
+PDFMINER_AVAILABLE = module_available('pdfminer')
+
+logger = logging.getLogger(__name__)
+
+# Per-request extraction modes: every page, stop once contact fields are found,
+# or read the contact block from the first page's layout
+MODE_FULL = 'full'
+MODE_CONTACT = 'contact'
+MODE_LAYOUT = 'layout'
+PARSE_MODES = (MODE_FULL, MODE_CONTACT, MODE_LAYOUT)
+
+CONTACT_FIELDS = ('name', 'email', 'phone')
+
+# Libraries each upload type needs
+FORMAT_MODULES = {
+    PDF_MIME: ('PyPDF2', 'pdfplumber'),
+    DOCX_MIME: ()
+}
+
+# Extraction engines, cheapest first
+ENGINE_PYPDF2 = 'pypdf2'
+ENGINE_PDFPLUMBER = 'pdfplumber'
+ENGINE_DOCX = 'docx-xml'
+ENGINE_LAYOUT = 'pdfminer-layout'
+# Last resort for image-only PDFs, outside the quality-scored cascade
+ENGINE_OCR = 'tesseract'
+ENGINE_CASCADE = tuple(engine for engine, available in (
+    (ENGINE_PYPDF2, PDF_AVAILABLE),
+    (ENGINE_PDFPLUMBER, PDFPLUMBER_AVAILABLE)
+) if available)
+
+# Text scoring at least this well is kept; lower scores escalate to the next engine
+QUALITY_THRESHOLD = float(os.environ.get('PDF_QUALITY_THRESHOLD', 0.9))
+
+# Longer PDFs are refused before full extraction; contact scans stop reading here
+MAX_PDF_PAGES = int(os.environ.get('MAX_PDF_PAGES', 100))
+
+# Replacement/control/private-use glyphs and pdfminer's unmapped "(cid:123)" markers
+BAD_TEXT_RE = re.compile(r'[\x00-\x08\x0b\x0c\x0e-\x1f\x7f\ufffd\ue000-\uf8ff]|\(cid:\d+\)')
+MIN_WORD_CHARS = 2
+MAX_WORD_CHARS = 24
+# Lower-to-upper case change inside a token: words glued together ("MariaGarcia")
+GLUED_WORDS_RE = re.compile(r'[a-z]{2}[A-Z][a-z]')
+# Tokens without a letter or digit (bullets, "|", "-") are layout, not words
+WORD_CHAR_RE = re.compile(r'\w')
+
+
+class DocumentTooLarge(Exception):
+    """Raised when a PDF has more pages than MAX_PDF_PAGES."""
+
+
+class PageScan(NamedTuple):
+    """Outcome of scanning a PDF's pages for contact fields."""
+    fields: Dict[str, Optional[str]]
+    pages_read: int
+    has_text: bool
+    text: str
+    engine: str
+    quality: float
+
+
+class TextQuality:
+    """
+    Running quality score of extracted text, from 0 to 1.
+
+    The share of printable characters times the share of word-like tokens
+    (glued words and one-letter-per-token output both count against it).
+    Only the text is judged: a resume that lacks an email or phone number is
+    not a sign of a bad extraction, so the contact fields play no part.
+    """
+
+    def __init__(self):
+        self.chars = 0
+        self.bad_chars = 0
+        self.tokens = 0
+        self.words = 0
+
+    def feed(self, text: str) -> None:
+        self.chars += len(text)
+        self.bad_chars += sum(len(match) for match in BAD_TEXT_RE.findall(text))
+        tokens = [token for token in text.split() if WORD_CHAR_RE.search(token)]
+        self.tokens += len(tokens)
+        self.words += sum(1 for token in tokens
+                          if MIN_WORD_CHARS <= len(token) <= MAX_WORD_CHARS and not GLUED_WORDS_RE.search(token))
+
+    def score(self) -> float:
+        if not self.tokens:
+            return 0.0
+        printable = 1 - self.bad_chars / self.chars
+        return round(printable * self.words / self.tokens, 3)
+
+
+def iter_engine_pages(file_data: bytes, engine: str) -> Iterator[str]:
+    """
+    Yield the text of each PDF page in order using one engine.
+
+    pdfplumber pages are closed as soon as their text is out, so only the
+    current page's layout objects are alive at any time.
+    """
+    if engine == ENGINE_PDFPLUMBER:
+        clock = Stopwatch(STAGE_PDFPLUMBER)
+        try:
+            with clock:
+                pdf = load_module('pdfplumber').open(io.BytesIO(file_data))
+            with pdf:
+                for page in pdf.pages:
+                    with clock:
+                        page_text = page.extract_text() or ""
+                        page.close()
+                    yield page_text
+        finally:
+            clock.record()
+    elif engine == ENGINE_PYPDF2:
+        clock = Stopwatch(STAGE_PYPDF2)
+        try:
+            with clock:
+                pages = load_module('PyPDF2').PdfReader(io.BytesIO(file_data)).pages
+            for page in pages:
+                with clock:
+                    page_text = page.extract_text() or ""
+                yield page_text
+        finally:
+            clock.record()
+    elif engine == ENGINE_OCR:
+        # Timed (STAGE_OCR) and cached inside ocr_extraction
+        yield from iter_ocr_pages(file_data)
+    else:
+        raise ValueError(f"Unknown PDF engine: {engine}")
+
+
+def has_contact_fields(profile: Dict[str, Any]) -> bool:
+    """True once name, email and phone have all been found."""
+    return all(profile.get(field) for field in CONTACT_FIELDS)
+
+
+def pdf_page_count(file_data: bytes) -> Optional[int]:
+    """
+    Number of pages from the PDF's page tree, without extracting any of them.
+
+    Returns:
+        Optional[int]: The page count, or None if PyPDF2 is missing or cannot read the file
+    """
+    if not PDF_AVAILABLE:
+        return None
+    try:
+        return len(load_module('PyPDF2').PdfReader(io.BytesIO(file_data)).pages)
+    except MemoryError:
+        raise
+    except Exception as e:
+        logger.debug(f"Could not count PDF pages: {e}")
+        return None
+
+
+def extract_pdf_text(file_data: bytes) -> str:
+    """Text of every PDF page from the engine cascade, joined once at the end."""
+    return scan_pdf_fields(file_data, keep_text=True).text
+
+
+def scan_pdf_fields(file_data: bytes, stop_when_complete: bool = False,
+                    keep_text: bool = False, engines: Sequence[str] = ENGINE_CASCADE) -> PageScan:
+    """
+    Extract PDF text with the cheapest engine that does a good job.
+
+    Each engine's pages are fed to a FieldScanner as they arrive and its
+    output is scored (see TextQuality). PyPDF2 runs first; pdfplumber only
+    runs when PyPDF2 fails or scores below QUALITY_THRESHOLD, and the
+    better-scoring result wins. If no engine finds any text the PDF is taken
+    to be scanned and its pages are OCR'd, when a local OCR engine is
+    installed.
+
+    A full scan first counts the pages and refuses PDFs longer than
+    MAX_PDF_PAGES; a contact scan never reads past that many pages.
+
+    Args:
+        file_data (bytes): Raw PDF content
+        stop_when_complete (bool): Stop reading once name, email and phone are found
+        keep_text (bool): Also return the text of the pages read
+        engines (Sequence[str]): Engines to try, in order
+
+    Returns:
+        PageScan: Extracted fields, pages read, whether any text was found,
+        the page text ('' unless keep_text), the engine used and its score
+
+    Raises:
+        DocumentTooLarge: If a full scan is asked for on a PDF over MAX_PDF_PAGES
+    """
+    if not stop_when_complete:
+        pages = pdf_page_count(file_data)
+        if pages is not None and pages > MAX_PDF_PAGES:
+            raise DocumentTooLarge(f"PDF has {pages} pages (max {MAX_PDF_PAGES})")
+
+    best = None
+    error = None
+
+    for index, engine in enumerate(engines):
+        if index:
+            PDF_FALLBACKS.inc()
+            logger.info(f"Escalating PDF extraction to {engine}")
+        try:
+            scan = _scan_engine(file_data, engine, stop_when_complete, keep_text)
+        except MemoryError:
+            # Not worth trying another engine; lets an extraction worker recycle itself
+            raise
+        except Exception as e:
+            logger.warning(f"{engine} failed: {e}")
+            error = e
+            continue
+
+        if best is None or scan.quality >= best.quality:
+            best = scan
+        if scan.quality >= QUALITY_THRESHOLD:
+            break
+
+    if best is None:
+        if error is not None:
+            raise error
+        raise Exception("No PDF processing libraries available")
+
+    if not best.has_text and OCR_AVAILABLE:
+        PDF_FALLBACKS.inc()
+        logger.info(f"No text layer found by {best.engine}, running OCR")
+        try:
+            best = _scan_engine(file_data, ENGINE_OCR, stop_when_complete, keep_text)
+        except MemoryError:
+            raise
+        except Exception as e:
+            logger.warning(f"OCR failed: {e}")
+
+    PDF_ENGINE_DOCUMENTS.inc(engine=best.engine)
+    return best
+
+
+def _scan_engine(file_data: bytes, engine: str, stop_when_complete: bool, keep_text: bool) -> PageScan:
+    """Run one engine over the pages, scanning fields and scoring as it goes."""
+    scanner = FieldScanner()
+    quality = TextQuality()
+    clock = Stopwatch(STAGE_FIELDS)
+    pages = []
+    pages_read = 0
+    has_text = False
+
+    for page_text in iter_engine_pages(file_data, engine):
+        pages_read += 1
+        has_text = has_text or bool(page_text.strip())
+        if keep_text:
+            pages.append(page_text)
+        with clock:
+            scanner.feed(page_text)
+            quality.feed(page_text)
+            complete = has_contact_fields(scanner.result())
+        if stop_when_complete and complete:
+            logger.info(f"Contact fields complete after {pages_read} page(s)")
+            break
+        if pages_read >= MAX_PDF_PAGES:
+            logger.warning(f"Stopped reading at the {MAX_PDF_PAGES}-page limit")
+            break
+
+    clock.record()
+    fields = scanner.result()
+    return PageScan(fields, pages_read, has_text, "\n".join(pages), engine, quality.score())
+
+
+def first_page_chars(file_data: bytes) -> Tuple[List[Dict[str, Any]], float]:
+    """
+    Characters of the first PDF page with their boxes and font sizes.
+
+    Reads pdfminer's LTChar objects directly (the same objects behind
+    pdfplumber's page.chars) without pdfplumber's per-character conversion,
+    and never parses past page one.
+
+    Returns:
+        Tuple[List[Dict[str, Any]], float]: Characters in content-stream
+        order (text, x0, x1, top, bottom, size; top measured from the top of
+        the page) and the page height
+    """
+    pdfpage = load_module('pdfminer.pdfpage')
+    pdfinterp = load_module('pdfminer.pdfinterp')
+    converter = load_module('pdfminer.converter')
+    layout = load_module('pdfminer.layout')
+
+    resources = pdfinterp.PDFResourceManager(caching=True)
+    device = converter.PDFPageAggregator(resources, laparams=None)
+    interpreter = pdfinterp.PDFPageInterpreter(resources, device)
+    for page in pdfpage.PDFPage.get_pages(io.BytesIO(file_data), maxpages=1):
+        interpreter.process_page(page)
+        result = device.get_result()
+        chars = [{"text": item.get_text(), "x0": item.x0, "x1": item.x1, "top": result.y1 - item.y1,
+                  "bottom": result.y1 - item.y0, "size": item.size}
+                 for item in result if isinstance(item, layout.LTChar)]
+        return chars, result.height
+    return [], 0.0
+
+
+def scan_pdf_layout(file_data: bytes, keep_text: bool = False) -> PageScan:
+    """
+    Read the contact block from the first page's character coordinates.
+
+    Only page one is interpreted, and columns are kept apart, so a sidebar
+    never ends up in the name line. Fields still missing afterwards (an
+    email on page two, an image-only first page) come from a contact-mode
+    scan_pdf_fields, whose engine is then reported.
+
+    Args:
+        file_data (bytes): Raw PDF content
+        keep_text (bool): Also return the first page's text, header block first
+
+    Returns:
+        PageScan: As scan_pdf_fields; engine is 'pdfminer-layout' when the
+        first page supplied every field
+    """
+    if not PDFMINER_AVAILABLE:
+        return scan_pdf_fields(file_data, stop_when_complete=True, keep_text=keep_text)
+
+    try:
+        with stage_timer(STAGE_LAYOUT):
+            chars, page_height = first_page_chars(file_data)
+            block = find_contact_block(chars_to_words(chars), page_height)
+    except MemoryError:
+        raise
+    except Exception as e:
+        logger.warning(f"Layout extraction failed, scanning text instead: {e}")
+        return scan_pdf_fields(file_data, stop_when_complete=True, keep_text=keep_text)
+
+    quality = TextQuality()
+    quality.feed(block.text)
+    if has_contact_fields(block.fields):
+        return PageScan(block.fields, 1, True, block.text if keep_text else '',
+                        ENGINE_LAYOUT, quality.score())
+
+    logger.info("Contact block incomplete on page 1, scanning text for the rest")
+    scan = scan_pdf_fields(file_data, stop_when_complete=True, keep_text=keep_text)
+    fields = {field: block.fields.get(field) or scan.fields.get(field) for field in CONTACT_FIELDS}
+    return scan._replace(fields=fields, has_text=scan.has_text or bool(block.text.strip()))
+
+
+def extract_docx_text(file_data: bytes) -> str:
+    """Text of every DOCX paragraph (headers, body, tables, text boxes, footers), joined once at the end."""
+    with stage_timer(STAGE_DOCX):
+        return "\n".join(iter_docx_paragraphs(file_data))
+
+
+def load_format_libraries(file_type: str) -> None:
+    """
+    Import the libraries a file type needs, if not already loaded.
+
+    Called in the serving process before extraction is handed to a worker,
+    so workers forked afterwards inherit the imported modules.
+    """
+    for name in FORMAT_MODULES.get(file_type, ()):
+        if module_available(name):
+            load_module(name)
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+Upload Decoding
+Reads the resume out of a /parse-resume request in any supported encoding:
+
+    1. application/json with a base64 `file` field (original contract)
+    2. multipart/form-data with a `file` part
+    3. A raw application/pdf or DOCX request body
+
+Binary uploads are read straight off the request stream into a single bytes
+buffer, which io.BytesIO wraps without copying for pdfplumber/PyPDF2.
+
+Size limits are enforced before memory is spent: a declared Content-Length
+over MAX_REQUEST_MB is refused before the body is read, bodies without one
+are read in chunks and refused as soon as they pass the limit, and a base64
+`file` whose decoded size would exceed MAX_FILE_MB is refused before it is
+decoded. Oversized uploads raise UploadTooLarge (HTTP 413). /parse-resumes
+bodies are held to MAX_BATCH_REQUEST_MB and each of their files to
+MAX_FILE_MB (see batch_parser).
+"""
+
+import os
+import json
+import base64
+import binascii
+from typing import Any, Dict, NamedTuple, Optional
+
+PDF_MIME = 'application/pdf'
+DOCX_MIME = 'application/vnd.openxmlformats-officedocument.wordprocessingml.document'
+
+EXTENSION_TYPES = {
+    '.pdf': PDF_MIME,
+    '.docx': DOCX_MIME
+}
+
+RAW_BODY_TYPES = (PDF_MIME, DOCX_MIME, 'application/octet-stream')
+
+MB = 1024 * 1024
+# Whole request body (base64 JSON is about 4/3 of the file) and the decoded file
+MAX_REQUEST_BYTES = int(float(os.environ.get('MAX_REQUEST_MB', 16)) * MB)
+MAX_FILE_BYTES = int(float(os.environ.get('MAX_FILE_MB', 10)) * MB)
+# A /parse-resumes body carries many base64 files
+MAX_BATCH_REQUEST_BYTES = int(float(os.environ.get('MAX_BATCH_REQUEST_MB', 64)) * MB)
+READ_CHUNK_BYTES = 64 * 1024
+# A multiple of 4, so every slice of unbroken base64 decodes on its own
+DECODE_CHUNK_CHARS = 256 * 1024
+
+
+class UploadError(ValueError):
+    """Raised when a request does not carry a usable file."""
+
+    status = 400
+
+
+class UploadTooLarge(UploadError):
+    """Raised when a request body or its file is over the configured size limit."""
+
+    status = 413
+
+
+class Upload(NamedTuple):
+    """A decoded upload ready for process_resume."""
+    file_data: bytes
+    file_type: str
+    filename: str
+    options: Dict[str, str]
+
+
+def guess_file_type(filename: str, declared: str = '') -> str:
+    """Prefer the declared MIME type, falling back to the file extension."""
+    if declared and declared != 'application/octet-stream':
+        return declared
+    for extension, mime_type in EXTENSION_TYPES.items():
+        if filename.lower().endswith(extension):
+            return mime_type
+    return declared
+
+
+def read_upload(request) -> Upload:
+    """
+    Decode the file carried by a Flask request.
+
+    Args:
+        request: The active Flask request
+
+    Returns:
+        Upload: File bytes, MIME type, filename and per-request options
+
+    Raises:
+        UploadError: If the request carries no file
+        UploadTooLarge: If the body or the file is over its size limit
+    """
+    mimetype = request.mimetype
+    options = request.args.to_dict()
+    check_content_length(request.content_length)
+
+    if mimetype == 'multipart/form-data':
+        storage = request.files.get('file')
+        if storage is None:
+            raise UploadError("No file provided")
+        filename = request.form.get('filename') or storage.filename or 'unknown'
+        file_type = guess_file_type(filename, request.form.get('type') or storage.mimetype)
+        options.update(request.form.to_dict())
+        return Upload(read_limited(storage.stream, MAX_FILE_BYTES, "File"), file_type, filename, options)
+
+    if mimetype in RAW_BODY_TYPES:
+        filename = request.headers.get('X-Filename') or request.args.get('filename', 'unknown')
+        file_data = read_limited(request.stream, min(MAX_REQUEST_BYTES, MAX_FILE_BYTES), "File",
+                                 request.content_length)
+        if not file_data:
+            raise UploadError("No file provided")
+        return Upload(file_data, guess_file_type(filename, mimetype), filename, options)
+
+    if not request.is_json:
+        raise UploadError("No file provided")
+    data = read_json(request)
+    if not isinstance(data, dict) or 'file' not in data:
+        raise UploadError("No file provided")
+
+    options.update({k: v for k, v in data.items() if k != 'file' and isinstance(v, str)})
+    return Upload(
+        decode_base64(data.pop('file'), MAX_FILE_BYTES),
+        data.get('type', ''),
+        data.get('filename', 'unknown'),
+        options
+    )
+
+
+def read_json(request, limit: int = MAX_REQUEST_BYTES) -> Any:
+    """
+    Read and parse a JSON request body of at most `limit` bytes.
+
+    Returns:
+        Any: The parsed body, or None if it is empty or not valid JSON
+
+    Raises:
+        UploadTooLarge: If the body is over the limit
+    """
+    body = read_limited(request.stream, limit, "Request body", request.content_length)
+    # Drop each copy of the body as soon as the next exists, so at most two are alive at once
+    try:
+        text = body.decode('utf-8')
+        del body
+        return json.loads(text) if text else None
+    except ValueError:
+        return None
+
+
+def check_content_length(content_length: Optional[int], limit: int = MAX_REQUEST_BYTES) -> None:
+    """Refuse a declared body size over the limit before any of it is read."""
+    if content_length is not None and content_length > limit:
+        raise UploadTooLarge(f"Request body is {content_length / MB:.1f} MB (max {limit / MB:g} MB)")
+
+
+def read_limited(stream, limit: int, what: str, content_length: Optional[int] = None) -> bytes:
+    """
+    Read a stream to the end, refusing it once more than `limit` bytes arrive.
+
+    With a known length the body is read in one call into one buffer;
+    otherwise it is read in chunks and the limit is checked as each arrives.
+
+    Raises:
+        UploadTooLarge: If the stream holds more than `limit` bytes
+    """
+    if content_length is not None:
+        check_content_length(content_length, limit)
+        return stream.read(content_length)
+
+    chunks = []
+    total = 0
+    while True:
+        chunk = stream.read(READ_CHUNK_BYTES)
+        if not chunk:
+            break
+        total += len(chunk)
+        if total > limit:
+            raise UploadTooLarge(f"{what} is over {limit / MB:g} MB")
+        chunks.append(chunk)
+    return b''.join(chunks)
+
+
+def decode_base64(encoded, limit: int = MAX_FILE_BYTES) -> bytes:
+    """
+    Decode a base64 file, refusing it from its length alone if the result would be over `limit`.
+
+    Raises:
+        UploadError: If the value is not a base64 string
+        UploadTooLarge: If the decoded file would be over the limit
+    """
+    if not isinstance(encoded, (str, bytes)):
+        raise UploadError("file must be a base64 string")
+    # 4 characters per 3 bytes; line breaks (MIME-style base64) carry no data
+    decoded_size = len(encoded) * 3 // 4
+    if decoded_size > limit:
+        newline, carriage_return = ('\n', '\r') if isinstance(encoded, str) else (b'\n', b'\r')
+        breaks = encoded.count(newline) + encoded.count(carriage_return)
+        decoded_size = (len(encoded) - breaks) * 3 // 4
+    if decoded_size > limit:
+        raise UploadTooLarge(f"File is {decoded_size / MB:.1f} MB (max {limit / MB:g} MB)")
+    if isinstance(encoded, str) and ('\n' in encoded or '\r' in encoded):
+        # MIME-style line breaks would shift the slices off 4-character boundaries
+        encoded = encoded.replace('\r', '').replace('\n', '')
+    try:
+        return _decode_slices(encoded)
+    except (binascii.Error, ValueError):
+        pass
+    try:
+        # Other whitespace or stray padding: let b64decode discard it in one pass
+        return base64.b64decode(encoded)
+    except (binascii.Error, ValueError) as e:
+        raise UploadError(f"Invalid base64 file: {e}") from e
+
+
+def _decode_slices(encoded) -> bytes:
+    """
+    Decode unbroken base64 a slice at a time instead of copying the whole
+    string to ASCII bytes first. A slice that does not hold whole 4-character
+    groups fails to decode, so misaligned input raises rather than decoding wrongly.
+    """
+    if not isinstance(encoded, str) or len(encoded) % 4:
+        raise ValueError("not unbroken base64")
+    return b''.join(base64.b64decode(encoded[start:start + DECODE_CHUNK_CHARS])
+                    for start in range(0, len(encoded), DECODE_CHUNK_CHARS))